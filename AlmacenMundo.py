@@ -0,0 +1,338 @@
+import math
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class AlmacenMundo:
+    """Almacén del estado del mundo en arreglos contiguos (estructura de arreglos).
+
+    Cada organismo agregado ocupa una fila en columnas NumPy de posición,
+    dirección, velocidad, energía, especie y estado vital. Los objetos
+    Organismo quedan como vistas livianas sobre su fila, lo que permite
+    aplicar reglas a toda la población con pocas operaciones vectorizadas.
+    Las filas solo cambian cuando `compactar()` libera las de los muertos.
+
+    Attributes:
+        n (int): Cantidad de filas ocupadas.
+        x (np.ndarray): Coordenada x de cada organismo.
+        y (np.ndarray): Coordenada y de cada organismo.
+        direccion (np.ndarray): Dirección de movimiento en radianes.
+        coseno (np.ndarray): Coseno de la dirección, al día con `direccion`.
+        seno (np.ndarray): Seno de la dirección, al día con `direccion`.
+        velocidad (np.ndarray): Velocidad de movimiento.
+        energia (np.ndarray): Nivel de energía.
+        especie (np.ndarray): Código de especie (índice en `especies`).
+        vivo (np.ndarray): Estado vital.
+        movil (np.ndarray): True para animales, False para plantas.
+        tiempo_reproduccion (np.ndarray): Ticks desde la última reproducción.
+        tiempo_minimo_reproduccion (np.ndarray): Ticks necesarios para reproducirse.
+        energia_minima_reproduccion (np.ndarray): Energía necesaria para reproducirse.
+        listo (np.ndarray): Disponibilidad para reproducirse vista en el
+            último `actualizar_reproduccion`.
+        especies (List[str]): Nombres de especie por código.
+        entidades (List[Organismo]): Objeto dueño de cada fila.
+        rng (np.random.Generator): Generador aleatorio del movimiento.
+    """
+
+    ENERGIA_MINIMA_MOVIMIENTO = 10
+    PROBABILIDAD_GIRO = 0.1
+    COSTO_ENERGIA_MOVIMIENTO = 0.1
+
+    _COLUMNAS = ('x', 'y', 'direccion', 'coseno', 'seno', 'velocidad', 'energia', 'especie',
+                 'vivo', 'movil',
+                 'tiempo_reproduccion', 'tiempo_minimo_reproduccion',
+                 'energia_minima_reproduccion', 'listo')
+
+    def __init__(self, capacidad: int = 1024, semilla: Optional[int] = None):
+        """Inicializa un almacén vacío.
+
+        Args:
+            capacidad (int, optional): Filas reservadas inicialmente.
+            semilla (Optional[int], optional): Semilla del generador aleatorio.
+        """
+        self.n = 0
+        self._capacidad = max(1, capacidad)
+        self.x = np.zeros(self._capacidad, dtype=np.float64)
+        self.y = np.zeros(self._capacidad, dtype=np.float64)
+        self.direccion = np.zeros(self._capacidad, dtype=np.float64)
+        self.coseno = np.zeros(self._capacidad, dtype=np.float64)
+        self.seno = np.zeros(self._capacidad, dtype=np.float64)
+        self.velocidad = np.zeros(self._capacidad, dtype=np.float64)
+        self.energia = np.zeros(self._capacidad, dtype=np.float64)
+        self.especie = np.zeros(self._capacidad, dtype=np.int16)
+        self.vivo = np.zeros(self._capacidad, dtype=bool)
+        self.movil = np.zeros(self._capacidad, dtype=bool)
+        self.tiempo_reproduccion = np.zeros(self._capacidad, dtype=np.int32)
+        self.tiempo_minimo_reproduccion = np.zeros(self._capacidad, dtype=np.int32)
+        self.energia_minima_reproduccion = np.zeros(self._capacidad, dtype=np.float64)
+        self.listo = np.zeros(self._capacidad, dtype=bool)
+        self.especies: List[str] = []
+        self._codigos: Dict[str, int] = {}
+        self.entidades: List[object] = []
+        self.rng = np.random.default_rng(semilla)
+
+    def _crecer(self):
+        """Duplica la capacidad de todas las columnas."""
+        self._capacidad *= 2
+        for nombre in self._COLUMNAS:
+            anterior = getattr(self, nombre)
+            nueva = np.zeros(self._capacidad, dtype=anterior.dtype)
+            nueva[:self.n] = anterior[:self.n]
+            setattr(self, nombre, nueva)
+
+    def codigo_especie(self, nombre: str) -> int:
+        """Obtiene (o registra) el código numérico de una especie.
+
+        Args:
+            nombre (str): Nombre de la clase de la especie.
+
+        Returns:
+            int: Código de la especie.
+        """
+        codigo = self._codigos.get(nombre)
+        if codigo is None:
+            codigo = len(self.especies)
+            self.especies.append(nombre)
+            self._codigos[nombre] = codigo
+        return codigo
+
+    def agregar(self, entidad) -> int:
+        """Copia el estado de un organismo a una fila nueva y lo convierte en vista.
+
+        Args:
+            entidad (Organismo): Organismo a almacenar.
+
+        Returns:
+            int: Índice de la fila asignada.
+        """
+        if self.n == self._capacidad:
+            self._crecer()
+        i = self.n
+        self.x[i], self.y[i] = entidad.ubicacion
+        self.energia[i] = entidad.nivel_energia
+        self.vivo[i] = entidad.estar_vivo
+        self.especie[i] = self.codigo_especie(entidad.__class__.__name__)
+        self.movil[i] = hasattr(entidad, 'moverse')
+        if self.movil[i]:
+            self.fijar_direccion(i, entidad.direccion)
+            self.velocidad[i] = entidad.velocidad
+            self.tiempo_reproduccion[i] = entidad.tiempo_reproduccion
+            self.tiempo_minimo_reproduccion[i] = entidad.TIEMPO_MINIMO_REPRODUCCION
+            self.energia_minima_reproduccion[i] = entidad.ENERGIA_MINIMA_REPRODUCCION
+        self.listo[i] = False
+        self.entidades.append(entidad)
+        self.n += 1
+
+        entidad._vincular(self, i)
+        return i
+
+    def fijar_direccion(self, i: int, direccion: float):
+        """Cambia la dirección de una fila junto con su coseno y seno.
+
+        Args:
+            i (int): Fila a modificar.
+            direccion (float): Nueva dirección en radianes.
+        """
+        self.direccion[i] = direccion
+        self.coseno[i] = math.cos(direccion)
+        self.seno[i] = math.sin(direccion)
+
+    def compactar(self) -> np.ndarray:
+        """Libera las filas de los organismos muertos corriendo las vivas al principio.
+
+        Las filas vivas conservan su orden. Los organismos muertos dejan de
+        ser vistas y guardan sus últimos valores como atributos locales; los
+        vivos se vuelven a vincular a su fila nueva.
+
+        Returns:
+            np.ndarray: Fila nueva de cada fila anterior, o -1 si se liberó.
+        """
+        n = self.n
+        vivas = np.flatnonzero(self.vivo[:n])
+        remapeo = np.full(n, -1, dtype=np.intp)
+        remapeo[vivas] = np.arange(vivas.size)
+        if vivas.size == n:
+            return remapeo
+
+        muertas = np.flatnonzero(~self.vivo[:n])
+        entidades = self.entidades
+        for i in muertas.tolist():
+            entidades[i]._desvincular()
+        for nombre in self._COLUMNAS:
+            columna = getattr(self, nombre)
+            columna[:vivas.size] = columna[vivas]
+        self.vivo[vivas.size:n] = False
+        self.entidades = [entidades[i] for i in vivas.tolist()]
+        self.n = vivas.size
+
+        # Las filas anteriores a la primera liberada no cambian
+        for i in range(int(muertas[0]), self.n):
+            self.entidades[i]._vincular(self, i)
+        return remapeo
+
+    def ubicacion(self, i: int) -> Tuple[float, float]:
+        """Obtiene la posición de una fila como tupla de floats."""
+        return (float(self.x[i]), float(self.y[i]))
+
+    def mover_todos(self, ancho: float, alto: float):
+        """Mueve a todos los animales vivos con energía suficiente en un solo paso.
+
+        Aplica la misma regla que `Animal.moverse`: giro aleatorio con
+        probabilidad 0.1, avance según dirección y velocidad, rebote en los
+        límites y costo de energía, pero sobre toda la población a la vez.
+        El coseno y el seno solo se recalculan en las filas que cambian de
+        dirección.
+
+        Args:
+            ancho (float): Ancho máximo del área de movimiento.
+            alto (float): Alto máximo del área de movimiento.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Índices movidos y sus
+                coordenadas x, y anteriores.
+        """
+        n = self.n
+        x = self.x[:n]
+        y = self.y[:n]
+        direccion = self.direccion[:n]
+        energia = self.energia[:n]
+        activos = self.vivo[:n] & self.movil[:n] & (energia >= self.ENERGIA_MINIMA_MOVIMIENTO)
+        movidos = np.flatnonzero(activos)
+        x_anterior = x[movidos]
+        y_anterior = y[movidos]
+
+        # Posibilidad de cambiar dirección
+        giro = np.flatnonzero(activos & (self.rng.random(n) < self.PROBABILIDAD_GIRO))
+        direccion[giro] += self.rng.uniform(-math.pi / 4, math.pi / 4, giro.size)
+        self._actualizar_trigonometria(giro)
+
+        # Calcular nueva posición (los inactivos avanzan cero)
+        paso = self.velocidad[:n] * activos
+        x += self.coseno[:n] * paso
+        y += self.seno[:n] * paso
+
+        # Verificar límites y rebotar si es necesario
+        fuera_x = np.flatnonzero(activos & ((x < 0) | (x > ancho)))
+        direccion[fuera_x] = math.pi - direccion[fuera_x]
+        x[fuera_x] = np.clip(x[fuera_x], 0, ancho)
+        self._actualizar_trigonometria(fuera_x)
+
+        fuera_y = np.flatnonzero(activos & ((y < 0) | (y > alto)))
+        direccion[fuera_y] = -direccion[fuera_y]
+        y[fuera_y] = np.clip(y[fuera_y], 0, alto)
+        self._actualizar_trigonometria(fuera_y)
+
+        # Consumir energía por movimiento
+        energia -= self.COSTO_ENERGIA_MOVIMIENTO * activos
+        agotados = np.flatnonzero(activos & (energia < 0))
+        energia[agotados] = 0
+
+        return movidos, x_anterior, y_anterior
+
+    def _actualizar_trigonometria(self, filas: np.ndarray):
+        """Recalcula el coseno y el seno de las filas que cambiaron de dirección."""
+        if filas.size:
+            direccion = self.direccion[filas]
+            self.coseno[filas] = np.cos(direccion)
+            self.seno[filas] = np.sin(direccion)
+
+    @staticmethod
+    def contar_en_celdas(x: np.ndarray, y: np.ndarray, x_min: float, y_min: float,
+                         x_max: float, y_max: float, columnas: int, filas: int,
+                         grupo: Optional[np.ndarray] = None, cantidad_grupos: int = 1,
+                         validos: Optional[np.ndarray] = None) -> np.ndarray:
+        """Cuenta puntos en cada celda de una grilla sobre un rectángulo.
+
+        Los puntos fuera del rectángulo se ignoran. Todos los grupos se
+        cuentan con un solo `np.bincount`.
+
+        Args:
+            x (np.ndarray): Coordenada x de cada punto.
+            y (np.ndarray): Coordenada y de cada punto.
+            x_min (float): Borde izquierdo, incluido.
+            y_min (float): Borde superior, incluido.
+            x_max (float): Borde derecho, excluido.
+            y_max (float): Borde inferior, excluido.
+            columnas (int): Celdas a lo ancho.
+            filas (int): Celdas a lo alto.
+            grupo (Optional[np.ndarray], optional): Grupo de cada punto, entre
+                0 y cantidad_grupos - 1; si se indica, cada grupo se cuenta
+                por separado.
+            cantidad_grupos (int, optional): Cantidad de grupos.
+            validos (Optional[np.ndarray], optional): Máscara de los puntos a contar.
+
+        Returns:
+            np.ndarray: Matriz (filas, columnas) con la cantidad por celda,
+                o (cantidad_grupos, filas, columnas) si se indica el grupo.
+        """
+        dentro = (x >= x_min) & (x < x_max) & (y >= y_min) & (y < y_max)
+        if validos is not None:
+            dentro &= validos
+        cx = ((x[dentro] - x_min) * (columnas / (x_max - x_min))).astype(np.intp)
+        cy = ((y[dentro] - y_min) * (filas / (y_max - y_min))).astype(np.intp)
+        # Redondeos en el borde derecho o inferior
+        np.minimum(cx, columnas - 1, out=cx)
+        np.minimum(cy, filas - 1, out=cy)
+        celdas = cy * columnas + cx
+        if grupo is None:
+            return np.bincount(celdas, minlength=filas * columnas).reshape(filas, columnas)
+
+        celdas += grupo[dentro].astype(np.intp) * (filas * columnas)
+        return np.bincount(celdas, minlength=cantidad_grupos * filas * columnas).reshape(
+            cantidad_grupos, filas, columnas)
+
+    def densidad(self, x_min: float, y_min: float, x_max: float, y_max: float,
+                 columnas: int, filas: int, grupos: Optional[np.ndarray] = None,
+                 cantidad_grupos: Optional[int] = None) -> np.ndarray:
+        """Cuenta los organismos vivos en cada celda de una grilla sobre un rectángulo.
+
+        Args:
+            x_min (float): Borde izquierdo, incluido.
+            y_min (float): Borde superior, incluido.
+            x_max (float): Borde derecho, excluido.
+            y_max (float): Borde inferior, excluido.
+            columnas (int): Celdas a lo ancho.
+            filas (int): Celdas a lo alto.
+            grupos (Optional[np.ndarray], optional): Grupo de cada código de
+                especie; si se indica, cada grupo se cuenta por separado.
+            cantidad_grupos (Optional[int], optional): Cantidad de grupos. Por
+                defecto el mayor grupo más uno.
+
+        Returns:
+            np.ndarray: Matriz (filas, columnas) con la cantidad por celda,
+                o (grupos, filas, columnas) si se indican grupos.
+        """
+        n = self.n
+        grupo = None
+        if grupos is not None:
+            if cantidad_grupos is None:
+                cantidad_grupos = int(grupos.max()) + 1 if grupos.size else 1
+            grupo = grupos[self.especie[:n]] if grupos.size else np.zeros(n, dtype=np.intp)
+        return self.contar_en_celdas(self.x[:n], self.y[:n], x_min, y_min, x_max, y_max,
+                                     columnas, filas, grupo, cantidad_grupos or 1, self.vivo[:n])
+
+    def actualizar_reproduccion(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Avanza el tiempo de reproducción y detecta cambios de disponibilidad.
+
+        Suma un tick al contador de cada animal vivo y compara quiénes están
+        listos para reproducirse (tiempo y energía suficientes) con lo visto
+        en la llamada anterior.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Índices que pasaron a estar listos
+                e índices que dejaron de estarlo.
+        """
+        n = self.n
+        vivos = self.vivo[:n] & self.movil[:n]
+        tiempo = self.tiempo_reproduccion[:n]
+        tiempo += vivos
+
+        listo = (vivos &
+                 (tiempo >= self.tiempo_minimo_reproduccion[:n]) &
+                 (self.energia[:n] >= self.energia_minima_reproduccion[:n]))
+        cambio = listo != self.listo[:n]
+        nuevos = np.flatnonzero(cambio & listo)
+        retirados = np.flatnonzero(cambio & ~listo)
+        self.listo[:n] = listo
+        return nuevos, retirados
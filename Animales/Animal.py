@@ -14,6 +14,21 @@ class Animal(Organismo):
     COSTO_ENERGIA_REPRODUCCION = 20
     DISTANCIA_REPRODUCCION = 70
     PROBABILIDAD_REPRODUCCION = 0.4
+    TIEMPOS_MINIMOS_REPRODUCCION = {
+        'Leon': 700,
+        'Aguila_real': 600,
+        'Conejo': 400,
+        'Ciervo': 500
+    }
+
+    __slots__ = ('_especie', '_velocidad', '_direccion', '_tiempo_reproduccion')
+
+    _COLUMNAS_MUNDO = {
+        **Organismo._COLUMNAS_MUNDO,
+        '_velocidad': 'velocidad',
+        '_direccion': 'direccion',
+        '_tiempo_reproduccion': 'tiempo_reproduccion',
+    }
 
     def __init__(self, especie, nivelEnergia, velocidad, ubicacion):
         super().__init__(
@@ -27,36 +42,63 @@ class Animal(Organismo):
         self._velocidad = velocidad
         self._direccion = random.uniform(0, 2 * math.pi)
         self._tiempo_reproduccion = 0
-        self.TIEMPO_MINIMO_REPRODUCCION = {
-            'Leon': 700,
-            'Aguila_real': 600,
-            'Conejo': 400,
-            'Ciervo': 500
-        }.get(especie, 500)
 
     @property
     def especie(self):
         return self._especie
 
+    @property
+    def TIEMPO_MINIMO_REPRODUCCION(self):
+        return self.TIEMPOS_MINIMOS_REPRODUCCION.get(self._especie, 500)
+
     @property
     def velocidad(self):
+        if self._mundo is not None:
+            return float(self._mundo.velocidad[self._indice])
         return self._velocidad
 
     @property
     def direccion(self):
+        if self._mundo is not None:
+            return float(self._mundo.direccion[self._indice])
         return self._direccion
 
+    @property
+    def tiempo_reproduccion(self):
+        if self._mundo is not None:
+            return int(self._mundo.tiempo_reproduccion[self._indice])
+        return self._tiempo_reproduccion
+
+    @property
+    def listo_para_reproducirse(self) -> bool:
+        """bool: True si cumplió el tiempo mínimo y tiene energía suficiente."""
+        return (self.tiempo_reproduccion >= self.TIEMPO_MINIMO_REPRODUCCION and
+                self.nivel_energia >= self.ENERGIA_MINIMA_REPRODUCCION)
+
     @especie.setter
     def especie(self, especie):
         self._especie = especie
 
     @velocidad.setter
     def velocidad(self, velocidad):
-        self._velocidad = velocidad
+        if self._mundo is not None:
+            self._mundo.velocidad[self._indice] = velocidad
+        else:
+            self._velocidad = velocidad
+
+    @tiempo_reproduccion.setter
+    def tiempo_reproduccion(self, tiempo):
+        if self._mundo is not None:
+            self._mundo.tiempo_reproduccion[self._indice] = tiempo
+        else:
+            self._tiempo_reproduccion = tiempo
 
     @direccion.setter
     def direccion(self, direccion):
-        self._direccion = direccion
+        if self._mundo is not None:
+            self._mundo.fijar_direccion(self._indice, direccion)
+        else:
+            self._direccion = direccion
 
     def alimentarse(self, presa: Optional['Animal'] = None):
         """
@@ -111,20 +153,30 @@ class Animal(Organismo):
         Intenta reproducirse con otro animal de la misma especie si se cumplen las condiciones.
         """
         # Incrementar contador de tiempo
-        self._tiempo_reproduccion += 1
+        self.tiempo_reproduccion += 1
+        return self.intentar_reproduccion(otros_animales)
 
+    def intentar_reproduccion(self, candidatos: List['Animal']) -> Optional['Animal']:
+        """
+        Busca pareja entre los candidatos sin avanzar el contador de tiempo.
+
+        Args:
+            candidatos: Animales a considerar como pareja. Pueden ser todos
+                los animales o solo los listos y cercanos.
+
+        Returns:
+            Optional[Animal]: La cría nacida, o None si no hubo reproducción.
+        """
         # Verificar condiciones básicas
-        if (self._tiempo_reproduccion < self.TIEMPO_MINIMO_REPRODUCCION or
-                self.nivel_energia < self.ENERGIA_MINIMA_REPRODUCCION):
+        if not self.listo_para_reproducirse:
             return None
 
         # Buscar pareja compatible
-        for otro_animal in otros_animales:
+        for otro_animal in candidatos:
             if (otro_animal != self and
                     type(otro_animal) == type(self) and
                     otro_animal.estar_vivo and
-                    otro_animal.nivel_energia >= self.ENERGIA_MINIMA_REPRODUCCION and
-                    otro_animal._tiempo_reproduccion >= otro_animal.TIEMPO_MINIMO_REPRODUCCION):
+                    otro_animal.listo_para_reproducirse):
 
                 # Calcular distancia
                 dx = self.ubicacion[0] - otro_animal.ubicacion[0]
@@ -148,8 +200,8 @@ class Animal(Organismo):
                         otro_animal.nivel_energia -= self.COSTO_ENERGIA_REPRODUCCION
 
                         # Reiniciar contadores
-                        self._tiempo_reproduccion = 0
-                        otro_animal._tiempo_reproduccion = 0
+                        self.tiempo_reproduccion = 0
+                        otro_animal.tiempo_reproduccion = 0
 
                         return nuevo_animal
 
@@ -195,13 +247,15 @@ class Animal(Organismo):
             Tuple[float, float]: Nueva posición (x, y) del animal
         """
         if self.nivel_energia >= self.ENERGIA_MINIMA_MOVIMIENTO:
+            direccion = self.direccion
+
             # Posibilidad de cambiar dirección
             if random.random() < 0.1:
-                self._direccion += random.uniform(-math.pi/4, math.pi/4)
+                direccion += random.uniform(-math.pi/4, math.pi/4)
 
             # Calcular nuevo movimiento
-            dx = math.cos(self._direccion) * self._velocidad
-            dy = math.sin(self._direccion) * self._velocidad
+            dx = math.cos(direccion) * self.velocidad
+            dy = math.sin(direccion) * self.velocidad
 
             # Obtener nueva posición
             nuevo_x = self.ubicacion[0] + dx
@@ -209,14 +263,15 @@ class Animal(Organismo):
 
             # Verificar límites y rebotar si es necesario
             if nuevo_x < 0 or nuevo_x > ancho_limite:
-                self._direccion = math.pi - self._direccion
+                direccion = math.pi - direccion
                 nuevo_x = max(0, min(ancho_limite, nuevo_x))
 
             if nuevo_y < 0 or nuevo_y > alto_limite:
-                self._direccion = -self._direccion
+                direccion = -direccion
                 nuevo_y = max(0, min(alto_limite, nuevo_y))
 
-            # Actualizar posición
+            # Actualizar posición y dirección
+            self.direccion = direccion
             self.ubicacion = (nuevo_x, nuevo_y)
 
             # Consumir energía por movimiento
@@ -6,10 +6,13 @@ from Animales.Herbivoros.Conejo import Conejo
 
 
 class Aguila_real(Animal, Volador, Carnivoro):
+    rango_caza = 120
+
+    __slots__ = ('tiempo_entre_caza',)
+
     def __init__(self, especie, nivelEnergia, velocidad, ubicacion):
         Animal.__init__(self, especie, nivelEnergia, velocidad, ubicacion)
         Carnivoro.__init__(self)
-        self.rango_caza = 120
 
     def _calcular_probabilidad_caza(self, presa: 'Animal'):
         """Calcula la probabilidad de caza exitosa para el águila"""
@@ -6,11 +6,16 @@ import random
 class Carnivoro(ABC):
     """Clase base para animales carnívoros"""
 
+    rango_caza = 80  # Rango de caza por defecto
+    TIEMPO_MINIMO_ENTRE_CAZA = 50
+    ENERGIA_CAZA = 10  # Energía que gasta al cazar
+    ENERGIA_POR_PRESA = {'Conejo': 30, 'Ciervo': 50}  # Energía ganada según la especie de presa
+
+    # Las especies concretas declaran el slot 'tiempo_entre_caza'
+    __slots__ = ()
+
     def __init__(self):
         self.tiempo_entre_caza = 0
-        self.TIEMPO_MINIMO_ENTRE_CAZA = 50
-        self.rango_caza = 80  # Rango de caza por defecto
-        self.ENERGIA_CAZA = 10  # Energía que gasta al cazar
 
     def puede_cazar(self):
         """Verifica si el animal puede realizar una caza"""
@@ -9,11 +9,14 @@ from Decoradores.Decoradores import aumentar_velocidad
 
 @aumentar_velocidad(incremento=50)  # Aumenta la velocidad en un 50%
 class Leon(Animal, Carnivoro):
+    rango_caza = 80  # Radio en el que puede detectar presas
+    fuerza_ataque = 70  # Determina la probabilidad de éxito en la caza
+
+    __slots__ = ('tiempo_entre_caza',)
+
     def __init__(self, especie, nivelEnergia, velocidad, ubicacion):
         super().__init__(especie, nivelEnergia, velocidad, ubicacion)
         Carnivoro.__init__(self)
-        self.rango_caza = 80  # Radio en el que puede detectar presas
-        self.fuerza_ataque = 70  # Determina la probabilidad de éxito en la caza
 
     def _calcular_probabilidad_caza(self, presa: 'Animal'):
         """Calcula la probabilidad de caza exitosa para el león"""
@@ -3,5 +3,7 @@ from Animales.Habilidades.Nadador import Nadador
 from Animales.Habilidades.Volador import Volador
 
 class Pato(Animal, Nadador, Volador):
+    __slots__ = ()
+
     def __init__(self, especie, nivelEnergia, velocidad, ubicacion):
         super().__init__(especie, nivelEnergia, velocidad, ubicacion)
\ No newline at end of file
@@ -2,6 +2,7 @@ from abc import ABC
 
 
 class Nadador(ABC):
+    __slots__ = ()
 
     def nadar(self):
         print("Animal nadando")
\ No newline at end of file
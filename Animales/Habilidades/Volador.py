@@ -1,5 +1,6 @@
 
 class Volador():
+    __slots__ = ()
 
     def volar(self):
         print("Animal volando")
\ No newline at end of file
@@ -3,6 +3,8 @@ from Animales.Habilidades.Nadador import Nadador
 
 
 class Capibara(Animal, Nadador):
+    __slots__ = ()
+
     def __init__(self, especie, nivelEnergia, velocidad, ubicacion):
         super().__init__(especie, nivelEnergia, velocidad, ubicacion)
 
@@ -1,6 +1,8 @@
 from Animales.Animal import Animal
 
 class Conejo(Animal):
+    __slots__ = ()
+
     def __init__(self, especie, nivelEnergia, velocidad, ubicacion):
         super().__init__(especie, nivelEnergia, velocidad, ubicacion)
 
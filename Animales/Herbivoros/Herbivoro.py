@@ -5,26 +5,37 @@ class Herbivoro(ABC):
     ENERGIA_POR_FRUTO = 15  # Energía ganada por cada fruto consumido
     DISTANCIA_ALIMENTACION = 30  # Distancia máxima para alimentarse de una planta
 
+    __slots__ = ()
+
     @abstractmethod
     def huir(self):
         pass
 
-    def buscar_planta_cercana(self, plantas: list, pos_actual: tuple):
+    def buscar_planta_cercana(self, plantas: list = None, pos_actual: tuple = None):
         """
-        Busca la planta frutal más cercana al herbívoro.
+        Busca la planta frutal con frutos más cercana al herbívoro.
+
+        Si el herbívoro pertenece a un ecosistema se consulta su tabla de
+        plantas precalculada en O(1); si no, se recorre la lista recibida.
 
         Args:
-            plantas: Lista de plantas en el ecosistema
+            plantas: Lista de plantas en el ecosistema (solo sin ecosistema)
             pos_actual: Posición actual del herbívoro (x, y)
 
         Returns:
             Tuple[Planta, float]: La planta más cercana y la distancia a ella
         """
+        if pos_actual is None:
+            pos_actual = self.ubicacion
+
+        if getattr(self, 'ecosistema', None) is not None:
+            return self.ecosistema.planta_cercana(pos_actual)
+
         planta_cercana = None
         menor_distancia = float('inf')
 
-        for planta in plantas:
-            if not planta.estar_vivo:
+        for planta in plantas or []:
+            if not planta.estar_vivo or getattr(planta, 'frutos', 0) <= 0:
                 continue
 
             dx = pos_actual[0] - planta.ubicacion[0]
@@ -1,5 +1,7 @@
 from Animales.Animal import Animal
 
 class Tapir(Animal):
+    __slots__ = ()
+
     def __init__(self, especie, nivelEnergia, velocidad, ubicacion):
         super().__init__(especie, nivelEnergia, velocidad, ubicacion)
\ No newline at end of file
@@ -0,0 +1,181 @@
+import threading
+import time
+from collections import deque
+from queue import Empty
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class ColaEventos:
+    """Cola de eventos del ecosistema que fusiona eventos redundantes.
+
+    Los eventos cuyo tipo está en `tipos_fusionables` se identifican por la
+    clave (origen, tipo). Si ya hay un evento pendiente con la misma clave,
+    el nuevo lo reemplaza en su lugar de la cola en vez de agregarse al
+    final, así un consumidor lento no acumula movimientos viejos de un
+    mismo animal. Ofrece la misma interfaz que `queue.Queue` para poner y
+    sacar eventos.
+
+    Attributes:
+        tipos_fusionables (frozenset): Tipos de evento que se fusionan.
+        encolados (int): Eventos recibidos con `put`.
+        fusionados (int): Eventos que reemplazaron a uno pendiente.
+    """
+
+    TIPOS_FUSIONABLES = ('mover', 'generar_frutos', 'absorber_agua')
+
+    def __init__(self, tipos_fusionables: Optional[Tuple[str, ...]] = None):
+        """Inicializa una cola vacía.
+
+        Args:
+            tipos_fusionables (Optional[Tuple[str, ...]], optional): Tipos de
+                evento a fusionar. Por defecto TIPOS_FUSIONABLES.
+        """
+        if tipos_fusionables is None:
+            tipos_fusionables = self.TIPOS_FUSIONABLES
+        self.tipos_fusionables = frozenset(tipos_fusionables)
+        self.encolados = 0
+        self.fusionados = 0
+
+        # Cada elemento es una celda [evento] para poder reemplazarlo en su lugar
+        self._cola: deque = deque()
+        self._pendientes: Dict[Tuple[int, str], list] = {}
+        self._condicion = threading.Condition()
+
+    def _clave(self, evento) -> Optional[Tuple[int, str]]:
+        """Obtiene la clave de fusión de un evento, o None si no se fusiona."""
+        if evento.tipo in self.tipos_fusionables:
+            return (id(evento.origen), evento.tipo)
+        return None
+
+    def put(self, evento, block: bool = True, timeout: Optional[float] = None):
+        """Agrega un evento, reemplazando al pendiente con la misma clave.
+
+        Args:
+            evento (EventoEcosistema): Evento a agregar.
+            block (bool, optional): Sin efecto; la cola no tiene límite.
+            timeout (Optional[float], optional): Sin efecto; la cola no tiene límite.
+        """
+        clave = self._clave(evento)
+        with self._condicion:
+            self.encolados += 1
+            if clave is not None:
+                celda = self._pendientes.get(clave)
+                if celda is not None:
+                    celda[0] = evento
+                    self.fusionados += 1
+                    return
+                celda = [evento]
+                self._pendientes[clave] = celda
+            else:
+                celda = [evento]
+            self._cola.append(celda)
+            self._condicion.notify()
+
+    def put_nowait(self, evento):
+        """Agrega un evento sin esperar."""
+        self.put(evento, block=False)
+
+    def _extraer(self):
+        """Saca el primer evento; debe llamarse con la condición tomada."""
+        evento = self._cola.popleft()[0]
+        clave = self._clave(evento)
+        if clave is not None:
+            self._pendientes.pop(clave, None)
+        return evento
+
+    def get(self, block: bool = True, timeout: Optional[float] = None):
+        """Saca el evento más antiguo.
+
+        Args:
+            block (bool, optional): Si es True espera a que haya un evento.
+            timeout (Optional[float], optional): Segundos máximos de espera.
+
+        Returns:
+            EventoEcosistema: Evento extraído.
+
+        Raises:
+            Empty: Si no hay eventos dentro del tiempo indicado.
+        """
+        with self._condicion:
+            if not block:
+                if not self._cola:
+                    raise Empty
+            elif timeout is None:
+                while not self._cola:
+                    self._condicion.wait()
+            else:
+                limite = time.monotonic() + timeout
+                while not self._cola:
+                    restante = limite - time.monotonic()
+                    if restante <= 0:
+                        raise Empty
+                    self._condicion.wait(restante)
+            return self._extraer()
+
+    def get_nowait(self):
+        """Saca el evento más antiguo sin esperar.
+
+        Raises:
+            Empty: Si la cola está vacía.
+        """
+        return self.get(block=False)
+
+    def get_lote(self, maximo: int, espera: float) -> List[Any]:
+        """Saca un lote de eventos tomando el lock una vez por espera.
+
+        Espera sin límite el primer evento y luego sigue extrayendo hasta
+        juntar `maximo` eventos o hasta que pasen `espera` segundos.
+
+        Args:
+            maximo (int): Cantidad máxima de eventos del lote.
+            espera (float): Segundos máximos para completar el lote.
+
+        Returns:
+            List[EventoEcosistema]: Eventos extraídos, en orden de llegada.
+        """
+        lote = []
+        with self._condicion:
+            while not self._cola:
+                self._condicion.wait()
+            limite = time.monotonic() + espera
+            while True:
+                while self._cola and len(lote) < maximo:
+                    lote.append(self._extraer())
+                if len(lote) >= maximo:
+                    break
+                restante = limite - time.monotonic()
+                if restante <= 0:
+                    break
+                self._condicion.wait(restante)
+        return lote
+
+    def qsize(self) -> int:
+        """int: Cantidad de eventos pendientes."""
+        with self._condicion:
+            return len(self._cola)
+
+    def empty(self) -> bool:
+        """bool: True si no hay eventos pendientes."""
+        return self.qsize() == 0
+
+    @property
+    def tasa_fusion(self) -> float:
+        """float: Fracción de eventos recibidos que fueron fusionados."""
+        if self.encolados == 0:
+            return 0.0
+        return self.fusionados / self.encolados
+
+    def estadisticas(self) -> Dict[str, float]:
+        """Obtiene los contadores de la cola.
+
+        Returns:
+            Dict[str, float]: Profundidad actual, eventos encolados,
+                eventos fusionados y tasa de fusión.
+        """
+        with self._condicion:
+            return {
+                'profundidad': len(self._cola),
+                'encolados': self.encolados,
+                'fusionados': self.fusionados,
+                'tasa_fusion': self.tasa_fusion,
+            }
@@ -0,0 +1,189 @@
+import json
+from multiprocessing import shared_memory
+from typing import Optional
+
+import numpy as np
+
+from CuadroSimulacion import CuadroSimulacion
+
+
+class CuadroCompartido:
+    """Doble búfer de cuadros de simulación en memoria compartida entre procesos.
+
+    Un proceso escritor publica cada cuadro en el búfer que no tiene el
+    último cuadro publicado y solo después anota su número de secuencia en
+    la cabecera; un lector toma siempre el búfer de esa secuencia, así
+    nunca ve un cuadro a medio escribir. Cada búfer lleva además una
+    versión que el escritor vuelve impar mientras lo escribe y par al
+    terminar: si un lector lento todavía copia un búfer cuando el escritor
+    lo vuelve a tomar, dos cuadros después, la versión cambia y la copia se
+    descarta.
+
+    Organización de la memoria: una cabecera de 8 enteros de 64 bits
+    (secuencia, capacidad) y luego dos búferes, cada uno con 8 enteros de
+    control (versión, secuencia, tick, cantidad, bytes de metadatos), las
+    columnas de `_COLUMNAS` con `capacidad` filas y TAMANO_METADATOS bytes
+    con los nombres de especies y categorías en JSON.
+
+    Attributes:
+        capacidad (int): Máximo de entidades por cuadro.
+        nombre (str): Nombre del segmento de memoria compartida.
+    """
+
+    CAPACIDAD = 1 << 18
+    TAMANO_METADATOS = 2048
+    REINTENTOS = 3
+
+    _COLUMNAS = (('ids', np.int32), ('x', np.float32), ('y', np.float32),
+                 ('energia', np.float32), ('especie', np.int16), ('categoria', np.int8))
+    _ENTEROS_CONTROL = 8
+
+    def __init__(self, memoria: shared_memory.SharedMemory, capacidad: int, propietario: bool):
+        """Prepara las vistas sobre un segmento ya creado o abierto.
+
+        Usar `crear()` o `abrir()`.
+        """
+        self._memoria = memoria
+        self._propietario = propietario
+        self.capacidad = capacidad
+        self.nombre = memoria.name
+
+        self._cabecera = np.ndarray((self._ENTEROS_CONTROL,), dtype=np.uint64, buffer=memoria.buf)
+        arreglos = [('control', np.uint64, self._ENTEROS_CONTROL)]
+        arreglos += [(nombre, tipo, capacidad) for nombre, tipo in self._COLUMNAS]
+        arreglos.append(('metadatos', np.uint8, self.TAMANO_METADATOS))
+
+        desplazamiento = self._cabecera.nbytes
+        self._buferes = []
+        for _ in range(2):
+            bufer = {}
+            for nombre, tipo, cantidad in arreglos:
+                bufer[nombre] = np.ndarray((cantidad,), dtype=tipo, buffer=memoria.buf,
+                                           offset=desplazamiento)
+                # Cada arreglo empieza alineado a 8 bytes
+                desplazamiento += -(-bufer[nombre].nbytes // 8) * 8
+            self._buferes.append(bufer)
+        self._secuencia = int(self._cabecera[0])
+
+    @classmethod
+    def _tamano(cls, capacidad: int) -> int:
+        """Calcula los bytes de un segmento con la capacidad dada"""
+        por_bufer = 8 * cls._ENTEROS_CONTROL + cls.TAMANO_METADATOS
+        for _, tipo in cls._COLUMNAS:
+            por_bufer += -(-np.dtype(tipo).itemsize * capacidad // 8) * 8
+        return 8 * cls._ENTEROS_CONTROL + 2 * por_bufer
+
+    @classmethod
+    def crear(cls, capacidad: int = CAPACIDAD) -> 'CuadroCompartido':
+        """Crea un segmento vacío; quien lo crea lo libera al cerrarlo.
+
+        Args:
+            capacidad (int, optional): Máximo de entidades por cuadro.
+
+        Raises:
+            ValueError: Si la capacidad no es positiva.
+        """
+        if capacidad <= 0:
+            raise ValueError(f"Capacidad inválida: {capacidad}")
+        memoria = shared_memory.SharedMemory(create=True, size=cls._tamano(capacidad))
+        cabecera = np.ndarray((cls._ENTEROS_CONTROL,), dtype=np.uint64, buffer=memoria.buf)
+        cabecera[:] = 0
+        cabecera[1] = capacidad
+        del cabecera
+        return cls(memoria, capacidad, propietario=True)
+
+    @classmethod
+    def abrir(cls, nombre: str) -> 'CuadroCompartido':
+        """Abre un segmento creado por otro proceso.
+
+        Args:
+            nombre (str): Nombre del segmento (`nombre` de quien lo creó).
+        """
+        memoria = shared_memory.SharedMemory(name=nombre)
+        cabecera = np.ndarray((cls._ENTEROS_CONTROL,), dtype=np.uint64, buffer=memoria.buf)
+        capacidad = int(cabecera[1])
+        del cabecera
+        return cls(memoria, capacidad, propietario=False)
+
+    @property
+    def secuencia(self) -> int:
+        """int: Número del último cuadro completo publicado, 0 si no hay ninguno."""
+        return int(self._cabecera[0])
+
+    def publicar(self, cuadro: CuadroSimulacion) -> int:
+        """Escribe un cuadro y lo vuelve el último publicado.
+
+        Solo debe haber un escritor. Si el cuadro tiene más entidades que la
+        capacidad, se publican las primeras.
+
+        Args:
+            cuadro (CuadroSimulacion): Cuadro a publicar.
+
+        Returns:
+            int: Número de secuencia del cuadro.
+        """
+        cantidad = len(cuadro)
+        if cantidad > self.capacidad:
+            print(f"Error al publicar cuadro: {cantidad} entidades, capacidad {self.capacidad}")
+            cantidad = self.capacidad
+        metadatos = json.dumps({'especies': cuadro.especies,
+                                'categorias': cuadro.categorias}).encode('utf-8')
+        if len(metadatos) > self.TAMANO_METADATOS:
+            raise ValueError(f"Metadatos demasiado grandes para el cuadro: {len(metadatos)} bytes")
+
+        secuencia = self._secuencia + 1
+        bufer = self._buferes[secuencia % 2]
+        control = bufer['control']
+        control[0] += 1  # Impar: escribiendo
+        for nombre, _ in self._COLUMNAS:
+            bufer[nombre][:cantidad] = getattr(cuadro, nombre)[:cantidad]
+        bufer['metadatos'][:len(metadatos)] = np.frombuffer(metadatos, dtype=np.uint8)
+        control[1] = secuencia
+        control[2] = cuadro.tick
+        control[3] = cantidad
+        control[4] = len(metadatos)
+        control[0] += 1  # Par: completo
+
+        self._cabecera[0] = secuencia
+        self._secuencia = secuencia
+        cuadro.secuencia = secuencia
+        return secuencia
+
+    def leer(self, desde: int = 0) -> Optional[CuadroSimulacion]:
+        """Copia el último cuadro publicado, si es posterior a uno ya leído.
+
+        Args:
+            desde (int, optional): Secuencia del último cuadro leído.
+
+        Returns:
+            Optional[CuadroSimulacion]: El cuadro, o None si no hay uno más
+                nuevo o el escritor lo pisó durante todos los reintentos.
+        """
+        for _ in range(self.REINTENTOS):
+            secuencia = int(self._cabecera[0])
+            if secuencia <= desde:
+                return None
+            bufer = self._buferes[secuencia % 2]
+            control = bufer['control']
+            version = int(control[0])
+            if version % 2 or int(control[1]) != secuencia:
+                continue
+            tick, cantidad, largo = int(control[2]), int(control[3]), int(control[4])
+            columnas = {nombre: bufer[nombre][:cantidad].copy() for nombre, _ in self._COLUMNAS}
+            metadatos = bufer['metadatos'][:largo].tobytes()
+            if int(control[0]) != version:
+                continue
+
+            nombres = json.loads(metadatos.decode('utf-8'))
+            return CuadroSimulacion(tick, nombres['especies'], nombres['categorias'],
+                                    secuencia=secuencia, **columnas)
+        return None
+
+    def cerrar(self):
+        """Suelta el segmento; si este proceso lo creó, también lo libera."""
+        # Las vistas de NumPy impiden cerrar la memoria
+        self._cabecera = None
+        self._buferes = []
+        self._memoria.close()
+        if self._propietario:
+            self._memoria.unlink()
@@ -0,0 +1,86 @@
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from AlmacenMundo import AlmacenMundo
+
+
+class CuadroSimulacion:
+    """Estado de dibujo de las entidades vivas en un tick.
+
+    Solo contiene lo necesario para dibujar: la fila de cada entidad en el
+    mundo, que la identifica mientras vive, su posición, su especie, su
+    categoría y su energía, en arreglos paralelos. Se puede copiar entre
+    procesos sin los objetos Organismo.
+
+    Attributes:
+        tick (int): Tick del ecosistema.
+        especies (List[str]): Nombre de cada código de especie.
+        categorias (List[str]): Nombre de cada código de categoría.
+        ids (np.ndarray): Fila de cada entidad en el mundo.
+        x (np.ndarray): Coordenada x de cada entidad.
+        y (np.ndarray): Coordenada y de cada entidad.
+        especie (np.ndarray): Código de especie de cada entidad.
+        categoria (np.ndarray): Código de categoría de cada entidad.
+        energia (np.ndarray): Nivel de energía de cada entidad.
+        secuencia (int): Número de cuadro asignado al publicarlo.
+    """
+    __slots__ = ('tick', 'especies', 'categorias', 'ids', 'x', 'y', 'especie', 'categoria',
+                 'energia', 'secuencia')
+
+    def __init__(self, tick: int, especies: Sequence[str], categorias: Sequence[str],
+                 ids: np.ndarray, x: np.ndarray, y: np.ndarray, especie: np.ndarray,
+                 categoria: np.ndarray, energia: np.ndarray, secuencia: int = 0):
+        self.tick = tick
+        self.especies: List[str] = list(especies)
+        self.categorias: List[str] = list(categorias)
+        self.ids = ids
+        self.x = x
+        self.y = y
+        self.especie = especie
+        self.categoria = categoria
+        self.energia = energia
+        self.secuencia = secuencia
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def en_rectangulo(self, x_min: float, y_min: float, x_max: float, y_max: float) -> np.ndarray:
+        """Obtiene las posiciones en los arreglos de las entidades dentro de un rectángulo.
+
+        Args:
+            x_min (float): Borde izquierdo, incluido.
+            y_min (float): Borde superior, incluido.
+            x_max (float): Borde derecho, excluido.
+            y_max (float): Borde inferior, excluido.
+
+        Returns:
+            np.ndarray: Índices de las entidades encontradas.
+        """
+        x, y = self.x, self.y
+        return np.flatnonzero((x >= x_min) & (x < x_max) & (y >= y_min) & (y < y_max))
+
+    def densidad(self, x_min: float, y_min: float, x_max: float, y_max: float,
+                 columnas: int, filas: int, por_categoria: bool = False) -> np.ndarray:
+        """Cuenta las entidades en cada celda de una grilla sobre un rectángulo.
+
+        Tiene la forma de `Ecosistema.densidad()`, así una interfaz puede
+        dibujar un cuadro o un ecosistema de la misma manera.
+
+        Args:
+            x_min (float): Borde izquierdo, incluido.
+            y_min (float): Borde superior, incluido.
+            x_max (float): Borde derecho, excluido.
+            y_max (float): Borde inferior, excluido.
+            columnas (int): Celdas a lo ancho.
+            filas (int): Celdas a lo alto.
+            por_categoria (bool, optional): Si se cuenta por separado cada
+                categoría. Por defecto False.
+
+        Returns:
+            np.ndarray: Matriz (filas, columnas) con la cantidad por celda,
+                o (len(categorias), filas, columnas) por categoría.
+        """
+        grupo: Optional[np.ndarray] = self.categoria if por_categoria else None
+        return AlmacenMundo.contar_en_celdas(self.x, self.y, x_min, y_min, x_max, y_max,
+                                             columnas, filas, grupo, len(self.categorias))
@@ -0,0 +1,450 @@
+import os
+import pickle
+import queue
+import struct
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from Instantanea import Instantanea
+
+
+class DiarioEventos:
+    """Diario binario de solo agregado de los cambios del ecosistema.
+
+    Cada registro lleva un prefijo con su longitud y su clase, así el
+    archivo se puede recorrer sin índice y un registro cortado por una caída
+    se detecta y se descarta al leer. Se escriben tres clases de registro:
+
+    - EVENTOS: los eventos anotados desde el registro anterior, como lista
+      de (tick, tipo, origen, destino, datos).
+    - TICK: cambios de las columnas del AlmacenMundo desde el tick anterior,
+      solo para las filas que cambiaron, las entidades nuevas y los
+      atributos locales que cambiaron de las entidades que tocaron las
+      acciones del motor o que se anotaron con `registrar_cambio()`.
+    - FOTOGRAMA: instantánea completa del ecosistema cada
+      `intervalo_fotogramas` ticks, punto de partida de la reconstrucción.
+
+    Bajo el lock del ecosistema solo se anotan los eventos en una lista y,
+    al terminar cada tick, se copian las columnas seguidas y los atributos
+    locales tocados. Esa copia pasa por una cola acotada a un thread
+    escritor, dueño del archivo, que calcula las diferencias, codifica los
+    registros y espera al disco.
+
+    El id de una entidad es su fila en el AlmacenMundo, que nunca se
+    reutiliza mientras vive el ecosistema.
+
+    Attributes:
+        ruta (str): Archivo del diario.
+        intervalo_fotogramas (int): Ticks entre fotogramas clave.
+        bytes_escritos (int): Bytes escritos en el diario.
+    """
+
+    MAGIA = b'ECODIA\x00\x00'
+    VERSION = 1
+    INTERVALO_FOTOGRAMAS = 100
+    TAMANO_BUFFER = 1 << 20
+    MAXIMO_PENDIENTES = 256  # Ticks en espera del escritor
+
+    # Clases de registro
+    EVENTOS = 1
+    TICK = 2
+    FOTOGRAMA = 3
+
+    # Columnas del AlmacenMundo que sigue el diario -> tipo NumPy
+    COLUMNAS = {
+        'x': '<f8',
+        'y': '<f8',
+        'energia': '<f8',
+        'vivo': '?',
+        'velocidad': '<f8',
+        'direccion': '<f8',
+        'tiempo_reproduccion': '<i4',
+    }
+
+    _PREFIJO = struct.Struct('<8sI')  # magia, versión
+    _REGISTRO = struct.Struct('<IB')  # longitud del cuerpo, clase
+    _TICK = struct.Struct('<qII')  # tick, filas del mundo, filas cambiadas
+    _FOTOGRAMA = struct.Struct('<q')  # tick
+
+    def __init__(self, ruta: str, intervalo_fotogramas: int = INTERVALO_FOTOGRAMAS):
+        """Abre un diario nuevo para escribir.
+
+        Args:
+            ruta (str): Archivo a crear; si existe se reemplaza.
+            intervalo_fotogramas (int, optional): Ticks entre fotogramas
+                clave. Por defecto INTERVALO_FOTOGRAMAS.
+
+        Raises:
+            ValueError: Si el intervalo no es positivo.
+        """
+        if intervalo_fotogramas <= 0:
+            raise ValueError(f"Intervalo de fotogramas inválido: {intervalo_fotogramas}")
+        self.ruta = ruta
+        self.intervalo_fotogramas = intervalo_fotogramas
+        self.bytes_escritos = 0
+
+        # Estado del lado del ecosistema
+        self._eventos: List[tuple] = []
+        self._tocadas: Dict[int, object] = {}
+        self._filas = -1  # Filas del mundo en el último registro
+        self._ultimo_fotograma: Optional[int] = None
+        self._recursos: Optional[dict] = None
+        self._cerrado = False
+
+        # Estado del lado del escritor
+        self._archivo = open(ruta, 'wb', buffering=self.TAMANO_BUFFER)
+        self._anterior: Optional[np.ndarray] = None  # Columnas del último registro
+        self._locales: Dict[int, tuple] = {}  # Atributos locales escritos por fila
+        self._pendientes = queue.Queue(maxsize=self.MAXIMO_PENDIENTES)
+        self._escribir(self._PREFIJO.pack(self.MAGIA, self.VERSION))
+
+        self._escritor = threading.Thread(target=self._escribir_pendientes)
+        self._escritor.daemon = True
+        self._escritor.start()
+
+    def registrar_evento(self, tick: int, tipo: str, origen, destino=None,
+                         datos: Optional[dict] = None, con_locales: bool = False):
+        """Anota un evento en el diario.
+
+        Debe llamarse con el lock del ecosistema tomado, igual que
+        `registrar_tick()`; así anotar cuesta solo agregar a una lista.
+
+        Args:
+            tick (int): Tick del ecosistema.
+            tipo (str): Tipo de evento.
+            origen (Organismo): Entidad que genera el evento.
+            destino (object, optional): Entidad afectada; cualquier otro
+                valor se guarda tal cual.
+            datos (Optional[dict], optional): Información adicional.
+            con_locales (bool, optional): Si es True, el registro del tick
+                guarda los atributos locales de origen y destino, para que
+                la reconstrucción refleje sus cambios.
+        """
+        id_origen = getattr(origen, '_indice', -1)
+        id_destino = getattr(destino, '_indice', None)
+        self._eventos.append((tick, tipo, id_origen,
+                              destino if id_destino is None else id_destino, datos or None))
+        if con_locales:
+            if id_origen >= 0:
+                self._tocadas[id_origen] = origen
+            if id_destino is not None and id_destino >= 0:
+                self._tocadas[id_destino] = destino
+
+    def registrar_cambio(self, entidad):
+        """Anota que una entidad cambió sus atributos locales sin un evento.
+
+        Debe llamarse con el lock del ecosistema tomado. El registro del
+        tick guarda sus atributos locales solo si difieren de los últimos
+        escritos.
+
+        Args:
+            entidad (Organismo): Entidad que cambió.
+        """
+        if entidad._indice >= 0:
+            self._tocadas[entidad._indice] = entidad
+
+    def registrar_tick(self, ecosistema):
+        """Copia los cambios del último tick, o un fotograma clave si corresponde.
+
+        Debe llamarse con el lock del ecosistema tomado, al terminar cada paso.
+
+        Args:
+            ecosistema (Ecosistema): Ecosistema que avanzó.
+        """
+        if self._cerrado:
+            return
+        tick = ecosistema.tick
+        eventos, self._eventos = self._eventos, []
+        if self._ultimo_fotograma is None or tick - self._ultimo_fotograma >= self.intervalo_fotogramas:
+            instantanea = ecosistema.capturar_estado()
+            self._tocadas = {}
+            self._filas = ecosistema.mundo.n
+            self._ultimo_fotograma = tick
+            self._recursos = dict(instantanea.recursos)
+            self._pendientes.put((self.FOTOGRAMA, eventos, instantanea))
+            return
+
+        mundo = ecosistema.mundo
+        m, n = self._filas, mundo.n
+        altas = [(fila, ecosistema._categorias[fila], type(entidad), entidad.__class__.__name__,
+                  Instantanea.leer_locales(entidad))
+                 for fila, entidad in zip(range(m, n), mundo.entidades[m:n])]
+        locales = {fila: Instantanea.leer_locales(entidad)
+                   for fila, entidad in self._tocadas.items() if fila < m}
+        recursos = None
+        if ecosistema.recursos != self._recursos:
+            recursos = self._recursos = dict(ecosistema.recursos)
+        self._tocadas = {}
+        self._filas = n
+        self._pendientes.put((self.TICK, eventos,
+                              (tick, self._columnas(ecosistema), altas, locales, recursos)))
+
+    def _columnas(self, ecosistema) -> np.ndarray:
+        """Copia las columnas seguidas del mundo en una matriz de floats.
+
+        Las presas que están huyendo van con su velocidad normal, igual que
+        en las instantáneas.
+        """
+        n = ecosistema.mundo.n
+        actual = np.empty((len(self.COLUMNAS), n), dtype=np.float64)
+        for columna, nombre in zip(actual, self.COLUMNAS):
+            columna[:] = getattr(ecosistema.mundo, nombre)[:n]
+        if ecosistema._huidas:
+            velocidad = actual[list(self.COLUMNAS).index('velocidad')]
+            for presa, (_, original) in ecosistema._huidas.items():
+                velocidad[presa._indice] = original
+        return actual
+
+    def vaciar(self):
+        """Espera a que se escriba lo encolado y lo sincroniza con el disco."""
+        if self._cerrado:
+            return
+        listo = threading.Event()
+        self._pendientes.put((None, [], listo))
+        listo.wait()
+
+    def cerrar(self):
+        """Escribe los eventos anotados, sincroniza y cierra el diario.
+
+        Debe llamarse con el lock del ecosistema tomado.
+        """
+        if self._cerrado:
+            return
+        self._cerrado = True
+        eventos, self._eventos = self._eventos, []
+        self._pendientes.put((None, eventos, None))
+        self._escritor.join()
+
+    # Thread escritor
+    def _escribir_pendientes(self):
+        """Bucle del thread escritor.
+
+        Cada elemento de la cola es (clase, eventos, contenido): un tick o
+        un fotograma para codificar y escribir, o con clase None una orden
+        de sincronizar (contenido es un threading.Event a avisar) o de
+        cerrar (contenido es None).
+        """
+        while True:
+            clase, eventos, contenido = self._pendientes.get()
+            try:
+                if eventos:
+                    self._escribir_registro(self.EVENTOS,
+                                            pickle.dumps(eventos, protocol=pickle.HIGHEST_PROTOCOL))
+                if clase == self.TICK:
+                    self._escribir_registro(self.TICK, *self._codificar_tick(*contenido))
+                elif clase == self.FOTOGRAMA:
+                    self._anterior = np.array([contenido.columnas[nombre] for nombre in self.COLUMNAS],
+                                              dtype=np.float64)
+                    self._locales = {fila: locales
+                                     for especies in contenido.entidades.values()
+                                     for lista in especies.values()
+                                     for _, fila, locales in lista}
+                    self._escribir_registro(self.FOTOGRAMA, self._FOTOGRAMA.pack(contenido.tick),
+                                            pickle.dumps(contenido, protocol=pickle.HIGHEST_PROTOCOL))
+                else:
+                    self._archivo.flush()
+                    os.fsync(self._archivo.fileno())
+                    if contenido is None:
+                        self._archivo.close()
+                        return
+                    contenido.set()
+                    continue
+
+                if self._pendientes.empty():
+                    self._archivo.flush()
+            except OSError as e:
+                print(f"Error al escribir diario: {str(e)}")
+
+    def _codificar_tick(self, tick: int, actual: np.ndarray, altas: list, locales: dict,
+                        recursos: Optional[dict]) -> List[bytes]:
+        """Codifica las filas que cambiaron respecto del registro anterior."""
+        m, n = self._anterior.shape[1], actual.shape[1]
+        cambio = np.ones(n, dtype=bool)
+        cambio[:m] = (actual[:, :m] != self._anterior).any(axis=0)
+        filas = np.flatnonzero(cambio).astype('<i4')
+        self._anterior = actual
+        for fila, _, _, _, valores in altas:
+            self._locales[fila] = valores
+        locales = {fila: valores for fila, valores in locales.items()
+                   if self._locales.get(fila) != valores}
+        self._locales.update(locales)
+
+        partes = [self._TICK.pack(tick, n, len(filas)), filas.tobytes()]
+        for columna, tipo in zip(actual[:, filas], self.COLUMNAS.values()):
+            partes.append(columna.astype(tipo).tobytes())
+        partes.append(pickle.dumps((altas, locales, recursos), protocol=pickle.HIGHEST_PROTOCOL))
+        return partes
+
+    def _escribir_registro(self, clase: int, *partes: bytes):
+        """Escribe un registro completo con su prefijo."""
+        self._escribir(self._REGISTRO.pack(sum(len(parte) for parte in partes), clase))
+        for parte in partes:
+            self._escribir(parte)
+
+    def _escribir(self, datos: bytes):
+        """Agrega bytes al buffer del archivo."""
+        self._archivo.write(datos)
+        self.bytes_escritos += len(datos)
+
+
+class LectorDiario:
+    """Lee un diario de eventos y reconstruye el ecosistema en cualquier tick.
+
+    La reconstrucción parte del último fotograma clave anterior o igual al
+    tick pedido y le aplica en orden los registros siguientes. No vuelve a
+    simular: solo aplica valores guardados, así el resultado es siempre el
+    mismo. Las columnas del AlmacenMundo, las altas y las muertes son
+    exactas en cada tick, y también los atributos locales que el motor
+    registra con sus acciones o con `DiarioEventos.registrar_cambio()`.
+
+    Attributes:
+        ruta (str): Archivo del diario.
+        fotogramas (List[Tuple[int, int]]): (tick, posición en el archivo)
+            de cada fotograma clave.
+        ultimo_tick (int): Último tick registrado completo.
+    """
+
+    def __init__(self, ruta: str):
+        """Abre un diario y lo indexa.
+
+        Args:
+            ruta (str): Archivo del diario.
+
+        Raises:
+            ValueError: Si el archivo no es un diario de una versión soportada.
+        """
+        self.ruta = ruta
+        with open(ruta, 'rb') as archivo:
+            prefijo = archivo.read(DiarioEventos._PREFIJO.size)
+        if len(prefijo) < DiarioEventos._PREFIJO.size:
+            raise ValueError(f"No es un diario de eventos: {ruta}")
+        magia, version = DiarioEventos._PREFIJO.unpack(prefijo)
+        if magia != DiarioEventos.MAGIA:
+            raise ValueError(f"No es un diario de eventos: {ruta}")
+        if version > DiarioEventos.VERSION:
+            raise ValueError(f"Versión de diario no soportada: {version}")
+
+        self.fotogramas: List[Tuple[int, int]] = []
+        self.ultimo_tick = -1
+        for posicion, clase, cuerpo in self._registros():
+            if clase == DiarioEventos.FOTOGRAMA:
+                tick, = DiarioEventos._FOTOGRAMA.unpack_from(cuerpo)
+                self.fotogramas.append((tick, posicion))
+                self.ultimo_tick = tick
+            elif clase == DiarioEventos.TICK:
+                self.ultimo_tick = DiarioEventos._TICK.unpack_from(cuerpo)[0]
+
+    def _registros(self, desde: int = DiarioEventos._PREFIJO.size) -> Iterator[Tuple[int, int, memoryview]]:
+        """Recorre los registros completos a partir de una posición.
+
+        Yields:
+            Tuple[int, int, memoryview]: Posición, clase y cuerpo del registro.
+        """
+        with open(self.ruta, 'rb') as archivo:
+            datos = memoryview(archivo.read())
+        posicion = desde
+        cabecera = DiarioEventos._REGISTRO
+        while posicion + cabecera.size <= len(datos):
+            longitud, clase = cabecera.unpack_from(datos, posicion)
+            fin = posicion + cabecera.size + longitud
+            if fin > len(datos):
+                break  # registro cortado por una caída
+            yield posicion, clase, datos[posicion + cabecera.size:fin]
+            posicion = fin
+
+    def eventos(self, desde: int = 0, hasta: Optional[int] = None) -> Iterator[dict]:
+        """Recorre los eventos registrados en un rango de ticks.
+
+        Args:
+            desde (int, optional): Primer tick incluido. Por defecto 0.
+            hasta (Optional[int], optional): Último tick incluido. Por
+                defecto hasta el final.
+
+        Yields:
+            dict: Evento con las claves 'tick', 'tipo', 'origen',
+                'destino' y 'datos'; origen y destino son ids de entidad.
+        """
+        for _, clase, cuerpo in self._registros():
+            if clase != DiarioEventos.EVENTOS:
+                continue
+            for tick, tipo, origen, destino, datos in pickle.loads(cuerpo):
+                if tick < desde or (hasta is not None and tick > hasta):
+                    continue
+                yield {'tick': tick, 'tipo': tipo, 'origen': origen,
+                       'destino': destino, 'datos': datos or {}}
+
+    def reconstruir(self, tick: Optional[int] = None) -> Instantanea:
+        """Reconstruye el estado del ecosistema al terminar un tick.
+
+        Args:
+            tick (Optional[int], optional): Tick a reconstruir. Por defecto
+                el último registrado.
+
+        Returns:
+            Instantanea: Estado en ese tick; `Ecosistema.desde_estado()`
+                crea un ecosistema a partir de ella.
+
+        Raises:
+            ValueError: Si el tick es anterior al primer fotograma o
+                posterior al último tick registrado.
+        """
+        if tick is None:
+            tick = self.ultimo_tick
+        anteriores = [fotograma for fotograma in self.fotogramas if fotograma[0] <= tick]
+        if not anteriores or tick > self.ultimo_tick:
+            raise ValueError(f"Tick fuera del diario: {tick}")
+        _, posicion = anteriores[-1]
+
+        base = None
+        columnas: Dict[str, np.ndarray] = {}
+        filas: Dict[int, list] = {}
+        recursos = {}
+        tick_actual = None
+        for _, clase, cuerpo in self._registros(posicion):
+            if clase == DiarioEventos.FOTOGRAMA:
+                if base is not None:
+                    break
+                base = pickle.loads(cuerpo[DiarioEventos._FOTOGRAMA.size:])
+                columnas = {nombre: base.columnas[nombre].copy() for nombre in DiarioEventos.COLUMNAS}
+                recursos = dict(base.recursos)
+                tick_actual = base.tick
+                for categoria, especies in base.entidades.items():
+                    for especie, lista in especies.items():
+                        for clase_entidad, fila, locales in lista:
+                            filas[fila] = [categoria, especie, clase_entidad, locales]
+
+            elif clase == DiarioEventos.TICK:
+                tick_registro, n, cantidad = DiarioEventos._TICK.unpack_from(cuerpo)
+                if tick_registro > tick:
+                    break
+                tick_actual = tick_registro
+                posicion = DiarioEventos._TICK.size
+                cambiadas = np.frombuffer(cuerpo, dtype='<i4', count=cantidad, offset=posicion)
+                posicion += cambiadas.nbytes
+                for nombre, tipo in DiarioEventos.COLUMNAS.items():
+                    valores = np.frombuffer(cuerpo, dtype=tipo, count=cantidad, offset=posicion)
+                    posicion += valores.nbytes
+                    columna = columnas[nombre]
+                    if len(columna) < n:
+                        columna = columnas[nombre] = np.concatenate(
+                            [columna, np.zeros(n - len(columna), dtype=columna.dtype)])
+                    columna[cambiadas] = valores
+                altas, locales, nuevos_recursos = pickle.loads(cuerpo[posicion:])
+                for fila, valores in locales.items():
+                    if fila in filas:
+                        filas[fila][3] = valores
+                for fila, categoria, clase_entidad, especie, valores in altas:
+                    filas[fila] = [categoria, especie, clase_entidad, valores]
+                if nuevos_recursos is not None:
+                    recursos = nuevos_recursos
+
+        vivos = columnas['vivo']
+        entidades = {categoria: {} for categoria in base.entidades}
+        for fila in sorted(filas):
+            categoria, especie, clase_entidad, locales = filas[fila]
+            if vivos[fila]:
+                por_especie = entidades.setdefault(categoria, {})
+                por_especie.setdefault(especie, []).append((clase_entidad, fila, locales))
+        return Instantanea(base.tamano, tick_actual, recursos, columnas, entidades)
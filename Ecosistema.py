@@ -1,35 +1,35 @@
+import math
 import threading
 import random
-from typing import List, Dict, Tuple, Optional
+import time
+from collections import deque
+from typing import List, Dict, Set, Tuple, Optional
 from abc import ABC
-from queue import Queue
+import numpy as np
+
+from AlmacenMundo import AlmacenMundo
 from AnimalThread import AnimalThread
+from ColaEventos import ColaEventos
+from CuadroSimulacion import CuadroSimulacion
+from DiarioEventos import DiarioEventos
+from EventoEcosistema import EventoEcosistema
+from GrillaEspacial import GrillaEspacial
+from Instantanea import Instantanea
+from RasterPlantas import RasterPlantas
 from Animales.Animal import Animal
 from Animales.Carnivoros.Aguila_real import Aguila_real
 from Animales.Carnivoros.Carnivoro import Carnivoro
 from Animales.Carnivoros.Leon import Leon
+from Animales.Habilidades.Nadador import Nadador
+from Animales.Habilidades.Volador import Volador
 from Animales.Herbivoros.Ciervo import Ciervo
 from Animales.Herbivoros.Conejo import Conejo
 from Animales.Herbivoros.Herbivoro import Herbivoro
 from PlantaThread import PlantaThread
+from Planificador import Planificador
+from PlanificadorAsyncio import PlanificadorAsyncio
 from Plantas.Planta import Planta
-from dataclasses import dataclass
-
 
-@dataclass
-class EventoEcosistema:
-    """Clase para representar un evento en el ecosistema.
-
-    Attributes:
-        tipo (str): Tipo de evento.
-        origen (Optional[object]): Entidad que genera el evento.
-        destino (Optional[object]): Entidad que es el destino del evento.
-        datos (dict): Información adicional sobre el evento.
-    """
-    tipo: str
-    origen: Optional[object]
-    destino: Optional[object]
-    datos: dict
 
 class Ecosistema:
     """Clase principal que maneja el ecosistema y sus entidades.
@@ -42,20 +42,65 @@ class Ecosistema:
         frutales (Dict[str, List[Planta]]): Diccionario de plantas frutales por especie.
         florales (Dict[str, List[Planta]]): Diccionario de plantas florales por especie.
         MIN_ANIMALES_POR_ESPECIE (int): Mínimo de animales por especie.
-        threads (List[AnimalThread, PlantaThread]): Lista de threads para entidades.
-        cola_eventos (Queue): Cola para eventos del ecosistema.
+        threads (List[AnimalThread, PlantaThread]): Comportamientos de las entidades.
+        planificador (Planificador | PlanificadorAsyncio): Ejecuta los
+            comportamientos de todas las entidades.
+        cola_eventos (ColaEventos): Cola para eventos del ecosistema; fusiona
+            los eventos repetidos de una misma entidad.
+        estadisticas_eventos (dict): Rendimiento del procesador de eventos:
+            lotes y eventos procesados, tamaño y duración del último lote,
+            eventos por segundo en ese lote, y profundidad, eventos
+            encolados, fusionados y tasa de fusión de la cola.
         thread_procesador (Thread): Thread que procesa eventos.
         lock (RLock): Monitor para sincronización.
         recursos (dict): Recursos disponibles en el ecosistema.
+        mundo (AlmacenMundo): Estado de todas las entidades en arreglos contiguos.
+        grilla (GrillaEspacial): Índice espacial de las entidades vivas.
+        raster_plantas (RasterPlantas): Planta frutal con frutos más cercana
+            a cada celda del mundo.
+        tick (int): Cantidad de pasos de simulación ejecutados.
+        registros (deque): Acciones ocurridas en los últimos pasos, como
+            EventoEcosistema, pendientes de ser consumidas por una interfaz.
+        mensaje_estado (str): Descripción del último suceso relevante.
+        listos_reproduccion (Dict[int, Set[Animal]]): Animales listos para
+            reproducirse, por código de especie del mundo.
+        diario (Optional[DiarioEventos]): Diario de eventos abierto con
+            `iniciar_diario`, o None.
+        compactar_al_purgar (bool): Si `step()` libera las filas de los
+            muertos cuando son muchas (ver `compactar()`).
     """
 
-    def __init__(self, tamano: Tuple[float, float] = (1000, 1000)):
+    PROBABILIDAD_REPRODUCCION_PLANTAS = 0.001
+    DISTANCIA_REPRODUCCION_PLANTAS = 150
+    ALTURA_BROTE = {'frutal': 0.5, 'floral': 0.3}
+    TICKS_HUIDA = 20  # Duración de la huida de una presa
+    MAX_REGISTROS = 1000
+    TAMANO_LOTE_EVENTOS = 512  # Máximo de eventos procesados por lote
+    ESPERA_LOTE_EVENTOS = 0.005  # Segundos máximos para completar un lote
+    FRACCION_COMPACTACION = 0.5  # Fracción de filas muertas que dispara la compactación
+    MIN_FILAS_COMPACTACION = 64
+
+    RUNTIMES = ('hilos', 'asyncio')
+
+    def __init__(self, tamano: Tuple[float, float] = (1000, 1000), num_trabajadores: int = 4,
+                 runtime: str = 'hilos'):
         """Inicializa un ecosistema con el tamaño especificado.
 
         Args:
             tamano (Tuple[float, float], optional): Tamaño del ecosistema.
                 Por defecto es (1000, 1000).
+            num_trabajadores (int, optional): Threads del planificador que
+                ejecutan los comportamientos de las entidades. Por defecto 4.
+            runtime (str, optional): 'hilos' ejecuta los comportamientos en un
+                grupo de threads; 'asyncio' los ejecuta como corrutinas en un
+                único event loop. Por defecto 'hilos'.
+
+        Raises:
+            ValueError: Si el runtime no es uno de RUNTIMES.
         """
+        if runtime not in self.RUNTIMES:
+            raise ValueError(f"Runtime desconocido: {runtime}")
+
         self.tamano = tamano
         self.carnivoros: Dict[str, List[Animal]] = {}
         self.herbivoros: Dict[str, List[Animal]] = {}
@@ -68,7 +113,32 @@ class Ecosistema:
 
         # Control de threads
         self.threads: List[AnimalThread, PlantaThread] = []
-        self.cola_eventos: Queue = Queue()
+        if runtime == 'asyncio':
+            self.planificador = PlanificadorAsyncio()
+        else:
+            self.planificador = Planificador(num_trabajadores)
+        self.cola_eventos = ColaEventos()
+        self._manejadores = {
+            'buscar_alimento': self.procesar_busqueda_alimento,
+            'mover': self.procesar_movimiento,
+            'descansar': self.procesar_descanso,
+            'interactuar': self.procesar_interaccion,
+            'absorber_agua': self.procesar_absorcion_agua,
+            'crecer': self.procesar_crecimiento,
+            'generar_frutos': self.procesar_generacion_frutos,
+            'reproducir_planta': self.procesar_reproduccion_planta,
+        }
+        self.estadisticas_eventos = {
+            'lotes': 0,
+            'eventos': 0,
+            'ultimo_lote': 0,
+            'duracion_ultimo_lote': 0.0,
+            'eventos_por_segundo': 0.0,
+            'profundidad': 0,
+            'encolados': 0,
+            'fusionados': 0,
+            'tasa_fusion': 0.0,
+        }
         self.thread_procesador = threading.Thread(target=self.procesar_eventos)
         self.thread_procesador.daemon = True
         self.thread_procesador.start()
@@ -84,6 +154,238 @@ class Ecosistema:
             'humedad': 60.0
         }
 
+        # Estado de las entidades en arreglos contiguos
+        self.mundo = AlmacenMundo()
+
+        # Índice espacial con celdas del tamaño del mayor rango de caza
+        self.grilla = GrillaEspacial(self._calcular_tamano_celda())
+
+        # Tabla de la planta con frutos más cercana a cada celda
+        self.raster_plantas = RasterPlantas(self.tamano)
+
+        # Estado del motor de simulación
+        self.tick = 0
+        self.registros: deque = deque(maxlen=self.MAX_REGISTROS)
+        self.mensaje_estado = ''
+        self._entidades_nuevas: List[ABC] = []
+        self._huidas: Dict[Animal, Tuple[int, float]] = {}
+        self._muertes_pendientes = 0
+        self.listos_reproduccion: Dict[int, Set[Animal]] = {}
+        self._categorias: List[str] = []  # Categoría de cada fila del mundo
+        self._categoria_especie: List[int] = []  # Índice en CATEGORIAS por código de especie
+        self._fantasmas: List[Animal] = []
+        self._fantasmas_listos: Dict[str, Set[Animal]] = {}  # Parejas posibles por especie
+        self.diario: Optional[DiarioEventos] = None
+        self.compactar_al_purgar = True
+
+    @staticmethod
+    def _calcular_tamano_celda() -> float:
+        """Obtiene el mayor rango de caza entre las especies carnívoras conocidas.
+
+        Returns:
+            float: Lado de celda para la grilla espacial.
+        """
+        pendientes = [Carnivoro]
+        mayor_rango = Carnivoro.rango_caza
+        while pendientes:
+            clase = pendientes.pop()
+            mayor_rango = max(mayor_rango, clase.rango_caza)
+            pendientes.extend(clase.__subclasses__())
+        return mayor_rango
+
+    def vecinos_en_radio(self, pos: Tuple[float, float], radio: float,
+                         filtro_tipo: Optional[type] = None) -> List[ABC]:
+        """Obtiene las entidades vivas dentro de un radio alrededor de una posición.
+
+        Es la consulta común para caza, huida e interacción entre entidades.
+
+        Args:
+            pos (Tuple[float, float]): Centro de la búsqueda.
+            radio (float): Radio de búsqueda.
+            filtro_tipo (Optional[type]): Tipo (clase o mixin) que deben
+                cumplir las entidades devueltas, por ejemplo Herbivoro.
+
+        Returns:
+            List[ABC]: Entidades encontradas dentro del radio.
+        """
+        return self.grilla.vecinos_en_radio(pos, radio, filtro_tipo)
+
+    def entidades_en_rectangulo(self, x_min: float, y_min: float, x_max: float,
+                                y_max: float) -> List[ABC]:
+        """Obtiene las entidades vivas dentro de un rectángulo, por ejemplo
+        el área visible de una interfaz.
+
+        Args:
+            x_min (float): Borde izquierdo, incluido.
+            y_min (float): Borde superior, incluido.
+            x_max (float): Borde derecho, excluido.
+            y_max (float): Borde inferior, excluido.
+
+        Returns:
+            List[ABC]: Entidades encontradas dentro del rectángulo.
+        """
+        return self.grilla.en_rectangulo(x_min, y_min, x_max, y_max)
+
+    def densidad(self, x_min: float, y_min: float, x_max: float, y_max: float,
+                 columnas: int, filas: int, por_categoria: bool = False) -> np.ndarray:
+        """Cuenta las entidades vivas en cada celda de una grilla sobre un rectángulo.
+
+        Args:
+            x_min (float): Borde izquierdo, incluido.
+            y_min (float): Borde superior, incluido.
+            x_max (float): Borde derecho, excluido.
+            y_max (float): Borde inferior, excluido.
+            columnas (int): Celdas a lo ancho.
+            filas (int): Celdas a lo alto.
+            por_categoria (bool, optional): Si se cuenta por separado cada
+                categoría de CATEGORIAS. Por defecto False.
+
+        Returns:
+            np.ndarray: Matriz (filas, columnas) con la cantidad por celda,
+                o (len(CATEGORIAS), filas, columnas) por categoría.
+        """
+        with self.lock:
+            if not por_categoria:
+                return self.mundo.densidad(x_min, y_min, x_max, y_max, columnas, filas)
+            grupos = np.array(self._categoria_especie, dtype=np.intp)
+            return self.mundo.densidad(x_min, y_min, x_max, y_max, columnas, filas,
+                                       grupos, len(self.CATEGORIAS))
+
+    def mover_todos(self, ancho: Optional[float] = None, alto: Optional[float] = None):
+        """Mueve a todos los animales en un solo paso vectorizado.
+
+        Después del movimiento solo se actualizan en la grilla los animales
+        que cambiaron de celda.
+
+        Args:
+            ancho (Optional[float]): Ancho del área de movimiento. Por defecto
+                el ancho del ecosistema.
+            alto (Optional[float]): Alto del área de movimiento. Por defecto
+                el alto del ecosistema.
+        """
+        if ancho is None:
+            ancho = self.tamano[0]
+        if alto is None:
+            alto = self.tamano[1]
+
+        with self.lock:
+            movidos, x_anterior, y_anterior = self.mundo.mover_todos(ancho, alto)
+
+            tamano_celda = self.grilla.tamano_celda
+            cambio_celda = (
+                (np.floor(x_anterior / tamano_celda) != np.floor(self.mundo.x[movidos] / tamano_celda)) |
+                (np.floor(y_anterior / tamano_celda) != np.floor(self.mundo.y[movidos] / tamano_celda))
+            )
+            entidades = self.mundo.entidades
+            for indice in movidos[cambio_celda]:
+                self.grilla.actualizar(entidades[indice])
+
+    def conviene_compactar(self) -> bool:
+        """Indica si las filas muertas del mundo son suficientes para compactarlo.
+
+        Mientras hay un diario abierto nunca conviene, porque el diario
+        identifica a las entidades por su fila.
+
+        Returns:
+            bool: True si `compactar()` liberaría al menos MIN_FILAS_COMPACTACION
+                filas y FRACCION_COMPACTACION de las ocupadas.
+        """
+        if self.diario is not None:
+            return False
+        n = self.mundo.n
+        muertas = n - int(np.count_nonzero(self.mundo.vivo[:n]))
+        return muertas >= max(self.MIN_FILAS_COMPACTACION, self.FRACCION_COMPACTACION * n)
+
+    def compactar(self) -> np.ndarray:
+        """Libera las filas del mundo de las entidades muertas y descarta sus tareas.
+
+        Las entidades vivas pueden cambiar de fila; quien guarde filas debe
+        traducirlas con el resultado. Las muertas dejan de ser vistas del
+        mundo y conservan sus últimos valores.
+
+        Returns:
+            np.ndarray: Fila nueva de cada fila anterior, o -1 si se liberó.
+        """
+        with self.lock:
+            remapeo = self.mundo.compactar()
+            vivas = np.flatnonzero(remapeo >= 0)
+            if vivas.size < len(self._categorias):
+                self._categorias = [self._categorias[i] for i in vivas.tolist()]
+            for presa in [presa for presa in self._huidas if not presa.estar_vivo]:
+                del self._huidas[presa]
+
+            activas = []
+            for thread in self.threads:
+                entidad = thread.animal if isinstance(thread, AnimalThread) else thread.planta
+                if entidad.estar_vivo and thread.is_alive():
+                    activas.append(thread)
+                else:
+                    thread.stop()
+            self.threads = activas
+            self.planificador.descartar_detenidas()
+            return remapeo
+
+    def notificar_movimiento(self, entidad: ABC):
+        """Actualiza el índice espacial cuando una entidad cambia de ubicación.
+
+        Args:
+            entidad (ABC): Entidad que se movió.
+        """
+        self.grilla.actualizar(entidad)
+
+    def notificar_muerte(self, entidad: ABC):
+        """Quita del índice espacial a una entidad que murió.
+
+        Args:
+            entidad (ABC): Entidad que dejó de estar viva.
+        """
+        self.grilla.eliminar(entidad)
+        self.raster_plantas.quitar(entidad)
+        if entidad._mundo is not None:
+            listos = self.listos_reproduccion.get(int(entidad._mundo.especie[entidad._indice]))
+            if listos is not None:
+                listos.discard(entidad)
+        self._muertes_pendientes += 1
+
+    def notificar_frutos(self, planta: Planta):
+        """Actualiza la tabla de plantas cuando una planta frutal gana o
+        pierde todos sus frutos.
+
+        Args:
+            planta (Planta): Planta frutal cuyos frutos cambiaron.
+        """
+        if planta.estar_vivo and planta.frutos > 0:
+            self.raster_plantas.agregar(planta)
+        else:
+            self.raster_plantas.quitar(planta)
+
+    def planta_cercana(self, pos: Tuple[float, float]) -> Tuple[Optional[Planta], float]:
+        """Obtiene la planta frutal con frutos más cercana a una posición.
+
+        Args:
+            pos (Tuple[float, float]): Posición de consulta.
+
+        Returns:
+            Tuple[Optional[Planta], float]: La planta y la distancia a ella,
+                o (None, inf) si ninguna planta tiene frutos.
+        """
+        return self.raster_plantas.planta_cercana(pos)
+
+    def pausar_simulacion(self):
+        """Pausa los comportamientos de todas las entidades."""
+        self.planificador.pausar()
+
+    def reanudar_simulacion(self):
+        """Reanuda los comportamientos de todas las entidades."""
+        self.planificador.reanudar_todo()
+
+    def detener_simulacion(self):
+        """Detiene definitivamente los comportamientos de todas las entidades."""
+        with self.lock:
+            for thread in self.threads:
+                thread.stop()
+        self.planificador.detener()
+
     def verificar_poblacion_minima(self):
         """Verifica y mantiene la población mínima de cada especie."""
         with self.lock:
@@ -182,35 +484,518 @@ class Ecosistema:
                     self.threads.append(thread)
                     thread.start()
 
+                # Pasar su estado a los arreglos del mundo e indexarla
+                indice = self.mundo.agregar(entidad)
+                self._categorias.append(tipo)
+                codigo = int(self.mundo.especie[indice])
+                if codigo == len(self._categoria_especie):
+                    self._categoria_especie.append(self.CATEGORIAS.index(tipo))
+                self.grilla.insertar(entidad)
+                entidad.ecosistema = self
+                if tipo == 'frutal':
+                    self.notificar_frutos(entidad)
+                self._entidades_nuevas.append(entidad)
+
                 return True
             except Exception as e:
                 print(f"Error al agregar entidad: {str(e)}")
                 return False
 
+    # Réplicas de entidades de otras regiones
+    def agregar_fantasmas(self, fantasmas: List[Animal], parejas: bool = True):
+        """Agrega réplicas de animales que pertenecen a otro ecosistema.
+
+        Los fantasmas solo se indexan en la grilla: se pueden cazar y, si
+        `parejas`, ser pareja de reproducción de los animales propios, pero
+        no se agregan al mundo, no se mueven ni tienen comportamiento. Lo
+        que les ocurra lo debe aplicar el ecosistema dueño del original.
+
+        Args:
+            fantasmas (List[Animal]): Copias independientes, sin ecosistema.
+            parejas (bool, optional): Si pueden ser pareja de reproducción.
+                Por defecto True.
+        """
+        with self.lock:
+            for fantasma in fantasmas:
+                self.grilla.insertar(fantasma)
+                if parejas and fantasma.listo_para_reproducirse:
+                    self._fantasmas_listos.setdefault(fantasma.__class__.__name__, set()).add(fantasma)
+            self._fantasmas.extend(fantasmas)
+
+    def quitar_fantasmas(self) -> List[Animal]:
+        """Quita todas las réplicas agregadas con `agregar_fantasmas()`.
+
+        Returns:
+            List[Animal]: Los fantasmas, con lo que les ocurrió mientras estaban.
+        """
+        with self.lock:
+            fantasmas, self._fantasmas = self._fantasmas, []
+            for fantasma in fantasmas:
+                self.grilla.eliminar(fantasma)
+                self._huidas.pop(fantasma, None)
+            self._fantasmas_listos.clear()
+        return fantasmas
+
+    # Persistencia
+    CATEGORIAS = ('carnivoro', 'herbivoro', 'frutal', 'floral')
+
+    def _grupo(self, categoria: str) -> Dict[str, List[ABC]]:
+        """Obtiene el diccionario por especie de una categoría de entidad."""
+        return {
+            'carnivoro': self.carnivoros,
+            'herbivoro': self.herbivoros,
+            'frutal': self.frutales,
+            'floral': self.florales,
+        }[categoria]
+
+    def capturar_estado(self) -> Instantanea:
+        """Toma una instantánea consistente del ecosistema.
+
+        Bajo el lock solo se copian las columnas del AlmacenMundo y los
+        slots locales de cada entidad viva, así la simulación queda detenida
+        el menor tiempo posible. Las presas que están huyendo se capturan
+        con su velocidad normal.
+
+        Returns:
+            Instantanea: Copia del estado; `a_estado()` construye sus organismos.
+        """
+        with self.lock:
+            n = self.mundo.n
+            columnas = {nombre: getattr(self.mundo, nombre)[:n].copy()
+                        for nombre in Instantanea.COLUMNAS}
+            for presa, (_, velocidad) in self._huidas.items():
+                columnas['velocidad'][presa._indice] = velocidad
+            vivos = columnas['vivo'].tolist()
+
+            entidades = {}
+            for categoria in self.CATEGORIAS:
+                entidades[categoria] = {}
+                for especie, lista in self._grupo(categoria).items():
+                    entidades[categoria][especie] = [
+                        (type(entidad), entidad._indice, Instantanea.leer_locales(entidad))
+                        for entidad in lista
+                        if entidad._mundo is not None and vivos[entidad._indice]
+                    ]
+
+            return Instantanea(tuple(self.tamano), self.tick, dict(self.recursos),
+                               columnas, entidades)
+
+    def capturar_cuadro(self) -> CuadroSimulacion:
+        """Copia lo necesario para dibujar las entidades vivas.
+
+        Bajo el lock solo se copian, con operaciones vectorizadas, las filas
+        vivas de las columnas de posición, especie y energía del AlmacenMundo.
+
+        Returns:
+            CuadroSimulacion: Cuadro del tick actual.
+        """
+        with self.lock:
+            mundo = self.mundo
+            ids = np.flatnonzero(mundo.vivo[:mundo.n])
+            especie = mundo.especie[ids]
+            categoria_especie = np.array(self._categoria_especie, dtype=np.int8)
+            return CuadroSimulacion(self.tick, mundo.especies, self.CATEGORIAS, ids,
+                                    mundo.x[ids], mundo.y[ids], especie,
+                                    categoria_especie[especie], mundo.energia[ids])
+
+    def iniciar_diario(self, ruta: str,
+                       intervalo_fotogramas: int = DiarioEventos.INTERVALO_FOTOGRAMAS) -> DiarioEventos:
+        """Empieza a registrar los cambios del ecosistema en un diario de eventos.
+
+        El primer registro es un fotograma clave del estado actual. Si ya
+        había un diario abierto se cierra.
+
+        Args:
+            ruta (str): Archivo del diario.
+            intervalo_fotogramas (int, optional): Ticks entre fotogramas clave.
+
+        Returns:
+            DiarioEventos: Diario abierto.
+        """
+        with self.lock:
+            self.detener_diario()
+            self.diario = DiarioEventos(ruta, intervalo_fotogramas)
+            self.diario.registrar_tick(self)
+            return self.diario
+
+    def detener_diario(self):
+        """Cierra el diario de eventos, si hay uno abierto."""
+        with self.lock:
+            if self.diario is not None:
+                self.diario.cerrar()
+                self.diario = None
+
+    def exportar_estado(self) -> dict:
+        """Obtiene una copia consistente del estado del ecosistema.
+
+        Las entidades vivas se copian como organismos independientes, sin
+        referencias al ecosistema ni a sus threads. Solo la captura se hace
+        bajo el lock; ver `capturar_estado()`.
+
+        Returns:
+            dict: Estado con las claves 'tamano', 'tick', 'recursos' y
+                'entidades' (categoría -> especie -> lista de organismos).
+        """
+        return self.capturar_estado().a_estado()
+
+    @classmethod
+    def desde_estado(cls, estado: dict, **kwargs) -> 'Ecosistema':
+        """Crea un ecosistema nuevo a partir de un estado exportado.
+
+        Args:
+            estado (dict | EstadoColumnar): Estado obtenido con
+                `exportar_estado` o cargado con GestorEstado.
+            **kwargs: Argumentos adicionales para el constructor.
+
+        Returns:
+            Ecosistema: Ecosistema con las entidades del estado en ejecución.
+        """
+        if hasattr(estado, 'a_estado'):
+            estado = estado.a_estado()
+        ecosistema = cls(tuple(estado['tamano']), **kwargs)
+        ecosistema.tick = estado.get('tick', 0)
+        ecosistema.recursos.update(estado.get('recursos', {}))
+        for categoria, especies in estado['entidades'].items():
+            for lista in especies.values():
+                for entidad in lista:
+                    ecosistema.agregar_entidad(entidad, categoria)
+        return ecosistema
+
+    # Motor de simulación
+    def step(self, n: int = 1):
+        """Avanza la simulación n pasos de tiempo fijo.
+
+        Cada paso ejecuta las fases siempre en el mismo orden: caza,
+        alimentación de herbívoros, reproducción de plantas, ciclo de vida
+        de plantas, movimiento y reproducción de animales, y balance de
+        poblaciones. No depende de ninguna interfaz gráfica.
+
+        Args:
+            n (int, optional): Cantidad de pasos a ejecutar. Por defecto 1.
+        """
+        for _ in range(n):
+            with self.lock:
+                self._fase_caza()
+                self._fase_alimentacion()
+                self._fase_reproduccion_plantas()
+                self._fase_plantas()
+                self._fase_animales()
+                self._fase_balance()
+                self._purgar_muertos()
+                self.tick += 1
+                if self.diario is not None:
+                    self.diario.registrar_tick(self)
+
+    def animales_vivos(self) -> List[Animal]:
+        """Obtiene los animales vivos, carnívoros primero.
+
+        Returns:
+            List[Animal]: Animales vivos del ecosistema.
+        """
+        return [animal
+                for grupo in (self.carnivoros, self.herbivoros)
+                for lista in grupo.values()
+                for animal in lista if animal.estar_vivo]
+
+    def plantas_vivas(self) -> List[Planta]:
+        """Obtiene las plantas vivas, frutales primero.
+
+        Returns:
+            List[Planta]: Plantas vivas del ecosistema.
+        """
+        return [planta
+                for grupo in (self.frutales, self.florales)
+                for lista in grupo.values()
+                for planta in lista if planta.estar_vivo]
+
+    def tomar_entidades_nuevas(self) -> List[ABC]:
+        """Entrega y olvida las entidades agregadas desde la última llamada.
+
+        Returns:
+            List[ABC]: Entidades nuevas en orden de llegada.
+        """
+        with self.lock:
+            nuevas, self._entidades_nuevas = self._entidades_nuevas, []
+        return nuevas
+
+    def tomar_registros(self) -> List[EventoEcosistema]:
+        """Entrega y olvida las acciones registradas desde la última llamada.
+
+        Returns:
+            List[EventoEcosistema]: Acciones en orden de ocurrencia.
+        """
+        with self.lock:
+            registros = list(self.registros)
+            self.registros.clear()
+        return registros
+
+    def registrar(self, tipo: str, origen: ABC, destino: Optional[object] = None, **datos):
+        """Agrega una acción al registro del ecosistema.
+
+        Args:
+            tipo (str): Nombre de la acción.
+            origen (ABC): Entidad que realizó la acción.
+            destino (Optional[object]): Entidad afectada, si la hay.
+            **datos: Información adicional de la acción.
+        """
+        self.registros.append(EventoEcosistema(tipo=tipo, origen=origen, destino=destino, datos=datos))
+        if self.diario is not None:
+            self.diario.registrar_evento(self.tick, tipo, origen, destino, datos, con_locales=True)
+
+    def _fase_caza(self):
+        """Cada carnívoro intenta cazar al herbívoro más cercano en su rango."""
+        for lista in self.carnivoros.values():
+            for depredador in lista:
+                if not depredador.estar_vivo:
+                    continue
+
+                presa_cercana = None
+                menor_distancia = float('inf')
+                x, y = depredador.ubicacion
+                for presa in self.vecinos_en_radio((x, y), depredador.rango_caza, Herbivoro):
+                    if presa is depredador:
+                        continue
+                    distancia = math.hypot(x - presa.ubicacion[0], y - presa.ubicacion[1])
+                    if distancia < depredador.rango_caza and distancia < menor_distancia:
+                        presa_cercana = presa
+                        menor_distancia = distancia
+
+                if presa_cercana:
+                    self._realizar_caza(depredador, presa_cercana)
+
+    def _realizar_caza(self, depredador: Animal, presa: Animal):
+        """Procesa un intento de caza y su resultado."""
+        if depredador.cazar(presa):
+            if depredador.alimentarse(presa):
+                self.mensaje_estado = (f"{depredador.__class__.__name__} cazó y se alimentó "
+                                       f"de {presa.__class__.__name__}")
+                self.registrar('Cazar', depredador, presa,
+                               detalles=f"Cazó exitosamente a un {presa.__class__.__name__}")
+        else:
+            self.mensaje_estado = f"{depredador.__class__.__name__} falló la caza"
+            self.registrar('Cazar', depredador, presa, detalles="Intento fallido")
+            self._hacer_huir_presa(presa)
+
+    def _hacer_huir_presa(self, presa: Animal):
+        """Hace que la presa huya en una dirección aleatoria y más rápido."""
+        if isinstance(presa, Herbivoro):
+            presa.huir()
+            self.registrar('Huir', presa, detalles="Escapó de un depredador")
+
+        presa.direccion = random.uniform(0, 2 * math.pi)
+        if presa not in self._huidas:
+            self._huidas[presa] = (self.tick + self.TICKS_HUIDA, presa.velocidad)
+            presa.velocidad *= 1.5
+
+        # Gastar energía al huir
+        presa.nivel_energia = max(0, presa.nivel_energia - 5)
+
+    def _fase_alimentacion(self):
+        """Los herbívoros con poca energía comen de la planta con frutos más cercana."""
+        for lista in self.herbivoros.values():
+            for herbivoro in lista:
+                if (not herbivoro.estar_vivo or not isinstance(herbivoro, Herbivoro) or
+                        herbivoro.nivel_energia >= 30):
+                    continue
+
+                planta, distancia = herbivoro.buscar_planta_cercana(pos_actual=herbivoro.ubicacion)
+                if not planta or distancia > Herbivoro.DISTANCIA_ALIMENTACION:
+                    continue
+
+                frutos_antes = planta.frutos
+                if herbivoro.alimentarse_de_planta(planta):
+                    frutos_consumidos = frutos_antes - planta.frutos
+                    self.mensaje_estado = (f"{herbivoro.__class__.__name__} consumió "
+                                           f"{frutos_consumidos} frutos de {planta.__class__.__name__}")
+                    self.registrar('alimentarse_planta', herbivoro, planta, frutos=frutos_consumidos)
+
+    def _fase_reproduccion_plantas(self):
+        """Cada planta puede brotar una nueva de su especie a cierta distancia."""
+        nuevas_plantas = []
+        for tipo, grupo in (('frutal', self.frutales), ('floral', self.florales)):
+            for lista in grupo.values():
+                for planta in lista:
+                    if not planta.estar_vivo or random.random() >= self.PROBABILIDAD_REPRODUCCION_PLANTAS:
+                        continue
+
+                    angulo = random.uniform(0, 2 * math.pi)
+                    radio = self.DISTANCIA_REPRODUCCION_PLANTAS
+                    pos_x = max(0, min(self.tamano[0], planta.ubicacion[0] + radio * math.cos(angulo)))
+                    pos_y = max(0, min(self.tamano[1], planta.ubicacion[1] + radio * math.sin(angulo)))
+
+                    nueva_planta = planta.__class__(self.ALTURA_BROTE[tipo], 0, (pos_x, pos_y), 100, 100)
+                    nuevas_plantas.append((nueva_planta, tipo))
+                    self.mensaje_estado = f"Nueva {nueva_planta.__class__.__name__} ha brotado!"
+                    self.registrar('Reproducción', nueva_planta, detalles="Nueva planta ha brotado")
+
+        for planta, tipo in nuevas_plantas:
+            self.agregar_entidad(planta, tipo)
+
+    def _fase_plantas(self):
+        """Las plantas vivas crecen, generan frutos y absorben agua."""
+        diario = self.diario
+        for planta in self.plantas_vivas():
+            # Algunos atributos, como el tiempo entre frutos, cambian sin evento
+            if diario is not None:
+                diario.registrar_cambio(planta)
+
+            if planta.crecer():
+                self.registrar('crecer', planta, detalles=f"{planta.altura:.2f}")
+
+            if hasattr(planta, 'generar_frutos') and planta.generar_frutos():
+                self.registrar('generar_frutos', planta, detalles=str(planta.frutos))
+
+            if planta.absorber_agua():
+                self.registrar('absorber_agua', planta, detalles=str(planta.nivel_agua))
+
+    def _fase_animales(self):
+        """Mueve a todos los animales y procesa acciones especiales y reproducción."""
+        self.mover_todos()
+
+        # Terminar las huidas que ya cumplieron su duración
+        for presa, (tick_fin, velocidad_original) in list(self._huidas.items()):
+            if self.tick >= tick_fin:
+                presa.velocidad = velocidad_original
+                del self._huidas[presa]
+
+        for animal in self.animales_vivos():
+            if isinstance(animal, Volador) and random.random() < 0.1:
+                animal.volar()
+                self.registrar('Volar', animal, detalles="Voló por el ecosistema")
+
+            if isinstance(animal, Nadador) and random.random() < 0.1:
+                animal.nadar()
+                self.registrar('Nadar', animal, detalles="Nadó en el ecosistema")
+
+        self._fase_reproduccion_animales()
+
+    def _actualizar_listos(self):
+        """Avanza el tiempo de reproducción de todos los animales y actualiza
+        los conjuntos de animales listos solo con los que cambiaron."""
+        nuevos, retirados = self.mundo.actualizar_reproduccion()
+        entidades = self.mundo.entidades
+        especie = self.mundo.especie
+        for indice in retirados:
+            listos = self.listos_reproduccion.get(int(especie[indice]))
+            if listos is not None:
+                listos.discard(entidades[indice])
+        for indice in nuevos:
+            self.listos_reproduccion.setdefault(int(especie[indice]), set()).add(entidades[indice])
+
+    def _fase_reproduccion_animales(self):
+        """Cada animal listo busca pareja entre los animales listos de su
+        especie que están dentro de su distancia de reproducción."""
+        self._actualizar_listos()
+
+        crias = []
+        for codigo, listos in self.listos_reproduccion.items():
+            fantasmas = self._fantasmas_listos.get(self.mundo.especies[codigo], set())
+            for animal in list(listos):
+                if animal not in listos:
+                    continue  # Ya se reprodujo como pareja en este tick
+
+                candidatos = [otro for otro in self.grilla.vecinos_en_radio(
+                                  animal.ubicacion, animal.DISTANCIA_REPRODUCCION)
+                              if otro in listos or otro in fantasmas]
+                cria = animal.intentar_reproduccion(candidatos)
+                if cria:
+                    tipo = 'carnivoro' if isinstance(cria, Carnivoro) else 'herbivoro'
+                    crias.append((cria, tipo))
+                    self.mensaje_estado = f"Nuevo {cria.__class__.__name__} ha nacido!"
+                    self.registrar('Reproducirse', animal, cria,
+                                   detalles=f"Dio nacimiento a un nuevo {cria.__class__.__name__}")
+
+                    # Los padres reiniciaron su tiempo y dejan de estar listos
+                    for padre in [animal] + candidatos:
+                        if not padre.listo_para_reproducirse:
+                            listos.discard(padre)
+                            fantasmas.discard(padre)
+
+        for cria, tipo in crias:
+            self.agregar_entidad(cria, tipo)
+
+    def _fase_balance(self):
+        """Mantiene el equilibrio entre carnívoros y herbívoros."""
+        carnivoros = sum(1 for lista in self.carnivoros.values() for a in lista if a.estar_vivo)
+        herbivoros = sum(1 for lista in self.herbivoros.values() for a in lista if a.estar_vivo)
+
+        # Si hay muy pocos herbívoros comparado con carnívoros, agregar algunos
+        if herbivoros < carnivoros * 2 and herbivoros < 5:
+            self.agregar_herbivoros_adicionales(3)
+
+        # Sin herbívoros los carnívoros pierden energía más rápido
+        if herbivoros == 0:
+            for lista in self.carnivoros.values():
+                for carnivoro in lista:
+                    carnivoro.nivel_energia = max(0, carnivoro.nivel_energia - 1)
+
+    def agregar_herbivoros_adicionales(self, cantidad: int):
+        """Agrega conejos o ciervos en posiciones aleatorias.
+
+        Args:
+            cantidad (int): Cantidad de herbívoros a agregar.
+        """
+        for _ in range(cantidad):
+            pos_x = random.uniform(50, self.tamano[0] - 50)
+            pos_y = random.uniform(50, self.tamano[1] - 50)
+
+            if random.random() < 0.5:
+                animal = Conejo("Conejo", 100, 4.0, (pos_x, pos_y))
+            else:
+                animal = Ciervo("Ciervo", 100, 3.0, (pos_x, pos_y))
+            self.agregar_entidad(animal, 'herbivoro')
+
+    def _purgar_muertos(self):
+        """Quita de las listas por especie a las entidades que murieron y,
+        si conviene, libera sus filas del mundo."""
+        if not self._muertes_pendientes:
+            return
+        self._muertes_pendientes = 0
+        for grupo in (self.carnivoros, self.herbivoros, self.frutales, self.florales):
+            for especie, lista in grupo.items():
+                grupo[especie] = [entidad for entidad in lista if entidad.estar_vivo]
+        if self.compactar_al_purgar and self.conviene_compactar():
+            self.compactar()
+
     def procesar_eventos(self):
-        """Procesa los eventos generados por los threads de los animales."""
+        """Procesa por lotes los eventos generados por los threads de los animales.
+
+        El lock se toma una sola vez por lote y cada evento se despacha con
+        la tabla de manejadores según su tipo.
+        """
         while True:
-            evento = self.cola_eventos.get()
+            lote = self.cola_eventos.get_lote(self.TAMANO_LOTE_EVENTOS, self.ESPERA_LOTE_EVENTOS)
+            inicio = time.perf_counter()
             with self.lock:
-                try:
-                    if evento.tipo == 'buscar_alimento':
-                        self.procesar_busqueda_alimento(evento)
-                    elif evento.tipo == 'mover':
-                        self.procesar_movimiento(evento)
-                    elif evento.tipo == 'descansar':
-                        self.procesar_descanso(evento)
-                    elif evento.tipo == 'interactuar':
-                        self.procesar_interaccion(evento)
-                    elif evento.tipo == 'absorber_agua':
-                        self.procesar_absorcion_agua(evento)
-                    elif evento.tipo == 'crecer':
-                        self.procesar_crecimiento(evento)
-                    elif evento.tipo == 'generar_frutos':
-                        self.procesar_generacion_frutos(evento)
-                    elif evento.tipo == 'reproducir_planta':
-                        self.procesar_reproduccion_planta(evento)
-                except Exception as e:
-                    print(f"Error al procesar evento: {str(e)}")
+                diario = self.diario
+                for evento in lote:
+                    manejador = self._manejadores.get(evento.tipo)
+                    if manejador is None:
+                        continue
+                    try:
+                        manejador(evento)
+                    except Exception as e:
+                        print(f"Error al procesar evento: {str(e)}")
+                    if diario is not None:
+                        diario.registrar_evento(self.tick, evento.tipo, evento.origen,
+                                                evento.destino, evento.datos)
+            self._registrar_lote(len(lote), time.perf_counter() - inicio)
+
+    def _registrar_lote(self, cantidad: int, duracion: float):
+        """Actualiza las estadísticas de rendimiento con un lote procesado.
+
+        Args:
+            cantidad (int): Eventos del lote.
+            duracion (float): Segundos que tomó procesarlo.
+        """
+        estadisticas = self.estadisticas_eventos
+        estadisticas['lotes'] += 1
+        estadisticas['eventos'] += cantidad
+        estadisticas['ultimo_lote'] = cantidad
+        estadisticas['duracion_ultimo_lote'] = duracion
+        if duracion > 0:
+            estadisticas['eventos_por_segundo'] = cantidad / duracion
+        estadisticas.update(self.cola_eventos.estadisticas())
 
     # Procesadores de eventos
     def procesar_busqueda_alimento(self, evento: EventoEcosistema):
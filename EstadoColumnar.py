@@ -0,0 +1,373 @@
+import importlib
+import json
+import mmap
+import os
+import struct
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+class EstadoColumnar:
+    """Estado del ecosistema guardado por columnas en un archivo binario.
+
+    Cada atributo de los organismos se guarda como una columna tipada y
+    contigua (posición, energía, agua, altura, frutos, tiempos de espera,
+    código de especie, etc.). El archivo empieza con una cabecera versionada
+    que describe las especies y la ubicación de cada columna; al cargarlo se
+    mapea en memoria con `mmap` y cada columna es un arreglo NumPy sobre ese
+    mapa, sin copiar datos. Los objetos Organismo solo se construyen si se
+    piden con `a_estado()`.
+
+    Las filas se ordenan por código de especie, así cada especie ocupa un
+    rango contiguo descrito en la cabecera.
+
+    Attributes:
+        ruta (str): Archivo cargado.
+        version (int): Versión del formato del archivo.
+        filas (int): Cantidad de organismos guardados.
+        tamano (tuple): Tamaño del ecosistema.
+        tick (int): Tick del ecosistema al guardar.
+        recursos (dict): Recursos del ecosistema al guardar.
+        especies (List[dict]): Por código de especie: categoría, módulo,
+            clase, nombre, fila de inicio y cantidad.
+        colores (List[str]): Colores de flores por código.
+        columnas (Dict[str, np.ndarray]): Columnas de solo lectura por nombre.
+    """
+
+    MAGIA = b'ECOCOL\x00\x00'
+    VERSION = 1
+    ALINEACION = 64
+    _PREFIJO = struct.Struct('<8sII')  # magia, versión, longitud de la cabecera
+
+    # Nombre de columna -> tipo NumPy
+    COLUMNAS = {
+        'especie': '<u2',
+        'x': '<f8',
+        'y': '<f8',
+        'energia': '<f8',
+        'edad': '<f8',
+        'peso': '<f8',
+        'velocidad': '<f8',
+        'direccion': '<f8',
+        'tiempo_reproduccion': '<i4',
+        'tiempo_entre_caza': '<i4',
+        'altura': '<f8',
+        'nivel_agua': '<f8',
+        'frutos': '<i4',
+        'tiempo_entre_frutos': '<i4',
+        'flores': '<i4',
+        'tiempo_entre_floracion': '<i4',
+        'color': '<i2',
+    }
+
+    # Slot del organismo -> columna que lo guarda
+    ATRIBUTOS = {
+        '_nivel_energia': 'energia',
+        '_edad': 'edad',
+        '_peso': 'peso',
+        '_velocidad': 'velocidad',
+        '_direccion': 'direccion',
+        '_tiempo_reproduccion': 'tiempo_reproduccion',
+        'tiempo_entre_caza': 'tiempo_entre_caza',
+        '_altura': 'altura',
+        '_nivel_agua': 'nivel_agua',
+        '_frutos': 'frutos',
+        'tiempo_entre_frutos': 'tiempo_entre_frutos',
+        'flores': 'flores',
+        'tiempo_entre_floracion': 'tiempo_entre_floracion',
+    }
+
+    # Slots que no se guardan como columna numérica directa
+    _ATRIBUTOS_ESPECIALES = ('_ubicacion', '_estar_vivo', '_especie', 'color_flores',
+                             'ecosistema', '_mundo', '_indice')
+
+    def __init__(self, ruta: str):
+        """Abre un archivo columnar y mapea sus columnas sin copiarlas.
+
+        Args:
+            ruta (str): Ruta del archivo.
+
+        Raises:
+            ValueError: Si el archivo no tiene el formato o la versión esperados.
+        """
+        self.ruta = ruta
+        with open(ruta, 'rb') as archivo:
+            self._mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magia, self.version, longitud = self._PREFIJO.unpack_from(self._mapa, 0)
+        if magia != self.MAGIA:
+            raise ValueError(f"No es un estado columnar: {ruta}")
+        if self.version > self.VERSION:
+            raise ValueError(f"Versión de estado no soportada: {self.version}")
+
+        inicio = self._PREFIJO.size
+        cabecera = json.loads(bytes(self._mapa[inicio:inicio + longitud]).decode('utf-8'))
+        self.filas = cabecera['filas']
+        self.tamano = tuple(cabecera['tamano'])
+        self.tick = cabecera['tick']
+        self.recursos = cabecera['recursos']
+        self.especies: List[dict] = cabecera['especies']
+        self.colores: List[str] = cabecera['colores']
+
+        self.columnas: Dict[str, np.ndarray] = {}
+        for columna in cabecera['columnas']:
+            self.columnas[columna['nombre']] = np.frombuffer(
+                self._mapa, dtype=columna['tipo'], count=self.filas,
+                offset=columna['desplazamiento'])
+
+    def __len__(self) -> int:
+        return self.filas
+
+    @classmethod
+    def leer_cabecera(cls, ruta: str) -> dict:
+        """Lee solo la cabecera de un archivo columnar, sin mapear sus columnas.
+
+        Args:
+            ruta (str): Ruta del archivo.
+
+        Returns:
+            dict: Cabecera con filas, tamaño, tick, recursos, especies,
+                colores y columnas.
+
+        Raises:
+            ValueError: Si el archivo no tiene el formato o la versión esperados.
+        """
+        with open(ruta, 'rb') as archivo:
+            prefijo = archivo.read(cls._PREFIJO.size)
+            if len(prefijo) < cls._PREFIJO.size:
+                raise ValueError(f"No es un estado columnar: {ruta}")
+            magia, version, longitud = cls._PREFIJO.unpack(prefijo)
+            if magia != cls.MAGIA:
+                raise ValueError(f"No es un estado columnar: {ruta}")
+            if version > cls.VERSION:
+                raise ValueError(f"Versión de estado no soportada: {version}")
+            return json.loads(archivo.read(longitud).decode('utf-8'))
+
+    def __getitem__(self, nombre: str) -> np.ndarray:
+        """Obtiene una columna por nombre."""
+        return self.columnas[nombre]
+
+    def filas_de_especie(self, codigo: int) -> slice:
+        """Obtiene el rango de filas de una especie.
+
+        Args:
+            codigo (int): Código de la especie.
+
+        Returns:
+            slice: Filas que ocupa la especie.
+        """
+        especie = self.especies[codigo]
+        return slice(especie['inicio'], especie['inicio'] + especie['cantidad'])
+
+    def bloques(self, tamano_region: float) -> List[dict]:
+        """Agrupa las filas por especie y por región cuadrada del mundo.
+
+        Args:
+            tamano_region (float): Lado de las regiones.
+
+        Returns:
+            List[dict]: Bloques con 'categoria', 'especie', 'region' ([rx, ry]),
+                'cantidad' y 'filas' (índices de sus filas).
+        """
+        bloques = []
+        for codigo, especie in enumerate(self.especies):
+            rango = self.filas_de_especie(codigo)
+            if rango.start == rango.stop:
+                continue
+            rx = (self.columnas['x'][rango] // tamano_region).astype(np.int64)
+            ry = (self.columnas['y'][rango] // tamano_region).astype(np.int64)
+            # Una sola clave entera por región, así basta un ordenamiento
+            ry_min = int(ry.min())
+            alto = int(ry.max()) - ry_min + 1
+            clave = rx * alto + (ry - ry_min)
+            orden = np.argsort(clave, kind='stable')
+            ordenadas = clave[orden]
+            cortes = np.flatnonzero(np.diff(ordenadas)) + 1
+            inicios = np.concatenate(([0], cortes)).tolist()
+            for inicio, filas in zip(inicios, np.split(orden + rango.start, cortes)):
+                x, y = divmod(int(ordenadas[inicio]), alto)
+                bloques.append({'categoria': especie['categoria'], 'especie': especie['clase'],
+                                'region': [x, y + ry_min], 'cantidad': len(filas), 'filas': filas})
+        return bloques
+
+    def cerrar(self):
+        """Libera el mapa del archivo; las columnas dejan de ser válidas."""
+        self.columnas = {}
+        try:
+            self._mapa.close()
+        except BufferError:
+            print("Error al cerrar estado columnar: hay columnas en uso")
+
+    @staticmethod
+    def _clase(especie: dict):
+        """Importa la clase de una especie descrita en la cabecera."""
+        return getattr(importlib.import_module(especie['modulo']), especie['clase'])
+
+    def a_estado(self, filas: Optional[np.ndarray] = None) -> dict:
+        """Construye los organismos guardados.
+
+        Args:
+            filas (Optional[np.ndarray], optional): Índices de las filas a
+                construir. Por defecto todas.
+
+        Returns:
+            dict: Estado con las claves de `Ecosistema.exportar_estado()`.
+        """
+        if filas is None:
+            filas = np.arange(self.filas)
+
+        # Convertir cada columna una sola vez a valores de Python
+        valores = {nombre: columna[filas].tolist() for nombre, columna in self.columnas.items()}
+        clases = [self._clase(especie) for especie in self.especies]
+        atributos = [[(nombre, self.ATRIBUTOS[nombre]) for nombre in clase._atributos()
+                      if nombre in self.ATRIBUTOS]
+                     for clase in clases]
+
+        entidades = {}
+        for i, codigo in enumerate(valores['especie']):
+            especie = self.especies[codigo]
+            clase = clases[codigo]
+            organismo = clase.__new__(clase)
+            organismo.ecosistema = None
+            organismo._mundo = None
+            organismo._indice = -1
+            organismo._estar_vivo = True
+            organismo._ubicacion = (valores['x'][i], valores['y'][i])
+            for nombre, columna in atributos[codigo]:
+                setattr(organismo, nombre, valores[columna][i])
+            if especie['nombre'] is not None:
+                organismo._especie = especie['nombre']
+            if valores['color'][i] >= 0:
+                organismo.color_flores = self.colores[valores['color'][i]]
+
+            por_especie = entidades.setdefault(especie['categoria'], {})
+            por_especie.setdefault(clase.__name__, []).append(organismo)
+
+        return {
+            'tamano': self.tamano,
+            'tick': self.tick,
+            'recursos': dict(self.recursos),
+            'entidades': entidades,
+        }
+
+    @classmethod
+    def escribir(cls, ruta: str, estado: dict) -> int:
+        """Guarda un estado exportado en formato columnar.
+
+        Args:
+            ruta (str): Archivo a escribir.
+            estado (dict): Estado obtenido con `Ecosistema.exportar_estado()`.
+
+        Returns:
+            int: Bytes escritos.
+
+        Raises:
+            ValueError: Si un organismo tiene atributos sin columna.
+        """
+        # Registrar especies y ordenar las filas por especie
+        especies: List[dict] = []
+        codigos: Dict[tuple, int] = {}
+        grupos: List[list] = []
+        for categoria, por_especie in estado['entidades'].items():
+            for lista in por_especie.values():
+                for organismo in lista:
+                    clase = type(organismo)
+                    nombre = getattr(organismo, '_especie', None)
+                    clave = (categoria, clase.__module__, clase.__name__, nombre)
+                    codigo = codigos.get(clave)
+                    if codigo is None:
+                        cls._validar_clase(clase)
+                        codigo = len(especies)
+                        codigos[clave] = codigo
+                        especies.append({'categoria': categoria, 'modulo': clase.__module__,
+                                         'clase': clase.__name__, 'nombre': nombre})
+                        grupos.append([])
+                    grupos[codigo].append(organismo)
+
+        filas = sum(len(grupo) for grupo in grupos)
+        columnas = {nombre: np.full(filas, -1 if np.dtype(tipo).kind == 'i' else np.nan, dtype=tipo)
+                    for nombre, tipo in cls.COLUMNAS.items() if nombre != 'especie'}
+        columnas['especie'] = np.empty(filas, dtype=cls.COLUMNAS['especie'])
+        colores: List[str] = []
+        codigos_color: Dict[str, int] = {}
+
+        inicio = 0
+        for codigo, grupo in enumerate(grupos):
+            fin = inicio + len(grupo)
+            especies[codigo]['inicio'] = inicio
+            especies[codigo]['cantidad'] = len(grupo)
+            columnas['especie'][inicio:fin] = codigo
+
+            ubicaciones = [organismo.ubicacion for organismo in grupo]
+            columnas['x'][inicio:fin] = [ubicacion[0] for ubicacion in ubicaciones]
+            columnas['y'][inicio:fin] = [ubicacion[1] for ubicacion in ubicaciones]
+            for nombre in type(grupo[0])._atributos():
+                columna = cls.ATRIBUTOS.get(nombre)
+                if columna is not None:
+                    columnas[columna][inicio:fin] = [getattr(organismo, nombre) for organismo in grupo]
+            if 'color_flores' in type(grupo[0])._atributos():
+                for i, organismo in enumerate(grupo, inicio):
+                    color = organismo.color_flores
+                    if color not in codigos_color:
+                        codigos_color[color] = len(colores)
+                        colores.append(color)
+                    columnas['color'][i] = codigos_color[color]
+            inicio = fin
+
+        # Ubicar cada columna alineada dentro de la sección de datos
+        relativos = []
+        desplazamiento = 0
+        for nombre in cls.COLUMNAS:
+            relativos.append(desplazamiento)
+            desplazamiento = cls._alinear(desplazamiento + columnas[nombre].nbytes)
+        descriptores = [{'nombre': nombre, 'tipo': tipo, 'desplazamiento': 0}
+                        for nombre, tipo in cls.COLUMNAS.items()]
+
+        cabecera = {
+            'filas': filas,
+            'tamano': list(estado['tamano']),
+            'tick': estado.get('tick', 0),
+            'recursos': estado.get('recursos', {}),
+            'especies': especies,
+            'colores': colores,
+            'columnas': descriptores,
+        }
+        # Los desplazamientos son absolutos, así que dependen de la longitud
+        # de la propia cabecera; se recalcula hasta que quede estable
+        inicio_datos = 0
+        while True:
+            for descriptor, relativo in zip(descriptores, relativos):
+                descriptor['desplazamiento'] = inicio_datos + relativo
+            datos_cabecera = json.dumps(cabecera).encode('utf-8')
+            nuevo_inicio = cls._alinear(cls._PREFIJO.size + len(datos_cabecera))
+            if nuevo_inicio == inicio_datos:
+                break
+            inicio_datos = nuevo_inicio
+
+        with open(ruta, 'wb') as archivo:
+            archivo.write(cls._PREFIJO.pack(cls.MAGIA, cls.VERSION, len(datos_cabecera)))
+            archivo.write(datos_cabecera)
+            for descriptor in descriptores:
+                archivo.write(b'\x00' * (descriptor['desplazamiento'] - archivo.tell()))
+                archivo.write(columnas[descriptor['nombre']].tobytes())
+            escritos = archivo.tell()
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        return escritos
+
+    @classmethod
+    def _alinear(cls, posicion: int) -> int:
+        """Redondea una posición al siguiente múltiplo de ALINEACION."""
+        return -(-posicion // cls.ALINEACION) * cls.ALINEACION
+
+    @classmethod
+    def _validar_clase(cls, clase):
+        """Verifica que todos los atributos de una clase tengan columna.
+
+        Raises:
+            ValueError: Si algún atributo no se puede guardar.
+        """
+        for nombre in clase._atributos():
+            if nombre not in cls.ATRIBUTOS and nombre not in cls._ATRIBUTOS_ESPECIALES:
+                raise ValueError(f"Atributo sin columna en {clase.__name__}: {nombre}")
@@ -0,0 +1,135 @@
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+
+class EstadoParcial:
+    """Estado guardado que construye sus entidades por bloques, a pedido.
+
+    El estado se describe con una lista de bloques, cada uno con las
+    entidades de una especie dentro de una región cuadrada del mundo (como
+    los bloques de un manifiesto de GestorEstado). Al abrirlo solo se leen
+    los bloques que cruzan la región y las especies pedidas; el resto se
+    lee la primera vez que se pide con `cargar()` o `a_estado()`. Cada
+    bloque se lee una sola vez.
+
+    Attributes:
+        tamano (tuple): Tamaño del ecosistema.
+        tick (int): Tick del ecosistema al guardar.
+        recursos (dict): Recursos del ecosistema al guardar.
+        tamano_region (float): Lado de las regiones de los bloques.
+        region (tuple): Rectángulo pedido al abrir, (x_min, y_min, x_max,
+            y_max), o None para todo el mundo.
+        especies (set): Especies o categorías pedidas al abrir, o None para todas.
+        entidades (dict): Categoría -> especie -> lista de organismos de la
+            región y especies pedidas al abrir.
+    """
+
+    def __init__(self, tamano: tuple, tick: int, recursos: dict, tamano_region: float,
+                 bloques: List[dict], leer: Callable[[dict], Optional[list]],
+                 region: Optional[Tuple[float, float, float, float]] = None,
+                 especies: Optional[Iterable[str]] = None):
+        """Abre el estado y construye solo las entidades pedidas.
+
+        Args:
+            tamano (tuple): Tamaño del ecosistema.
+            tick (int): Tick del ecosistema al guardar.
+            recursos (dict): Recursos del ecosistema al guardar.
+            tamano_region (float): Lado de las regiones de los bloques.
+            bloques (List[dict]): Bloques con 'categoria', 'especie',
+                'region' ([rx, ry]) y 'cantidad'.
+            leer (callable): Recibe un bloque y devuelve la lista de sus
+                organismos, o None si no se pudo leer.
+            region (tuple, opcional): Rectángulo (x_min, y_min, x_max, y_max)
+                a construir al abrir. Defaults to None.
+            especies (Iterable[str], opcional): Especies o categorías a
+                construir al abrir. Defaults to None.
+        """
+        self.tamano = tuple(tamano)
+        self.tick = tick
+        self.recursos = recursos
+        self.tamano_region = tamano_region
+        self._bloques = bloques
+        self._leer = leer
+        self._leidos: Dict[int, list] = {}
+
+        self.region = tuple(region) if region is not None else None
+        self.especies = set(especies) if especies is not None else None
+        self.entidades = self.cargar(self.region, self.especies)
+
+    def __len__(self) -> int:
+        """Cantidad total de organismos guardados, leídos o no."""
+        return sum(bloque['cantidad'] for bloque in self._bloques)
+
+    def _cruce(self, bloque: dict, region: Optional[tuple]) -> int:
+        """Compara la región de un bloque con un rectángulo.
+
+        Returns:
+            int: 0 si no se superponen, 1 si se superponen en parte y 2 si
+                el rectángulo contiene a toda la región del bloque.
+        """
+        if region is None:
+            return 2
+        x_min, y_min, x_max, y_max = region
+        rx, ry = bloque['region']
+        lado = self.tamano_region
+        izquierda, abajo = rx * lado, ry * lado
+        derecha, arriba = izquierda + lado, abajo + lado
+        if izquierda >= x_max or derecha <= x_min or abajo >= y_max or arriba <= y_min:
+            return 0
+        if x_min <= izquierda and derecha <= x_max and y_min <= abajo and arriba <= y_max:
+            return 2
+        return 1
+
+    def cargar(self, region: Optional[Tuple[float, float, float, float]] = None,
+               especies: Optional[Iterable[str]] = None) -> dict:
+        """Obtiene las entidades de una región y especies, leyendo los bloques que falten.
+
+        Args:
+            region (tuple, opcional): Rectángulo (x_min, y_min, x_max, y_max);
+                incluye los bordes mínimos y excluye los máximos. Defaults
+                to None (todo el mundo).
+            especies (Iterable[str], opcional): Nombres de especie o de
+                categoría. Defaults to None (todas).
+
+        Returns:
+            dict: Categoría -> especie -> lista de organismos.
+        """
+        if especies is not None:
+            especies = set(especies)
+
+        entidades = {}
+        for i, bloque in enumerate(self._bloques):
+            if especies is not None and bloque['especie'] not in especies \
+                    and bloque['categoria'] not in especies:
+                continue
+            cruce = self._cruce(bloque, region)
+            if cruce == 0:
+                continue
+
+            organismos = self._leidos.get(i)
+            if organismos is None:
+                organismos = self._leer(bloque)
+                if organismos is None:
+                    continue
+                self._leidos[i] = organismos
+
+            if cruce == 1:
+                x_min, y_min, x_max, y_max = region
+                organismos = [organismo for organismo in organismos
+                              if x_min <= organismo.ubicacion[0] < x_max
+                              and y_min <= organismo.ubicacion[1] < y_max]
+            por_especie = entidades.setdefault(bloque['categoria'], {})
+            por_especie.setdefault(bloque['especie'], []).extend(organismos)
+        return entidades
+
+    def a_estado(self) -> dict:
+        """Construye el estado completo, leyendo todos los bloques que falten.
+
+        Returns:
+            dict: Estado con las claves de `Ecosistema.exportar_estado()`.
+        """
+        return {
+            'tamano': self.tamano,
+            'tick': self.tick,
+            'recursos': dict(self.recursos),
+            'entidades': self.cargar(),
+        }
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(slots=True)
+class EventoEcosistema:
+    """Clase para representar un evento en el ecosistema.
+
+    Es el único tipo de evento que usan el ecosistema y los comportamientos
+    de animales y plantas. Usa `__slots__` para no reservar un diccionario
+    por cada evento encolado.
+
+    Attributes:
+        tipo (str): Tipo de evento, como 'mover', 'absorber_agua', 'crecer', etc.
+        origen (Optional[object]): Entidad que genera el evento.
+        destino (Optional[object]): Entidad que es el destino del evento, si aplica.
+        datos (dict): Información adicional sobre el evento.
+    """
+    tipo: str
+    origen: Optional[object]
+    destino: Optional[object]
+    datos: dict
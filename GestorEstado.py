@@ -1,60 +1,306 @@
+import hashlib
+import json
 import os
 import pickle
+import queue
+import struct
+import threading
 from datetime import datetime
 
+from EstadoColumnar import EstadoColumnar
+from EstadoParcial import EstadoParcial
+
 class GestorEstado:
     """Gestor para guardar y cargar estados del ecosistema.
 
     Esta clase proporciona funcionalidades para persistir y recuperar estados
     del ecosistema, permitiendo guardar el progreso y restaurarlo posteriormente.
 
+    Con el formato 'contenido' (por defecto) el estado se divide en bloques
+    por categoría, especie y región del mundo. Cada bloque se guarda una sola
+    vez en `objetos/`, con el hash SHA-256 de su contenido como nombre, y cada
+    guardado escribe un manifiesto JSON que enumera sus bloques. Los bloques
+    que no cambiaron entre guardados se reutilizan, así un guardado cuesta
+    espacio y tiempo proporcionales a lo que cambió. El formato 'columnar'
+    guarda cada atributo como una columna tipada en un archivo binario
+    (.eco) que se carga mapeado en memoria. El formato 'pickle' guarda todo
+    el estado en un único archivo.
+
+    `guardar_en_segundo_plano()` toma bajo el lock del ecosistema solo una
+    instantánea barata y deja la serialización y el `fsync` a un thread
+    escritor, con una cola acotada de guardados pendientes.
+
+    Cada guardado agrega una línea con sus metadatos (tick, población por
+    especie, tamaño del mundo, bytes) al catálogo `catalogo.jsonl` del
+    directorio, así listar, filtrar y ordenar miles de estados no requiere
+    abrir ninguno. Los archivos pickle empiezan con una cabecera de
+    metadatos de tamaño fijo, y los columnares y los manifiestos ya guardan
+    esos datos en su propia cabecera; con ellas se registran en el catálogo
+    los estados que no figuran en él.
+
+    `cargar_estado()` con una región o especies devuelve un EstadoParcial
+    que solo construye los bloques pedidos y lee los demás a pedido.
+
     Attributes:
         directorio (str): Ruta del directorio donde se almacenarán los estados.
+        formato (str): Formato de los nuevos guardados ('contenido',
+            'columnar' o 'pickle').
+        tamano_region (float): Lado de las regiones en que se divide el mundo.
+        maximo_pendientes (int): Guardados en segundo plano que pueden
+            esperar al escritor antes de rechazar nuevos.
+        ruta_catalogo (str): Archivo del catálogo de estados.
     """
 
-    def __init__(self, directorio='estados'):
+    FORMATOS = ('contenido', 'columnar', 'pickle')
+    EXTENSIONES = ('.json', '.eco', '.pkl')
+    TAMANO_REGION = 250
+    VERSION_MANIFIESTO = 1
+    MAXIMO_PENDIENTES = 2
+    CATALOGO = 'catalogo.jsonl'
+    MAGIA_METADATOS = b'ECOMETA\x00'
+    VERSION_METADATOS = 1
+    TAMANO_METADATOS = 4096
+    _PREFIJO_METADATOS = struct.Struct('<8sII')  # magia, versión, longitud de los metadatos
+    _FORMATO_POR_EXTENSION = dict(zip(EXTENSIONES, FORMATOS))
+
+    def __init__(self, directorio='estados', formato='contenido', tamano_region=TAMANO_REGION,
+                 maximo_pendientes=MAXIMO_PENDIENTES):
         """Inicializa el gestor de estados.
 
         Args:
             directorio (str, opcional): Ruta donde se guardarán los estados.
                 Defaults to 'estados'.
+            formato (str, opcional): Formato de los nuevos guardados.
+                Defaults to 'contenido'.
+            tamano_region (float, opcional): Lado de las regiones del formato
+                'contenido'. Defaults to TAMANO_REGION.
+            maximo_pendientes (int, opcional): Tamaño de la cola de guardados
+                en segundo plano. Defaults to MAXIMO_PENDIENTES.
+
+        Raises:
+            ValueError: Si el formato no es uno de FORMATOS.
         """
+        if formato not in self.FORMATOS:
+            raise ValueError(f"Formato desconocido: {formato}")
         self.directorio = directorio
-        os.makedirs(directorio, exist_ok=True)
+        self.formato = formato
+        self.tamano_region = tamano_region
+        self.directorio_objetos = os.path.join(directorio, 'objetos')
+        os.makedirs(self.directorio_objetos, exist_ok=True)
+
+        self.maximo_pendientes = maximo_pendientes
+        self._pendientes = queue.Queue(maxsize=maximo_pendientes)
+        self._escritor = None
+        self._lock_escritor = threading.Lock()
+
+        # Metadatos por nombre de archivo y bytes del catálogo ya leídos
+        self.ruta_catalogo = os.path.join(directorio, self.CATALOGO)
+        self._catalogo = {}
+        self._leido_catalogo = 0
+        self._lock_catalogo = threading.RLock()
+
+    def _ruta_nueva(self, extension):
+        """Obtiene una ruta con timestamp que no exista todavía."""
+        base = f"estado_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        ruta = os.path.join(self.directorio, base + extension)
+        contador = 1
+        while os.path.exists(ruta):
+            ruta = os.path.join(self.directorio, f"{base}_{contador}{extension}")
+            contador += 1
+        return ruta
+
+    def _ruta_objeto(self, hash_bloque):
+        """Obtiene la ruta de un bloque a partir de su hash."""
+        return os.path.join(self.directorio_objetos, hash_bloque[:2], hash_bloque[2:])
+
+    @staticmethod
+    def _escribir_atomico(ruta, datos):
+        """Escribe un archivo completo y sincronizado con el disco, o no lo escribe."""
+        temporal = f"{ruta}.tmp"
+        with open(temporal, 'wb') as archivo:
+            archivo.write(datos)
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        os.replace(temporal, ruta)
 
     def guardar_estado(self, estado):
         """Guarda el estado actual del ecosistema en un archivo.
 
         Serializa el estado actual y lo guarda en un archivo con timestamp
-        en el nombre para identificarlo unívocamente.
+        en el nombre para identificarlo unívocamente, y agrega sus
+        metadatos al catálogo.
 
         Args:
-            estado (object): Estado del ecosistema a guardar.
+            estado (object): Estado del ecosistema a guardar. Para los formatos
+                'contenido' y 'columnar' puede ser un Ecosistema, una
+                Instantanea o el diccionario que devuelve
+                `Ecosistema.exportar_estado()`.
 
         Returns:
-            str: Ruta completa del archivo donde se guardó el estado.
+            str: Ruta completa del archivo (o manifiesto) donde se guardó el estado.
 
         Example:
             >>> gestor = GestorEstado()
             >>> ruta = gestor.guardar_estado(mi_ecosistema)
             >>> print(f"Estado guardado en: {ruta}")
         """
-        nombre_archivo = f"estado_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pkl"
-        ruta_archivo = os.path.join(self.directorio, nombre_archivo)
+        if hasattr(estado, 'a_estado'):
+            estado = estado.a_estado()
+        if hasattr(estado, 'exportar_estado'):
+            estado = estado.exportar_estado()
 
-        with open(ruta_archivo, 'wb') as archivo:
-            pickle.dump(estado, archivo)
+        if self.formato == 'pickle':
+            ruta_archivo = self._ruta_nueva('.pkl')
+            cabecera = self._cabecera_metadatos(self._metadatos(estado, '.pkl'))
+            self._escribir_atomico(ruta_archivo, cabecera + pickle.dumps(estado))
+        elif self.formato == 'columnar':
+            ruta_archivo = self._ruta_nueva('.eco')
+            temporal = f"{ruta_archivo}.tmp"
+            EstadoColumnar.escribir(temporal, estado)
+            os.replace(temporal, ruta_archivo)
+        else:
+            ruta_archivo = self._guardar_bloques(estado)
 
+        self._registrar_en_catalogo(self.leer_metadatos(os.path.basename(ruta_archivo)))
         return ruta_archivo
 
-    def cargar_estado(self, ruta_archivo):
+    def guardar_en_segundo_plano(self, estado, al_terminar=None):
+        """Encola un guardado que se escribe en el thread escritor.
+
+        Si `estado` es un Ecosistema, en el thread que llama solo se toma su
+        instantánea con `capturar_estado()`; construir los organismos,
+        serializarlos y sincronizarlos con el disco ocurre en el escritor.
+
+        Args:
+            estado (object): Ecosistema, Instantanea o estado exportado.
+            al_terminar (callable, opcional): Se llama desde el thread
+                escritor como `al_terminar(ruta, error)`; `ruta` es None si
+                el guardado falló y `error` la excepción ocurrida.
+
+        Returns:
+            bool: True si el guardado se encoló, False si la cola de
+                guardados pendientes está llena.
+        """
+        if hasattr(estado, 'capturar_estado'):
+            estado = estado.capturar_estado()
+        try:
+            self._pendientes.put_nowait((estado, al_terminar))
+        except queue.Full:
+            print("Error al guardar estado: hay demasiados guardados pendientes")
+            return False
+
+        with self._lock_escritor:
+            if self._escritor is None:
+                self._escritor = threading.Thread(target=self._escribir_pendientes)
+                self._escritor.daemon = True
+                self._escritor.start()
+        return True
+
+    def _escribir_pendientes(self):
+        """Bucle del thread escritor: guarda los estados encolados en orden."""
+        while True:
+            estado, al_terminar = self._pendientes.get()
+            ruta, error = None, None
+            try:
+                ruta = self.guardar_estado(estado)
+            except Exception as e:
+                print(f"Error al guardar estado: {str(e)}")
+                error = e
+            finally:
+                self._pendientes.task_done()
+
+            if al_terminar is not None:
+                try:
+                    al_terminar(ruta, error)
+                except Exception as e:
+                    print(f"Error al notificar guardado: {str(e)}")
+
+    def guardados_pendientes(self):
+        """int: Guardados en segundo plano encolados o en escritura."""
+        return self._pendientes.unfinished_tasks
+
+    def esperar_guardados(self):
+        """Bloquea hasta que se terminen de escribir los guardados pendientes."""
+        self._pendientes.join()
+
+    def _dividir_en_bloques(self, estado):
+        """Agrupa las entidades por (categoría, especie, región).
+
+        Args:
+            estado (dict): Estado exportado del ecosistema.
+
+        Returns:
+            dict: Listas de entidades por clave (categoria, especie, (rx, ry)).
+        """
+        bloques = {}
+        for categoria, especies in estado['entidades'].items():
+            for especie, lista in especies.items():
+                for entidad in lista:
+                    x, y = entidad.ubicacion
+                    region = (int(x // self.tamano_region), int(y // self.tamano_region))
+                    bloques.setdefault((categoria, especie, region), []).append(entidad)
+        return bloques
+
+    def _guardar_bloques(self, estado):
+        """Guarda un estado como bloques direccionados por contenido más un manifiesto.
+
+        Args:
+            estado (dict): Estado exportado del ecosistema.
+
+        Returns:
+            str: Ruta del manifiesto escrito.
+        """
+        entradas = []
+        bytes_escritos = 0
+        for (categoria, especie, region), entidades in sorted(self._dividir_en_bloques(estado).items()):
+            datos = pickle.dumps(entidades, protocol=pickle.HIGHEST_PROTOCOL)
+            hash_bloque = hashlib.sha256(datos).hexdigest()
+            ruta_objeto = self._ruta_objeto(hash_bloque)
+            if not os.path.exists(ruta_objeto):
+                os.makedirs(os.path.dirname(ruta_objeto), exist_ok=True)
+                self._escribir_atomico(ruta_objeto, datos)
+                bytes_escritos += len(datos)
+            entradas.append({
+                'categoria': categoria,
+                'especie': especie,
+                'region': list(region),
+                'hash': hash_bloque,
+                'cantidad': len(entidades),
+                'bytes': len(datos),
+            })
+
+        manifiesto = {
+            'version': self.VERSION_MANIFIESTO,
+            'fecha': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'tamano': list(estado['tamano']),
+            'tick': estado.get('tick', 0),
+            'recursos': estado.get('recursos', {}),
+            'tamano_region': self.tamano_region,
+            'bloques': entradas,
+            'bytes_escritos': bytes_escritos,
+        }
+        ruta_manifiesto = self._ruta_nueva('.json')
+        self._escribir_atomico(ruta_manifiesto, json.dumps(manifiesto, indent=1).encode('utf-8'))
+        return ruta_manifiesto
+
+    def cargar_estado(self, ruta_archivo, region=None, especies=None):
         """Carga un estado previo desde un archivo.
 
         Args:
             ruta_archivo (str): Ruta del archivo que contiene el estado a cargar.
+                Si es un manifiesto (.json) el estado se rearma con sus bloques.
+            region (tuple, opcional): Rectángulo (x_min, y_min, x_max, y_max)
+                cuyas entidades se construyen al cargar. Defaults to None.
+            especies (Iterable[str], opcional): Especies o categorías que se
+                construyen al cargar. Defaults to None.
 
         Returns:
             object: Estado cargado del archivo, o None si el archivo no existe.
+                Para un manifiesto es un diccionario apto para
+                `Ecosistema.desde_estado()`; para un archivo columnar (.eco)
+                es un EstadoColumnar con las columnas mapeadas en memoria.
+                Si se indica `region` o `especies` es un EstadoParcial con
+                esas entidades en `entidades` y el resto leído a pedido.
 
         Raises:
             FileNotFoundError: Si el archivo especificado no existe.
@@ -64,33 +310,376 @@ class GestorEstado:
             >>> estado = gestor.cargar_estado("estados/mi_estado.pkl")
             >>> if estado:
             ...     print("Estado cargado exitosamente")
+            >>> parcial = gestor.cargar_estado("estados/mi_estado.json",
+            ...                                region=(0, 0, 500, 500), especies=['Leon'])
+            >>> leones = parcial.entidades['carnivoro']['Leon']
         """
         try:
+            if region is not None or especies is not None:
+                return self._cargar_parcial(ruta_archivo, region, especies)
+            if ruta_archivo.endswith('.json'):
+                return self._cargar_manifiesto(ruta_archivo)
+            if ruta_archivo.endswith('.eco'):
+                return EstadoColumnar(ruta_archivo)
             with open(ruta_archivo, 'rb') as archivo:
+                self._saltar_metadatos(archivo)
                 estado = pickle.load(archivo)
             return estado
         except FileNotFoundError:
             return None
 
-    def listar_estados(self):
+    def _cargar_parcial(self, ruta_archivo, region, especies):
+        """Abre un estado construyendo solo una región y especies.
+
+        Un manifiesto ya está dividido en bloques por especie y región, y
+        cada bloque se lee de su archivo al pedirlo. Un archivo columnar se
+        agrupa en bloques sobre sus columnas mapeadas y cada bloque construye
+        solo sus filas. Un pickle no se puede leer por partes: se carga
+        completo y solo se divide en bloques.
+
+        Args:
+            ruta_archivo (str): Ruta del estado.
+            region (tuple): Rectángulo (x_min, y_min, x_max, y_max), o None.
+            especies (Iterable[str]): Especies o categorías, o None.
+
+        Returns:
+            EstadoParcial: Estado con las entidades pedidas construidas.
+        """
+        if ruta_archivo.endswith('.json'):
+            with open(ruta_archivo, 'r', encoding='utf-8') as archivo:
+                manifiesto = json.load(archivo)
+            return EstadoParcial(manifiesto['tamano'], manifiesto['tick'], manifiesto['recursos'],
+                                 manifiesto['tamano_region'], manifiesto['bloques'],
+                                 self._leer_bloque, region, especies)
+
+        if ruta_archivo.endswith('.eco'):
+            columnar = EstadoColumnar(ruta_archivo)
+
+            def leer(bloque):
+                return [organismo
+                        for por_especie in columnar.a_estado(bloque['filas'])['entidades'].values()
+                        for lista in por_especie.values() for organismo in lista]
+
+            return EstadoParcial(columnar.tamano, columnar.tick, columnar.recursos,
+                                 self.tamano_region, columnar.bloques(self.tamano_region),
+                                 leer, region, especies)
+
+        with open(ruta_archivo, 'rb') as archivo:
+            self._saltar_metadatos(archivo)
+            estado = pickle.load(archivo)
+        bloques = [{'categoria': categoria, 'especie': especie, 'region': list(region_bloque),
+                    'cantidad': len(entidades), 'entidades': entidades}
+                   for (categoria, especie, region_bloque), entidades
+                   in self._dividir_en_bloques(estado).items()]
+        return EstadoParcial(estado['tamano'], estado.get('tick', 0), estado.get('recursos', {}),
+                             self.tamano_region, bloques, lambda bloque: bloque['entidades'],
+                             region, especies)
+
+    def _leer_bloque(self, entrada):
+        """Lee un bloque y verifica que su contenido coincida con su hash.
+
+        Args:
+            entrada (dict): Entrada del manifiesto que describe el bloque.
+
+        Returns:
+            list: Entidades del bloque, o None si el bloque está dañado.
+        """
+        with open(self._ruta_objeto(entrada['hash']), 'rb') as archivo:
+            datos = archivo.read()
+        if hashlib.sha256(datos).hexdigest() != entrada['hash']:
+            print(f"Error al cargar bloque {entrada['hash']}: contenido dañado")
+            return None
+        return pickle.loads(datos)
+
+    def _cargar_manifiesto(self, ruta_manifiesto):
+        """Rearma un estado a partir de un manifiesto y sus bloques.
+
+        Args:
+            ruta_manifiesto (str): Ruta del manifiesto.
+
+        Returns:
+            dict: Estado con las claves de `Ecosistema.exportar_estado()`, o
+                None si algún bloque está dañado.
+        """
+        with open(ruta_manifiesto, 'r', encoding='utf-8') as archivo:
+            manifiesto = json.load(archivo)
+
+        entidades = {}
+        for entrada in manifiesto['bloques']:
+            bloque = self._leer_bloque(entrada)
+            if bloque is None:
+                return None
+            especies = entidades.setdefault(entrada['categoria'], {})
+            especies.setdefault(entrada['especie'], []).extend(bloque)
+
+        return {
+            'tamano': tuple(manifiesto['tamano']),
+            'tick': manifiesto['tick'],
+            'recursos': manifiesto['recursos'],
+            'entidades': entidades,
+        }
+
+    def limpiar_objetos(self):
+        """Elimina los bloques que ningún manifiesto referencia.
+
+        Returns:
+            int: Cantidad de bloques eliminados.
+        """
+        referenciados = set()
+        for archivo in self.listar_estados():
+            if archivo.endswith('.json'):
+                with open(os.path.join(self.directorio, archivo), 'r', encoding='utf-8') as f:
+                    referenciados.update(entrada['hash'] for entrada in json.load(f)['bloques'])
+
+        eliminados = 0
+        for prefijo in os.listdir(self.directorio_objetos):
+            carpeta = os.path.join(self.directorio_objetos, prefijo)
+            for resto in os.listdir(carpeta):
+                if prefijo + resto not in referenciados:
+                    os.remove(os.path.join(carpeta, resto))
+                    eliminados += 1
+        return eliminados
+
+    # Metadatos y catálogo
+    @classmethod
+    def _resumen(cls, extension, fecha, tick, tamano, recursos, poblacion):
+        """Arma el diccionario de metadatos de un estado."""
+        return {
+            'formato': cls._FORMATO_POR_EXTENSION[extension],
+            'fecha': fecha,
+            'tick': tick,
+            'tamano': list(tamano),
+            'recursos': recursos,
+            'poblacion': poblacion,
+            'total': sum(poblacion.values()),
+        }
+
+    def _metadatos(self, estado, extension):
+        """Obtiene los metadatos de un estado exportado.
+
+        Args:
+            estado (dict): Estado exportado del ecosistema.
+            extension (str): Extensión del archivo en que se guarda.
+
+        Returns:
+            dict: Formato, fecha, tick, tamaño del mundo, recursos, población
+                por especie y población total.
+        """
+        poblacion = {}
+        for especies in estado['entidades'].values():
+            for especie, lista in especies.items():
+                poblacion[especie] = poblacion.get(especie, 0) + len(lista)
+        return self._resumen(extension, datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                             estado.get('tick', 0), estado['tamano'],
+                             estado.get('recursos', {}), poblacion)
+
+    @classmethod
+    def _cabecera_metadatos(cls, metadatos):
+        """Codifica los metadatos en una cabecera de TAMANO_METADATOS bytes.
+
+        Raises:
+            ValueError: Si los metadatos no caben en la cabecera.
+        """
+        datos = json.dumps(metadatos).encode('utf-8')
+        disponible = cls.TAMANO_METADATOS - cls._PREFIJO_METADATOS.size
+        if len(datos) > disponible:
+            raise ValueError(f"Metadatos demasiado grandes para la cabecera: {len(datos)} bytes")
+        prefijo = cls._PREFIJO_METADATOS.pack(cls.MAGIA_METADATOS, cls.VERSION_METADATOS, len(datos))
+        return prefijo + datos.ljust(disponible, b' ')
+
+    @classmethod
+    def _saltar_metadatos(cls, archivo):
+        """Deja un archivo pickle abierto al inicio de sus datos.
+
+        Returns:
+            dict: Metadatos de la cabecera, o None si el archivo no tiene.
+        """
+        cabecera = archivo.read(cls.TAMANO_METADATOS)
+        if len(cabecera) >= cls._PREFIJO_METADATOS.size:
+            magia, _, longitud = cls._PREFIJO_METADATOS.unpack_from(cabecera)
+            if magia == cls.MAGIA_METADATOS:
+                inicio = cls._PREFIJO_METADATOS.size
+                return json.loads(cabecera[inicio:inicio + longitud].decode('utf-8'))
+        archivo.seek(0)
+        return None
+
+    def leer_metadatos(self, archivo):
+        """Lee los metadatos de un estado desde su propia cabecera.
+
+        Solo se lee la cabecera: los metadatos de tamaño fijo de un pickle,
+        la cabecera de un archivo columnar o el manifiesto sin sus bloques.
+        Un pickle guardado antes de existir la cabecera se carga completo.
+
+        Args:
+            archivo (str): Nombre del archivo de estado.
+
+        Returns:
+            dict: Metadatos como los de `_metadatos()`, más el nombre del
+                archivo ('archivo') y su tamaño en bytes ('bytes'; para un
+                manifiesto, la suma de sus bloques).
+        """
+        ruta_archivo = os.path.join(self.directorio, archivo)
+        extension = os.path.splitext(archivo)[1]
+        fecha = datetime.fromtimestamp(os.path.getmtime(ruta_archivo)).strftime('%Y-%m-%d %H:%M:%S')
+        tamano_archivo = os.path.getsize(ruta_archivo)
+
+        if extension == '.pkl':
+            with open(ruta_archivo, 'rb') as f:
+                metadatos = self._saltar_metadatos(f)
+                if metadatos is None:
+                    metadatos = self._metadatos(pickle.load(f), extension)
+                    metadatos['fecha'] = fecha
+        elif extension == '.eco':
+            cabecera = EstadoColumnar.leer_cabecera(ruta_archivo)
+            poblacion = {}
+            for especie in cabecera['especies']:
+                poblacion[especie['clase']] = poblacion.get(especie['clase'], 0) + especie['cantidad']
+            metadatos = self._resumen(extension, fecha, cabecera['tick'], cabecera['tamano'],
+                                      cabecera['recursos'], poblacion)
+        else:
+            with open(ruta_archivo, 'r', encoding='utf-8') as f:
+                manifiesto = json.load(f)
+            poblacion = {}
+            for entrada in manifiesto['bloques']:
+                poblacion[entrada['especie']] = poblacion.get(entrada['especie'], 0) + entrada['cantidad']
+            tamano_archivo = sum(entrada['bytes'] for entrada in manifiesto['bloques'])
+            metadatos = self._resumen(extension, manifiesto['fecha'], manifiesto['tick'],
+                                      manifiesto['tamano'], manifiesto['recursos'], poblacion)
+
+        metadatos['archivo'] = archivo
+        metadatos['bytes'] = tamano_archivo
+        return metadatos
+
+    def _registrar_en_catalogo(self, metadatos):
+        """Agrega los metadatos de un estado al final del catálogo."""
+        linea = json.dumps(metadatos) + '\n'
+        with self._lock_catalogo:
+            with open(self.ruta_catalogo, 'a', encoding='utf-8') as archivo:
+                archivo.write(linea)
+
+    def _actualizar_catalogo(self):
+        """Lee las líneas agregadas al catálogo desde la última lectura.
+
+        Una línea final incompleta, de un guardado interrumpido, se ignora;
+        su estado se vuelve a registrar al listar desde su cabecera.
+        """
+        try:
+            with open(self.ruta_catalogo, 'rb') as archivo:
+                if os.fstat(archivo.fileno()).st_size < self._leido_catalogo:
+                    # El catálogo se reescribió: leerlo desde el principio
+                    self._catalogo = {}
+                    self._leido_catalogo = 0
+                archivo.seek(self._leido_catalogo)
+                datos = archivo.read()
+        except FileNotFoundError:
+            return
+
+        fin = datos.rfind(b'\n') + 1
+        for linea in datos[:fin].splitlines():
+            try:
+                metadatos = json.loads(linea)
+            except ValueError:
+                print("Error al leer catálogo: línea dañada")
+                continue
+            self._catalogo[metadatos['archivo']] = metadatos
+        self._leido_catalogo += fin
+
+    def _reescribir_catalogo(self):
+        """Reescribe el catálogo con una línea por estado existente."""
+        datos = ''.join(json.dumps(metadatos) + '\n' for metadatos in self._catalogo.values())
+        self._escribir_atomico(self.ruta_catalogo, datos.encode('utf-8'))
+        self._leido_catalogo = os.path.getsize(self.ruta_catalogo)
+
+    def listar_metadatos(self, filtro=None, ordenar_por=None, descendente=False):
+        """Obtiene los metadatos de los estados disponibles desde el catálogo.
+
+        Los estados del directorio que no figuran en el catálogo se leen
+        desde su cabecera y se registran; los que ya no existen se quitan.
+
+        Args:
+            filtro (callable, opcional): Recibe los metadatos de un estado y
+                devuelve True si se incluye. Defaults to None.
+            ordenar_por (str | callable, opcional): Campo de los metadatos
+                ('tick', 'total', 'fecha', 'bytes', ...), nombre de una
+                especie para ordenar por su población, o función que recibe
+                los metadatos y devuelve la clave. Por defecto se ordena por
+                nombre de archivo, es decir, por fecha de guardado.
+            descendente (bool, opcional): Invierte el orden. Defaults to False.
+
+        Returns:
+            list[dict]: Metadatos de cada estado; ver `leer_metadatos()`.
+
+        Example:
+            >>> gestor = GestorEstado()
+            >>> for info in gestor.listar_metadatos(
+            ...         filtro=lambda m: m['poblacion'].get('Leon', 0) > 10,
+            ...         ordenar_por='tick', descendente=True):
+            ...     print(info['archivo'], info['tick'], info['total'])
+        """
+        with self._lock_catalogo:
+            self._actualizar_catalogo()
+            presentes = {archivo for archivo in os.listdir(self.directorio)
+                         if archivo.endswith(self.EXTENSIONES)}
+
+            for archivo in sorted(presentes - self._catalogo.keys()):
+                try:
+                    metadatos = self.leer_metadatos(archivo)
+                except Exception as e:
+                    print(f"Error al leer metadatos de {archivo}: {str(e)}")
+                    continue
+                self._registrar_en_catalogo(metadatos)
+                self._catalogo[archivo] = metadatos
+
+            ausentes = self._catalogo.keys() - presentes
+            if ausentes:
+                for archivo in ausentes:
+                    del self._catalogo[archivo]
+                self._reescribir_catalogo()
+
+            entradas = sorted(self._catalogo.values(), key=lambda metadatos: metadatos['archivo'])
+
+        if filtro is not None:
+            entradas = [metadatos for metadatos in entradas if filtro(metadatos)]
+        if ordenar_por is not None:
+            if callable(ordenar_por):
+                clave = ordenar_por
+            else:
+                clave = lambda metadatos: (metadatos[ordenar_por] if ordenar_por in metadatos
+                                           else metadatos['poblacion'].get(ordenar_por, 0))
+            entradas.sort(key=clave, reverse=descendente)
+        elif descendente:
+            entradas.reverse()
+        return entradas
+
+    def listar_estados(self, filtro=None, ordenar_por=None, descendente=False):
         """Obtiene la lista de archivos de estado disponibles.
 
+        Se resuelve con el catálogo, sin abrir los estados; los argumentos
+        son los de `listar_metadatos()`.
+
+        Args:
+            filtro (callable, opcional): Filtro sobre los metadatos. Defaults to None.
+            ordenar_por (str | callable, opcional): Criterio de orden. Defaults to None.
+            descendente (bool, opcional): Invierte el orden. Defaults to False.
+
         Returns:
-            list[str]: Lista de nombres de archivos de estado (.pkl) en el directorio.
+            list[str]: Lista de nombres de archivos de estado (.pkl, .eco) y
+                de manifiestos (.json) en el directorio.
 
         Example:
             >>> gestor = GestorEstado()
-            >>> estados = gestor.listar_estados()
+            >>> estados = gestor.listar_estados(ordenar_por='total')
             >>> for estado in estados:
             ...     print(estado)
         """
-        return [archivo for archivo in os.listdir(self.directorio) if archivo.endswith('.pkl')]
+        return [metadatos['archivo']
+                for metadatos in self.listar_metadatos(filtro, ordenar_por, descendente)]
 
     def obtener_info_estado(self, archivo):
         """Obtiene información detallada de un archivo de estado.
 
-        Recopila metadatos sobre un archivo de estado específico, incluyendo
-        su nombre, tamaño y fecha de modificación.
+        Los datos salen del catálogo; si el estado no figura en él se leen
+        desde su cabecera y se registra.
 
         Args:
             archivo (str): Nombre del archivo de estado.
@@ -98,8 +687,13 @@ class GestorEstado:
         Returns:
             dict: Diccionario con la información del archivo:
                 - nombre (str): Nombre del archivo
-                - tamano (int): Tamaño en bytes
-                - fecha (str): Fecha de modificación en formato 'YYYY-MM-DD HH:MM:SS'
+                - tamano (int): Tamaño en bytes (para un manifiesto, la suma
+                  de sus bloques)
+                - fecha (str): Fecha de guardado en formato 'YYYY-MM-DD HH:MM:SS'
+                - tick (int): Tick del ecosistema al guardar
+                - tamano_mundo (list): Tamaño del ecosistema
+                - poblacion (dict): Cantidad de organismos por especie
+                - total (int): Cantidad total de organismos
 
         Example:
             >>> gestor = GestorEstado()
@@ -107,7 +701,19 @@ class GestorEstado:
             >>> print(f"Tamaño: {info['tamano']} bytes")
             >>> print(f"Fecha: {info['fecha']}")
         """
-        ruta_archivo = os.path.join(self.directorio, archivo)
-        tamano = os.path.getsize(ruta_archivo)
-        fecha = datetime.fromtimestamp(os.path.getmtime(ruta_archivo)).strftime('%Y-%m-%d %H:%M:%S')
-        return {'nombre': archivo, 'tamano': tamano, 'fecha': fecha}
\ No newline at end of file
+        with self._lock_catalogo:
+            self._actualizar_catalogo()
+            metadatos = self._catalogo.get(archivo)
+            if metadatos is None:
+                metadatos = self.leer_metadatos(archivo)
+                self._registrar_en_catalogo(metadatos)
+                self._catalogo[archivo] = metadatos
+        return {
+            'nombre': archivo,
+            'tamano': metadatos['bytes'],
+            'fecha': metadatos['fecha'],
+            'tick': metadatos['tick'],
+            'tamano_mundo': metadatos['tamano'],
+            'poblacion': metadatos['poblacion'],
+            'total': metadatos['total'],
+        }
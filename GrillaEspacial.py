@@ -0,0 +1,188 @@
+import math
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+
+class GrillaEspacial:
+    """Índice espacial de celdas uniformes para consultas de vecindad.
+
+    Divide el plano en celdas cuadradas y guarda en cada una las entidades
+    cuya ubicación cae dentro de ella. Una consulta por radio o por
+    rectángulo solo revisa las celdas que cubren el área, por lo que su
+    costo depende de la densidad local y no del total de entidades.
+
+    Attributes:
+        tamano_celda (float): Lado de cada celda.
+        celdas (Dict[Tuple[int, int], Set[object]]): Entidades por celda.
+        lock (Lock): Protege la grilla de accesos concurrentes.
+    """
+
+    def __init__(self, tamano_celda: float):
+        """Inicializa una grilla vacía.
+
+        Args:
+            tamano_celda (float): Lado de cada celda, normalmente el mayor
+                radio de consulta esperado.
+        """
+        self.tamano_celda = float(tamano_celda)
+        self.celdas: Dict[Tuple[int, int], Set[object]] = {}
+        self._celda_de: Dict[object, Tuple[int, int]] = {}
+        self.lock = threading.Lock()
+
+    def _celda(self, pos: Tuple[float, float]) -> Tuple[int, int]:
+        """Calcula la celda que contiene una posición."""
+        return (int(math.floor(pos[0] / self.tamano_celda)),
+                int(math.floor(pos[1] / self.tamano_celda)))
+
+    def insertar(self, entidad) -> bool:
+        """Agrega una entidad a la celda de su ubicación actual.
+
+        Args:
+            entidad (Organismo): Entidad a indexar.
+
+        Returns:
+            bool: True si la entidad tiene una ubicación válida y fue indexada.
+        """
+        if not isinstance(entidad.ubicacion, tuple):
+            return False
+        celda = self._celda(entidad.ubicacion)
+        with self.lock:
+            anterior = self._celda_de.get(entidad)
+            if anterior is not None:
+                self._quitar_de_celda(entidad, anterior)
+            self.celdas.setdefault(celda, set()).add(entidad)
+            self._celda_de[entidad] = celda
+        return True
+
+    def eliminar(self, entidad):
+        """Quita una entidad de la grilla si estaba indexada.
+
+        Args:
+            entidad (Organismo): Entidad a quitar.
+        """
+        with self.lock:
+            celda = self._celda_de.pop(entidad, None)
+            if celda is not None:
+                self._quitar_de_celda(entidad, celda)
+
+    def actualizar(self, entidad):
+        """Mueve una entidad de celda si su ubicación cambió de celda.
+
+        Args:
+            entidad (Organismo): Entidad cuya ubicación fue modificada.
+        """
+        celda = self._celda(entidad.ubicacion)
+        with self.lock:
+            anterior = self._celda_de.get(entidad)
+            if anterior is None or anterior == celda:
+                return
+            self._quitar_de_celda(entidad, anterior)
+            self.celdas.setdefault(celda, set()).add(entidad)
+            self._celda_de[entidad] = celda
+
+    def _quitar_de_celda(self, entidad, celda: Tuple[int, int]):
+        """Quita una entidad de una celda y descarta la celda si queda vacía."""
+        contenido = self.celdas.get(celda)
+        if contenido is not None:
+            contenido.discard(entidad)
+            if not contenido:
+                del self.celdas[celda]
+
+    def vecinos_en_radio(self, pos: Tuple[float, float], radio: float,
+                         filtro_tipo: Optional[type] = None) -> List[object]:
+        """Obtiene las entidades vivas a una distancia menor o igual a un radio.
+
+        Args:
+            pos (Tuple[float, float]): Centro de la búsqueda.
+            radio (float): Radio de búsqueda.
+            filtro_tipo (Optional[type]): Si se indica, solo se devuelven
+                entidades que sean instancia de este tipo.
+
+        Returns:
+            List[object]: Entidades encontradas dentro del radio.
+        """
+        x, y = pos
+        radio_cuadrado = radio * radio
+        cx_min, cy_min = self._celda((x - radio, y - radio))
+        cx_max, cy_max = self._celda((x + radio, y + radio))
+
+        vecinos = []
+        with self.lock:
+            for cx in range(cx_min, cx_max + 1):
+                for cy in range(cy_min, cy_max + 1):
+                    contenido = self.celdas.get((cx, cy))
+                    if not contenido:
+                        continue
+                    for entidad in contenido:
+                        if filtro_tipo is not None and not isinstance(entidad, filtro_tipo):
+                            continue
+                        if not entidad.estar_vivo:
+                            continue
+                        ex, ey = entidad.ubicacion
+                        dx = ex - x
+                        dy = ey - y
+                        if dx * dx + dy * dy <= radio_cuadrado:
+                            vecinos.append(entidad)
+        return vecinos
+
+    def _celdas_en_rectangulo(self, x_min: float, y_min: float, x_max: float, y_max: float):
+        """Recorre las celdas ocupadas que cruzan un rectángulo; requiere tener el lock.
+
+        Si el rectángulo cubre más celdas que las ocupadas, se recorren las
+        ocupadas en vez del rango completo.
+
+        Yields:
+            Tuple[Tuple[int, int], Set[object], bool]: Celda, su contenido y
+                si está completamente dentro del rectángulo.
+        """
+        cx_min, cy_min = self._celda((x_min, y_min))
+        cx_max, cy_max = self._celda((x_max, y_max))
+        lado = self.tamano_celda
+
+        if (cx_max - cx_min + 1) * (cy_max - cy_min + 1) > len(self.celdas):
+            candidatas = [(celda, contenido) for celda, contenido in self.celdas.items()
+                          if cx_min <= celda[0] <= cx_max and cy_min <= celda[1] <= cy_max]
+        else:
+            candidatas = []
+            for cx in range(cx_min, cx_max + 1):
+                for cy in range(cy_min, cy_max + 1):
+                    contenido = self.celdas.get((cx, cy))
+                    if contenido:
+                        candidatas.append(((cx, cy), contenido))
+
+        for (cx, cy), contenido in candidatas:
+            interior = (x_min <= cx * lado and (cx + 1) * lado <= x_max and
+                        y_min <= cy * lado and (cy + 1) * lado <= y_max)
+            yield (cx, cy), contenido, interior
+
+    def en_rectangulo(self, x_min: float, y_min: float, x_max: float, y_max: float) -> List[object]:
+        """Obtiene las entidades vivas cuya ubicación cae dentro de un rectángulo.
+
+        Las entidades de las celdas completamente interiores se toman sin
+        comparar su ubicación.
+
+        Args:
+            x_min (float): Borde izquierdo, incluido.
+            y_min (float): Borde superior, incluido.
+            x_max (float): Borde derecho, excluido.
+            y_max (float): Borde inferior, excluido.
+
+        Returns:
+            List[object]: Entidades encontradas dentro del rectángulo.
+        """
+        encontradas = []
+        with self.lock:
+            for _, contenido, interior in self._celdas_en_rectangulo(x_min, y_min, x_max, y_max):
+                if interior:
+                    encontradas.extend(entidad for entidad in contenido if entidad.estar_vivo)
+                    continue
+                for entidad in contenido:
+                    if not entidad.estar_vivo:
+                        continue
+                    ex, ey = entidad.ubicacion
+                    if x_min <= ex < x_max and y_min <= ey < y_max:
+                        encontradas.append(entidad)
+        return encontradas
+
+    def __len__(self):
+        return len(self._celda_de)
@@ -0,0 +1,102 @@
+from operator import attrgetter
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+# Lector de slots locales de cada clase concreta, creado una sola vez
+_LECTORES = {}
+
+
+class Instantanea:
+    """Copia consistente del estado del ecosistema tomada en un instante.
+
+    Se toma con `Ecosistema.capturar_estado()` bajo el lock del ecosistema y
+    solo copia lo indispensable: las columnas del AlmacenMundo, como copias
+    de arreglos NumPy, y por cada entidad viva una tupla con los slots que
+    no viven en el almacén. Construir los organismos independientes, que es
+    la parte costosa, se deja para `a_estado()`, que puede llamarse después
+    desde cualquier thread sin detener la simulación.
+
+    Attributes:
+        tamano (tuple): Tamaño del ecosistema.
+        tick (int): Tick del ecosistema al capturar.
+        recursos (dict): Recursos del ecosistema al capturar.
+        columnas (Dict[str, np.ndarray]): Copias de las columnas del almacén.
+        entidades (dict): Categoría -> especie -> lista de
+            (clase, fila en las columnas, valores de los slots locales).
+    """
+
+    __slots__ = ('tamano', 'tick', 'recursos', 'columnas', 'entidades')
+
+    # Columnas del AlmacenMundo necesarias para rearmar los organismos
+    COLUMNAS = ('x', 'y', 'energia', 'vivo', 'velocidad', 'direccion', 'tiempo_reproduccion')
+
+    def __init__(self, tamano: tuple, tick: int, recursos: dict,
+                 columnas: Dict[str, np.ndarray],
+                 entidades: Dict[str, Dict[str, List[Tuple[type, int, tuple]]]]):
+        self.tamano = tamano
+        self.tick = tick
+        self.recursos = recursos
+        self.columnas = columnas
+        self.entidades = entidades
+
+    def __len__(self) -> int:
+        return sum(len(lista) for especies in self.entidades.values()
+                   for lista in especies.values())
+
+    @staticmethod
+    def leer_locales(entidad) -> tuple:
+        """Obtiene los valores de los slots locales de una entidad.
+
+        Args:
+            entidad (Organismo): Entidad a leer.
+
+        Returns:
+            tuple: Valores en el orden de `_atributos_locales()` de su clase.
+        """
+        clase = type(entidad)
+        lector = _LECTORES.get(clase)
+        if lector is None:
+            nombres = clase._atributos_locales()
+            if len(nombres) == 1:
+                unico = attrgetter(nombres[0])
+                lector = lambda organismo: (unico(organismo),)
+            else:
+                lector = attrgetter(*nombres)
+            _LECTORES[clase] = lector
+        return lector(entidad)
+
+    def a_estado(self) -> dict:
+        """Construye los organismos independientes de la instantánea.
+
+        Returns:
+            dict: Estado con las claves de `Ecosistema.exportar_estado()`.
+        """
+        # Convertir cada columna una sola vez a valores de Python
+        valores = {nombre: columna.tolist() for nombre, columna in self.columnas.items()}
+        x, y = valores['x'], valores['y']
+
+        entidades = {}
+        for categoria, especies in self.entidades.items():
+            entidades[categoria] = {}
+            for especie, filas in especies.items():
+                copias = []
+                for clase, fila, locales in filas:
+                    organismo = clase.__new__(clase)
+                    for nombre, valor in zip(clase._atributos_locales(), locales):
+                        setattr(organismo, nombre, valor)
+                    organismo.ecosistema = None
+                    organismo._mundo = None
+                    organismo._indice = -1
+                    organismo._ubicacion = (x[fila], y[fila])
+                    for nombre, columna in clase._COLUMNAS_MUNDO.items():
+                        setattr(organismo, nombre, valores[columna][fila])
+                    copias.append(organismo)
+                entidades[categoria][especie] = copias
+
+        return {
+            'tamano': self.tamano,
+            'tick': self.tick,
+            'recursos': dict(self.recursos),
+            'entidades': entidades,
+        }
@@ -1,5 +1,9 @@
 from abc import ABC, abstractmethod
 
+# Nombres de los slots de cada clase concreta, calculados una sola vez
+_ATRIBUTOS_POR_CLASE = {}
+_LOCALES_POR_CLASE = {}
+
 
 class Organismo(ABC):
     """Clase base abstracta para todos los organismos del ecosistema.
@@ -14,8 +18,25 @@ class Organismo(ABC):
         peso (float): Peso actual del organismo.
         estar_vivo (bool): Estado vital del organismo.
         nivel_energia (float): Nivel actual de energía del organismo.
+        ecosistema (Ecosistema): Ecosistema al que pertenece, o None si no
+            ha sido agregado a ninguno.
+
+    Cuando el organismo se agrega a un ecosistema, su ubicación, energía y
+    estado vital pasan a vivir en la fila `_indice` del AlmacenMundo `_mundo`
+    y las propiedades leen y escriben directamente sobre esos arreglos.
+
+    Toda la jerarquía declara `__slots__`, así cada organismo ocupa solo
+    sus atributos y no un diccionario propio.
     """
 
+    __slots__ = ('_ubicacion', '_edad', '_peso', '_estar_vivo', '_nivel_energia',
+                 'ecosistema', '_mundo', '_indice')
+
+    # Slot -> columna del AlmacenMundo que lo guarda mientras está vinculado.
+    # La ubicación se guarda en las columnas 'x' e 'y'.
+    _COLUMNAS_MUNDO = {'_nivel_energia': 'energia', '_estar_vivo': 'vivo'}
+    _ATRIBUTOS_VINCULO = ('_ubicacion', 'ecosistema', '_mundo', '_indice')
+
     def __init__(self, ubicacion='', edad=0, peso=0, estar_vivo=True, nivel_energia=0):
         """Inicializa una nueva instancia de Organismo.
 
@@ -31,10 +52,95 @@ class Organismo(ABC):
         self._peso = peso
         self._estar_vivo = estar_vivo
         self._nivel_energia = nivel_energia
+        self.ecosistema = None
+        self._mundo = None
+        self._indice = -1
+
+    @classmethod
+    def _atributos(cls):
+        """Obtiene los nombres de todos los slots de la clase y sus bases."""
+        atributos = _ATRIBUTOS_POR_CLASE.get(cls)
+        if atributos is None:
+            atributos = tuple(nombre
+                              for clase in reversed(cls.__mro__)
+                              for nombre in clase.__dict__.get('__slots__', ()))
+            _ATRIBUTOS_POR_CLASE[cls] = atributos
+        return atributos
+
+    @classmethod
+    def _atributos_locales(cls):
+        """Obtiene los slots que no se guardan en el AlmacenMundo ni lo referencian."""
+        locales = _LOCALES_POR_CLASE.get(cls)
+        if locales is None:
+            locales = tuple(nombre for nombre in cls._atributos()
+                            if nombre not in cls._COLUMNAS_MUNDO
+                            and nombre not in cls._ATRIBUTOS_VINCULO)
+            _LOCALES_POR_CLASE[cls] = locales
+        return locales
+
+    def _valores_mundo(self) -> dict:
+        """Obtiene los valores que viven en el AlmacenMundo como atributos locales."""
+        valores = {nombre: getattr(self._mundo, columna)[self._indice].item()
+                   for nombre, columna in self._COLUMNAS_MUNDO.items()}
+        valores['_ubicacion'] = self.ubicacion
+        return valores
+
+    def __getstate__(self) -> dict:
+        """Obtiene el estado serializable del organismo.
+
+        No incluye la referencia al ecosistema ni al almacén; los valores
+        guardados en el almacén se copian a sus atributos locales, así la
+        copia resultante es un organismo independiente.
+
+        Returns:
+            dict: Atributos del organismo por nombre de slot.
+        """
+        estado = {nombre: getattr(self, nombre)
+                  for nombre in self._atributos() if hasattr(self, nombre)}
+        if self._mundo is not None:
+            estado.update(self._valores_mundo())
+        estado['ecosistema'] = None
+        estado['_mundo'] = None
+        estado['_indice'] = -1
+        return estado
+
+    def __setstate__(self, estado: dict):
+        """Restaura el organismo a partir de su estado serializado.
+
+        Args:
+            estado (dict): Atributos del organismo por nombre de slot.
+        """
+        for nombre, valor in estado.items():
+            setattr(self, nombre, valor)
+
+    def _vincular(self, mundo, indice: int):
+        """Convierte al organismo en vista de una fila del AlmacenMundo.
+
+        Los valores locales ya copiados al almacén se liberan.
+
+        Args:
+            mundo (AlmacenMundo): Almacén que guarda el estado.
+            indice (int): Fila asignada al organismo.
+        """
+        self._mundo = mundo
+        self._indice = indice
+        self._ubicacion = None
+        for nombre in self._COLUMNAS_MUNDO:
+            setattr(self, nombre, None)
+
+    def _desvincular(self):
+        """Deja de ser vista de su fila: los valores del almacén vuelven a
+        sus atributos locales, así la fila puede ocuparla otro organismo."""
+        for nombre, valor in self._valores_mundo().items():
+            setattr(self, nombre, valor)
+        self._mundo = None
+        self._indice = -1
 
     @property
     def ubicacion(self):
         """tuple: Obtiene las coordenadas actuales del organismo."""
+        if self._mundo is not None:
+            return self._mundo.ubicacion(self._indice)
         return self._ubicacion
 
     @property
@@ -50,11 +156,15 @@ class Organismo(ABC):
     @property
     def estar_vivo(self):
         """bool: Obtiene el estado vital actual del organismo."""
+        if self._mundo is not None:
+            return bool(self._mundo.vivo[self._indice])
         return self._estar_vivo
 
     @property
     def nivel_energia(self):
         """float: Obtiene el nivel actual de energía del organismo."""
+        if self._mundo is not None:
+            return float(self._mundo.energia[self._indice])
         return self._nivel_energia
 
     @ubicacion.setter
@@ -64,7 +174,12 @@ class Organismo(ABC):
         Args:
             ubicacion (tuple): Nuevas coordenadas (x, y).
         """
-        self._ubicacion = ubicacion
+        if self._mundo is not None:
+            self._mundo.x[self._indice], self._mundo.y[self._indice] = ubicacion
+        else:
+            self._ubicacion = ubicacion
+        if self.ecosistema is not None:
+            self.ecosistema.notificar_movimiento(self)
 
     @nivel_energia.setter
     def nivel_energia(self, nivel_energia):
@@ -73,7 +188,10 @@ class Organismo(ABC):
         Args:
             nivel_energia (float): Nuevo nivel de energía.
         """
-        self._nivel_energia = nivel_energia
+        if self._mundo is not None:
+            self._mundo.energia[self._indice] = nivel_energia
+        else:
+            self._nivel_energia = nivel_energia
 
     @edad.setter
     def edad(self, edad):
@@ -100,7 +218,12 @@ class Organismo(ABC):
         Args:
             estar_vivo (bool): Nuevo estado vital.
         """
-        self._estar_vivo = estar_vivo
+        if self._mundo is not None:
+            self._mundo.vivo[self._indice] = estar_vivo
+        else:
+            self._estar_vivo = estar_vivo
+        if not estar_vivo and self.ecosistema is not None:
+            self.ecosistema.notificar_muerte(self)
 
     @abstractmethod
     def alimentarse(self):
@@ -0,0 +1,94 @@
+from typing import List, Tuple
+
+import numpy as np
+
+
+class ParticionEspacial:
+    """División del mundo en una grilla de regiones rectangulares iguales.
+
+    Las regiones se numeran por filas: la región `fila * columnas + columna`.
+    Cada región es vecina de las hasta ocho que la rodean. El halo es la
+    franja alrededor de una región cuyas entidades deben verse desde ella
+    (el mayor radio de interacción); debe ser menor que el lado de las
+    regiones, así todo lo que está en el halo pertenece a una vecina.
+
+    Attributes:
+        tamano (Tuple[float, float]): Tamaño del mundo.
+        columnas (int): Regiones a lo ancho.
+        filas (int): Regiones a lo alto.
+        halo (float): Ancho de la franja visible alrededor de cada región.
+        ancho_region (float): Ancho de cada región.
+        alto_region (float): Alto de cada región.
+    """
+
+    def __init__(self, tamano: Tuple[float, float], columnas: int, filas: int, halo: float):
+        """Inicializa la partición.
+
+        Args:
+            tamano (Tuple[float, float]): Tamaño del mundo.
+            columnas (int): Regiones a lo ancho.
+            filas (int): Regiones a lo alto.
+            halo (float): Ancho de la franja visible alrededor de cada región.
+
+        Raises:
+            ValueError: Si la grilla no tiene al menos una región o las
+                regiones son más angostas que el halo.
+        """
+        if columnas < 1 or filas < 1:
+            raise ValueError(f"Partición inválida: {columnas}x{filas}")
+        self.tamano = tamano
+        self.columnas = columnas
+        self.filas = filas
+        self.halo = float(halo)
+        self.ancho_region = tamano[0] / columnas
+        self.alto_region = tamano[1] / filas
+        if min(self.ancho_region, self.alto_region) < self.halo:
+            raise ValueError(f"Regiones de {self.ancho_region:g}x{self.alto_region:g} "
+                             f"más angostas que el halo ({self.halo:g})")
+
+    def __len__(self) -> int:
+        return self.columnas * self.filas
+
+    def region_de(self, x, y) -> np.ndarray:
+        """Obtiene la región que contiene cada posición.
+
+        Las posiciones fuera del mundo se asignan a la región más cercana.
+
+        Args:
+            x (float | np.ndarray): Coordenadas x.
+            y (float | np.ndarray): Coordenadas y.
+
+        Returns:
+            np.ndarray: Número de región de cada posición.
+        """
+        columna = np.clip(np.floor_divide(x, self.ancho_region).astype(np.intp), 0, self.columnas - 1)
+        fila = np.clip(np.floor_divide(y, self.alto_region).astype(np.intp), 0, self.filas - 1)
+        return fila * self.columnas + columna
+
+    def rectangulo(self, region: int) -> Tuple[float, float, float, float]:
+        """Obtiene los bordes de una región.
+
+        Args:
+            region (int): Número de región.
+
+        Returns:
+            Tuple[float, float, float, float]: x_min, y_min, x_max, y_max.
+        """
+        fila, columna = divmod(region, self.columnas)
+        return (columna * self.ancho_region, fila * self.alto_region,
+                (columna + 1) * self.ancho_region, (fila + 1) * self.alto_region)
+
+    def vecinas(self, region: int) -> List[int]:
+        """Obtiene las regiones que rodean a una región, en orden creciente.
+
+        Args:
+            region (int): Número de región.
+
+        Returns:
+            List[int]: Regiones vecinas, incluidas las diagonales.
+        """
+        fila, columna = divmod(region, self.columnas)
+        return [f * self.columnas + c
+                for f in range(max(0, fila - 1), min(self.filas, fila + 2))
+                for c in range(max(0, columna - 1), min(self.columnas, columna + 2))
+                if (f, c) != (fila, columna)]
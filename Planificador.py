@@ -0,0 +1,194 @@
+import heapq
+import itertools
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import List, Optional, Set
+
+
+class Tarea(ABC):
+    """Comportamiento periódico de una entidad ejecutado por un planificador.
+
+    En lugar de tener un thread propio, cada tarea ejecuta un ciclo de
+    acciones y le indica al planificador cuánto tiempo esperar antes del
+    siguiente. Conserva la interfaz start/pause/resume/stop de un thread.
+
+    Attributes:
+        planificador (Planificador): Planificador que ejecuta la tarea.
+    """
+
+    __slots__ = ('planificador', '_pausada', '_detenida')
+
+    def __init__(self, planificador: 'Planificador'):
+        """Inicializa la tarea en estado activo.
+
+        Args:
+            planificador (Planificador): Planificador que ejecutará la tarea.
+        """
+        self.planificador = planificador
+        self._pausada = False
+        self._detenida = False
+
+    @abstractmethod
+    def ejecutar_ciclo(self) -> Optional[float]:
+        """Ejecuta un ciclo de acciones de la entidad.
+
+        Returns:
+            Optional[float]: Segundos a esperar antes del próximo ciclo, o None
+                si la tarea terminó.
+        """
+        pass
+
+    def start(self):
+        """Entrega la tarea al planificador para que empiece a ejecutarse."""
+        self.planificador.agregar(self)
+
+    def pause(self):
+        """Pausa la tarea; deja de ejecutarse hasta que se llame a `resume()`."""
+        self._pausada = True
+
+    def resume(self):
+        """Reanuda la tarea si estaba pausada."""
+        self._pausada = False
+        self.planificador.reanudar(self)
+
+    def stop(self):
+        """Detiene la tarea definitivamente."""
+        self._detenida = True
+
+    def is_alive(self) -> bool:
+        """bool: True mientras la tarea no haya sido detenida."""
+        return not self._detenida
+
+
+class Planificador:
+    """Ejecuta las tareas de todas las entidades sobre un grupo fijo de threads.
+
+    Las tareas esperan en una cola de prioridad ordenada por el momento de
+    su próxima ejecución. Cada trabajador toma la tarea más próxima, ejecuta
+    un ciclo y la vuelve a encolar con la espera que la tarea indique, por
+    lo que la cantidad de threads no depende de la cantidad de entidades.
+
+    Attributes:
+        num_trabajadores (int): Cantidad de threads trabajadores.
+        trabajadores (List[Thread]): Threads trabajadores.
+    """
+
+    def __init__(self, num_trabajadores: int = 4):
+        """Inicializa el planificador y arranca sus trabajadores.
+
+        Args:
+            num_trabajadores (int, optional): Cantidad de threads. Por defecto 4.
+        """
+        self.num_trabajadores = num_trabajadores
+        self._cola: List[tuple] = []
+        self._secuencia = itertools.count()
+        self._condicion = threading.Condition()
+        self._estacionadas: Set[Tarea] = set()
+        self._pausado = False
+        self._detenido = False
+
+        self.trabajadores: List[threading.Thread] = []
+        for _ in range(num_trabajadores):
+            trabajador = threading.Thread(target=self._trabajar)
+            trabajador.daemon = True
+            trabajador.start()
+            self.trabajadores.append(trabajador)
+
+    def agregar(self, tarea: Tarea, demora: float = 0.0):
+        """Programa la próxima ejecución de una tarea.
+
+        Args:
+            tarea (Tarea): Tarea a programar.
+            demora (float, optional): Segundos hasta la ejecución. Por defecto 0.
+        """
+        with self._condicion:
+            heapq.heappush(self._cola, (time.monotonic() + demora, next(self._secuencia), tarea))
+            self._condicion.notify()
+
+    def reanudar(self, tarea: Tarea):
+        """Vuelve a programar una tarea que quedó estacionada por estar pausada.
+
+        Args:
+            tarea (Tarea): Tarea reanudada.
+        """
+        with self._condicion:
+            if tarea in self._estacionadas:
+                self._estacionadas.discard(tarea)
+                heapq.heappush(self._cola, (time.monotonic(), next(self._secuencia), tarea))
+                self._condicion.notify()
+
+    def pausar(self):
+        """Pausa la ejecución de todas las tareas."""
+        with self._condicion:
+            self._pausado = True
+
+    def reanudar_todo(self):
+        """Reanuda la ejecución de todas las tareas."""
+        with self._condicion:
+            self._pausado = False
+            self._condicion.notify_all()
+
+    def detener(self):
+        """Detiene a los trabajadores; las tareas pendientes no se ejecutan."""
+        with self._condicion:
+            self._detenido = True
+            self._cola.clear()
+            self._estacionadas.clear()
+            self._condicion.notify_all()
+
+    def descartar_detenidas(self):
+        """Quita de la cola las tareas detenidas que todavía esperan su turno.
+
+        Mientras el planificador está pausado nadie las saca de la cola.
+        """
+        with self._condicion:
+            self._cola = [programada for programada in self._cola if not programada[2]._detenida]
+            heapq.heapify(self._cola)
+            self._estacionadas = {tarea for tarea in self._estacionadas if not tarea._detenida}
+
+    def pendientes(self) -> int:
+        """int: Cantidad de tareas programadas o estacionadas."""
+        with self._condicion:
+            return len(self._cola) + len(self._estacionadas)
+
+    def _siguiente(self) -> Optional[Tarea]:
+        """Espera y extrae la próxima tarea cuyo momento ya llegó."""
+        with self._condicion:
+            while True:
+                if self._detenido:
+                    return None
+                if self._pausado or not self._cola:
+                    self._condicion.wait()
+                    continue
+                espera = self._cola[0][0] - time.monotonic()
+                if espera > 0:
+                    self._condicion.wait(espera)
+                    continue
+                return heapq.heappop(self._cola)[2]
+
+    def _trabajar(self):
+        """Ciclo principal de cada thread trabajador."""
+        while True:
+            tarea = self._siguiente()
+            if tarea is None:
+                return
+            if tarea._detenida:
+                continue
+
+            if tarea._pausada:
+                with self._condicion:
+                    if tarea._pausada:
+                        self._estacionadas.add(tarea)
+                        continue
+                self.agregar(tarea)
+                continue
+
+            try:
+                demora = tarea.ejecutar_ciclo()
+            except Exception as e:
+                print(f"Error al ejecutar tarea: {str(e)}")
+                demora = 1.0
+
+            if demora is not None and not tarea._detenida:
+                self.agregar(tarea, demora)
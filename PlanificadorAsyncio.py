@@ -0,0 +1,133 @@
+import asyncio
+import threading
+from typing import Dict, Optional, Set
+
+from Planificador import Tarea
+
+
+class PlanificadorAsyncio:
+    """Ejecuta las tareas de todas las entidades como corrutinas de asyncio.
+
+    Alternativa al Planificador de threads: cada tarea es una corrutina que
+    ejecuta un ciclo y luego espera con `asyncio.sleep`, y un único thread
+    corre el event loop. Una entidad en espera cuesta una corrutina en lugar
+    de un thread. Ofrece la misma interfaz que Planificador, por lo que las
+    tareas no distinguen cuál de los dos las ejecuta.
+
+    Attributes:
+        loop (AbstractEventLoop): Event loop donde corren las tareas.
+        thread (Thread): Thread que ejecuta el event loop.
+    """
+
+    def __init__(self):
+        """Crea el event loop y lo arranca en su propio thread."""
+        self.loop = asyncio.new_event_loop()
+        self._activo = asyncio.Event()
+        self._activo.set()
+        self._corrutinas: Dict[Tarea, asyncio.Task] = {}
+        self._estacionadas: Set[Tarea] = set()
+
+        self.thread = threading.Thread(target=self._correr_loop)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def _correr_loop(self):
+        """Ejecuta el event loop hasta que se detenga el planificador."""
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+        self.loop.close()
+
+    def agregar(self, tarea: Tarea, demora: float = 0.0):
+        """Crea la corrutina de una tarea. Puede llamarse desde cualquier thread.
+
+        Args:
+            tarea (Tarea): Tarea a ejecutar.
+            demora (float, optional): Segundos antes del primer ciclo. Por defecto 0.
+        """
+        if not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self._lanzar, tarea, demora)
+
+    def reanudar(self, tarea: Tarea):
+        """Vuelve a lanzar una tarea que quedó estacionada por estar pausada.
+
+        Args:
+            tarea (Tarea): Tarea reanudada.
+        """
+        if not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self._reanudar_en_loop, tarea)
+
+    def pausar(self):
+        """Pausa la ejecución de todas las tareas."""
+        if not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self._activo.clear)
+
+    def reanudar_todo(self):
+        """Reanuda la ejecución de todas las tareas."""
+        if not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self._activo.set)
+
+    def detener(self):
+        """Cancela todas las corrutinas y detiene el event loop."""
+        if not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self._detener_en_loop)
+
+    def descartar_detenidas(self):
+        """Cancela las corrutinas de las tareas detenidas que siguen esperando,
+        por ejemplo mientras el planificador está pausado."""
+        if not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self._descartar_en_loop)
+
+    def pendientes(self) -> int:
+        """int: Cantidad de tareas en ejecución o estacionadas."""
+        return len(self._corrutinas) + len(self._estacionadas)
+
+    def _lanzar(self, tarea: Tarea, demora: float):
+        """Crea la corrutina de una tarea dentro del event loop."""
+        corrutina = self.loop.create_task(self._ejecutar(tarea, demora))
+        self._corrutinas[tarea] = corrutina
+        corrutina.add_done_callback(lambda _: self._olvidar(tarea, corrutina))
+
+    def _olvidar(self, tarea: Tarea, corrutina: asyncio.Task):
+        """Olvida la corrutina terminada de una tarea, salvo que ya la hayan relanzado."""
+        if self._corrutinas.get(tarea) is corrutina:
+            del self._corrutinas[tarea]
+
+    def _reanudar_en_loop(self, tarea: Tarea):
+        """Relanza una tarea estacionada dentro del event loop."""
+        if tarea in self._estacionadas:
+            self._estacionadas.discard(tarea)
+            self._lanzar(tarea, 0.0)
+
+    def _descartar_en_loop(self):
+        """Cancela las corrutinas de las tareas detenidas dentro del event loop."""
+        for tarea, corrutina in list(self._corrutinas.items()):
+            if tarea._detenida:
+                corrutina.cancel()
+        self._estacionadas = {tarea for tarea in self._estacionadas if not tarea._detenida}
+
+    def _detener_en_loop(self):
+        """Cancela las corrutinas y detiene el event loop."""
+        for corrutina in list(self._corrutinas.values()):
+            corrutina.cancel()
+        self._estacionadas.clear()
+        self.loop.stop()
+
+    async def _ejecutar(self, tarea: Tarea, demora: Optional[float]):
+        """Corrutina que repite los ciclos de una tarea hasta que termine."""
+        await asyncio.sleep(demora)
+        while not tarea._detenida:
+            await self._activo.wait()
+
+            if tarea._pausada:
+                self._estacionadas.add(tarea)
+                return
+
+            try:
+                demora = tarea.ejecutar_ciclo()
+            except Exception as e:
+                print(f"Error al ejecutar tarea: {str(e)}")
+                demora = 1.0
+
+            if demora is None:
+                return
+            await asyncio.sleep(demora)
@@ -1,29 +1,15 @@
-import threading
-import time
 import random
-from dataclasses import dataclass
 from typing import Optional
 
-@dataclass
-class EventoEcosistema:
-    """Clase para representar eventos dentro del ecosistema.
+from EventoEcosistema import EventoEcosistema
+from Planificador import Tarea
 
-    Attributes:
-        tipo (str): Tipo de evento, como 'absorber_agua', 'crecer', etc.
-        origen (Optional[object]): Objeto que genera el evento.
-        destino (Optional[object]): Objeto destino del evento, si aplica.
-        datos (dict): Información adicional relevante para el evento.
-    """
-    tipo: str
-    origen: Optional[object]
-    destino: Optional[object]
-    datos: dict
-
-class PlantaThread(threading.Thread):
+class PlantaThread(Tarea):
     """Clase que maneja el comportamiento concurrente de cada planta en el ecosistema.
 
-    Esta clase extiende threading.Thread y permite que las plantas ejecuten
-    sus acciones en paralelo a otras instancias del ecosistema.
+    El comportamiento se ejecuta como una tarea del planificador del
+    ecosistema, de modo que las plantas actúan en paralelo a otras
+    instancias sin ocupar un thread cada una.
 
     Attributes:
         planta (Planta): Instancia de la planta asociada al thread.
@@ -34,6 +20,12 @@ class PlantaThread(threading.Thread):
         contador_reproduccion (int): Contador de ciclos para la reproducción.
     """
 
+    # Constantes específicas para plantas
+    TIEMPO_CRECIMIENTO = 200  # Ciclos necesarios para crecer
+    TIEMPO_REPRODUCCION = 300  # Ciclos necesarios para reproducirse
+
+    __slots__ = ('planta', 'ecosistema', 'contador_crecimiento', 'contador_reproduccion')
+
     def __init__(self, planta: 'Planta', ecosistema: 'Ecosistema'):
         """Inicializa una nueva instancia de PlantaThread.
 
@@ -41,38 +33,28 @@ class PlantaThread(threading.Thread):
             planta (Planta): La planta asociada a este thread.
             ecosistema (Ecosistema): El ecosistema al que pertenece la planta.
         """
-        super().__init__()
+        super().__init__(ecosistema.planificador)
         self.planta = planta
         self.ecosistema = ecosistema
-        self.daemon = True
-        self._paused = threading.Event()
-        self._stopped = threading.Event()
-        self._paused.set()
-
-        # Constantes específicas para plantas
-        self.TIEMPO_CRECIMIENTO = 200  # Ciclos necesarios para crecer
-        self.TIEMPO_REPRODUCCION = 300  # Ciclos necesarios para reproducirse
         self.contador_crecimiento = 0
         self.contador_reproduccion = 0
 
-    def run(self):
-        """Método principal que se ejecuta en el hilo.
+    def ejecutar_ciclo(self) -> Optional[float]:
+        """Ejecuta un ciclo de acciones de la planta.
 
-        Este método controla el ciclo de vida de la planta y ejecuta sus
-        acciones en intervalos definidos hasta que el thread se detiene.
+        Returns:
+            Optional[float]: Segundos hasta el próximo ciclo, o None si la
+                planta murió.
         """
-        while not self._stopped.is_set():
-            self._paused.wait()
-
-            if not self.planta.estar_vivo:
-                self.stop()
-                break
+        if not self.planta.estar_vivo:
+            self.stop()
+            return None
 
-            # Realizar acciones de la planta
-            self.realizar_acciones()
+        # Realizar acciones de la planta
+        self.realizar_acciones()
 
-            # Esperar un tiempo aleatorio, simulando el ritmo lento de las plantas
-            time.sleep(random.uniform(1.0, 3.0))
+        # Esperar un tiempo aleatorio, simulando el ritmo lento de las plantas
+        return random.uniform(1.0, 3.0)
 
     def realizar_acciones(self):
         """Ejecuta las acciones de la planta según su estado actual.
@@ -162,24 +144,3 @@ class PlantaThread(threading.Thread):
                 datos={'cantidad': random.randint(1, 5)}
             )
             self.ecosistema.cola_eventos.put(evento)
-
-    def pause(self):
-        """Pausa el thread de la planta.
-
-        Coloca el thread en un estado pausado hasta que se llame a `resume()`.
-        """
-        self._paused.clear()
-
-    def resume(self):
-        """Reanuda el thread de la planta.
-
-        Permite que el thread continúe ejecutando sus acciones.
-        """
-        self._paused.set()
-
-    def stop(self):
-        """Detiene el thread de la planta.
-
-        Coloca el thread en un estado detenido, finalizando su ejecución.
-        """
-        self._stopped.set()
\ No newline at end of file
@@ -2,10 +2,13 @@ from Plantas.Florales.PlantaFloral import PlantaFloral
 import random
 
 class Cempasuchil(PlantaFloral):
+    madurez_minima = 0.3
+    TIEMPO_MINIMO_FLORACION = 60
+
+    __slots__ = ('color_flores',)
+
     def __init__(self, altura, edad, ubicacion, nivel_energia, nivel_agua):
         super().__init__(altura, edad, ubicacion, nivel_energia, nivel_agua)
-        self.madurez_minima = 0.3
-        self.TIEMPO_MINIMO_FLORACION = 60
         self.color_flores = random.choice(['rojo', 'rosa', 'blanco', 'amarillo'])
 
     def _calcular_produccion_flores(self) -> int:
@@ -5,13 +5,16 @@ import random
 class PlantaFloral(Planta, ABC):
     """Clase base para plantas florales"""
 
+    TIEMPO_MINIMO_FLORACION = 80
+    ENERGIA_FLORACION = 8
+    madurez_minima = 0.5  # Altura mínima para florecer
+
+    __slots__ = ('flores', 'tiempo_entre_floracion')
+
     def __init__(self, altura, edad, ubicacion, nivel_energia, nivel_agua):
         super().__init__(altura, edad, ubicacion, nivel_energia, nivel_agua)
         self.flores = 0
         self.tiempo_entre_floracion = 0
-        self.TIEMPO_MINIMO_FLORACION = 80
-        self.ENERGIA_FLORACION = 8
-        self.madurez_minima = 0.5  # Altura mínima para florecer
 
     def puede_florecer(self):
         """Verifica si la planta puede generar flores"""
@@ -2,10 +2,13 @@ from Plantas.Florales.PlantaFloral import PlantaFloral
 import random
 
 class Rosal(PlantaFloral):
+    madurez_minima = 0.3  # Los rosales pueden florecer siendo más pequeños
+    TIEMPO_MINIMO_FLORACION = 60  # Florecen más rápido que otras plantas
+
+    __slots__ = ('color_flores',)
+
     def __init__(self, altura, edad, ubicacion, nivel_energia, nivel_agua):
         super().__init__(altura, edad, ubicacion, nivel_energia, nivel_agua)
-        self.madurez_minima = 0.3  # Los rosales pueden florecer siendo más pequeños
-        self.TIEMPO_MINIMO_FLORACION = 60  # Florecen más rápido que otras plantas
         self.color_flores = random.choice(['rojo', 'rosa', 'blanco', 'amarillo'])
 
     def _calcular_produccion_flores(self) -> int:
@@ -2,10 +2,13 @@ from Plantas.Frutales.PlantaFrutal import PlantaFrutal
 import random
 
 class Manzano(PlantaFrutal):
+    madurez_minima = 1.5  # Altura mínima específica para manzanos
+    TIEMPO_MINIMO_FRUTOS = 120  # Tiempo específico para manzanos
+
+    __slots__ = ()
+
     def __init__(self, altura, edad, ubicacion, nivel_energia, nivel_agua):
         super().__init__(altura, edad, ubicacion, nivel_energia, nivel_agua)
-        self.madurez_minima = 1.5  # Altura mínima específica para manzanos
-        self.TIEMPO_MINIMO_FRUTOS = 120  # Tiempo específico para manzanos
 
     def _calcular_produccion_frutos(self) -> int:
         """Implementación específica para la producción de manzanas"""
@@ -2,10 +2,13 @@ from Plantas.Frutales.PlantaFrutal import PlantaFrutal
 import random
 
 class Naranjo(PlantaFrutal):
+    madurez_minima = 1.5
+    TIEMPO_MINIMO_FRUTOS = 120
+
+    __slots__ = ()
+
     def __init__(self, altura, edad, ubicacion, nivel_energia, nivel_agua):
         super().__init__(altura, edad, ubicacion, nivel_energia, nivel_agua)
-        self.madurez_minima = 1.5
-        self.TIEMPO_MINIMO_FRUTOS = 120
 
     def _calcular_produccion_frutos(self) -> int:
         # Más altura = más frutos, con un componente aleatorio
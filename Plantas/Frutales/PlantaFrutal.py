@@ -1,19 +1,35 @@
 from abc import ABC, abstractmethod
 
-from PlantaThread import EventoEcosistema
+from EventoEcosistema import EventoEcosistema
 from Plantas.Planta import Planta
 import random
 
 class PlantaFrutal(Planta, ABC):
     """Clase base para plantas frutales"""
 
+    TIEMPO_MINIMO_FRUTOS = 100
+    ENERGIA_PRODUCCION = 10
+    madurez_minima = 1.0  # Altura mínima para dar frutos
+
+    __slots__ = ('_frutos', 'tiempo_entre_frutos')
+
     def __init__(self, altura, edad, ubicacion, nivel_energia, nivel_agua):
         super().__init__(altura, edad, ubicacion, nivel_energia, nivel_agua)
-        self.frutos = 0
+        self._frutos = 0
         self.tiempo_entre_frutos = 0
-        self.TIEMPO_MINIMO_FRUTOS = 100
-        self.ENERGIA_PRODUCCION = 10
-        self.madurez_minima = 1.0  # Altura mínima para dar frutos
+
+    @property
+    def frutos(self):
+        return self._frutos
+
+    @frutos.setter
+    def frutos(self, frutos):
+        """Actualiza los frutos y avisa al ecosistema si la planta pasa a
+        tener o a dejar de tener frutos disponibles."""
+        cambio = (self._frutos > 0) != (frutos > 0)
+        self._frutos = frutos
+        if cambio and self.ecosistema is not None:
+            self.ecosistema.notificar_frutos(self)
 
     def puede_generar_frutos(self):
         """Verifica si la planta puede generar frutos"""
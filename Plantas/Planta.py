@@ -3,6 +3,8 @@ from abc import ABC, abstractmethod
 
 
 class Planta(Organismo, ABC):  # Agregar ABC aquí
+    __slots__ = ('_altura', '_nivel_agua')
+
     def __init__(self, altura, edad, ubicacion, nivel_energia, nivel_agua):
         super().__init__(ubicacion=ubicacion, edad=edad, nivel_energia=nivel_energia)
         self._altura = altura
@@ -0,0 +1,151 @@
+import multiprocessing
+import queue
+import time
+from typing import Optional
+
+from CuadroCompartido import CuadroCompartido
+from CuadroSimulacion import CuadroSimulacion
+from RelojSimulacion import RelojSimulacion
+
+
+class ProcesoSimulacion:
+    """Ejecuta un ecosistema en otro proceso y publica sus cuadros en memoria compartida.
+
+    El proceso hijo tiene su propio intérprete, así los threads de las
+    entidades y del procesador de eventos no compiten por el GIL con la
+    interfaz. En cada vuelta ejecuta los ticks que indica su
+    RelojSimulacion y publica el estado de dibujo en un CuadroCompartido, a
+    lo sumo FRECUENCIA_CUADROS veces por segundo. La interfaz solo lee el
+    último cuadro completo con `leer_cuadro()`, sin esperar al hijo.
+
+    Los comandos (velocidad, detener) llegan al hijo por una cola.
+
+    Attributes:
+        capacidad (int): Máximo de entidades por cuadro.
+        secuencia (int): Secuencia del último cuadro leído.
+    """
+
+    FRECUENCIA_CUADROS = 60  # Hz
+    ESPERA_DETENER = 5.0  # Segundos
+
+    def __init__(self, estado: dict, velocidad: Optional[float] = 1.0,
+                 capacidad: int = CuadroCompartido.CAPACIDAD):
+        """Prepara el proceso sin iniciarlo.
+
+        Args:
+            estado (dict): Estado inicial, de `Ecosistema.exportar_estado()`.
+            velocidad (Optional[float], optional): Velocidad inicial del
+                reloj, o None para la máxima. Por defecto 1.
+            capacidad (int, optional): Máximo de entidades por cuadro.
+        """
+        self._estado = estado
+        self._velocidad = velocidad
+        self.capacidad = capacidad
+        self.secuencia = 0
+        self._compartido: Optional[CuadroCompartido] = None
+        self._comandos = None
+        self._proceso = None
+
+    @property
+    def activo(self) -> bool:
+        """bool: Si el proceso hijo está en ejecución."""
+        return self._proceso is not None and self._proceso.is_alive()
+
+    def iniciar(self):
+        """Crea la memoria compartida y lanza el proceso hijo.
+
+        El hijo se crea con 'spawn': hacer fork de un proceso con threads
+        y una interfaz Qt no es seguro.
+        """
+        contexto = multiprocessing.get_context('spawn')
+        self._compartido = CuadroCompartido.crear(self.capacidad)
+        self._comandos = contexto.Queue()
+        self._proceso = contexto.Process(
+            target=ProcesoSimulacion._ejecutar,
+            args=(self._estado, self._compartido.nombre, self._comandos, self._velocidad),
+            daemon=True)
+        self._proceso.start()
+        # El estado ya se copió al hijo
+        self._estado = None
+
+    def leer_cuadro(self) -> Optional[CuadroSimulacion]:
+        """Obtiene el último cuadro publicado, si es posterior al leído antes.
+
+        Returns:
+            Optional[CuadroSimulacion]: El cuadro, o None si no hay uno nuevo.
+        """
+        if self._compartido is None:
+            return None
+        cuadro = self._compartido.leer(self.secuencia)
+        if cuadro is not None:
+            self.secuencia = cuadro.secuencia
+        return cuadro
+
+    def cambiar_velocidad(self, velocidad: Optional[float]):
+        """Cambia la velocidad del reloj del hijo.
+
+        Args:
+            velocidad (Optional[float]): Multiplicador del tiempo real, o
+                None para la máxima.
+        """
+        self._velocidad = velocidad
+        if self._comandos is not None:
+            self._comandos.put(('velocidad', velocidad))
+
+    def detener(self):
+        """Detiene el proceso hijo y libera la memoria compartida."""
+        if self._proceso is not None:
+            self._comandos.put(('detener', None))
+            self._proceso.join(self.ESPERA_DETENER)
+            if self._proceso.is_alive():
+                print("Error al detener el proceso de simulación: no respondió, se termina")
+                self._proceso.terminate()
+                self._proceso.join()
+            self._comandos.close()
+            self._proceso = None
+            self._comandos = None
+        if self._compartido is not None:
+            self._compartido.cerrar()
+            self._compartido = None
+
+    @staticmethod
+    def _ejecutar(estado: dict, nombre: str, comandos, velocidad: Optional[float]):
+        """Bucle del proceso hijo: ejecuta ticks y publica cuadros hasta recibir 'detener'."""
+        # Importado aquí: el padre no necesita el motor para leer cuadros
+        from Ecosistema import Ecosistema
+
+        compartido = CuadroCompartido.abrir(nombre)
+        ecosistema = None
+        try:
+            ecosistema = Ecosistema.desde_estado(estado)
+            del estado
+            reloj = RelojSimulacion(velocidad=velocidad)
+            compartido.publicar(ecosistema.capturar_cuadro())
+
+            periodo = 1.0 / ProcesoSimulacion.FRECUENCIA_CUADROS
+            while True:
+                inicio = time.perf_counter()
+                try:
+                    while True:
+                        comando, valor = comandos.get_nowait()
+                        if comando == 'detener':
+                            return
+                        if comando == 'velocidad':
+                            reloj.velocidad = valor
+                except queue.Empty:
+                    pass
+
+                if reloj.avanzar(ecosistema.step):
+                    # Nadie dibuja los objetos de las entidades nuevas en este proceso
+                    ecosistema.tomar_entidades_nuevas()
+                    compartido.publicar(ecosistema.capturar_cuadro())
+
+                espera = periodo - (time.perf_counter() - inicio)
+                if espera > 0:
+                    time.sleep(espera)
+        except Exception as e:
+            print(f"Error en el proceso de simulación: {str(e)}")
+        finally:
+            if ecosistema is not None:
+                ecosistema.detener_simulacion()
+            compartido.cerrar()
@@ -0,0 +1,196 @@
+import math
+import threading
+from collections import deque
+from typing import Dict, List, Optional, Set, Tuple
+
+
+class RasterPlantas:
+    """Tabla celda -> planta candidata más cercana (Voronoi discreto).
+
+    El mundo se divide en celdas y cada celda recuerda cuál de las plantas
+    candidatas está más cerca de su centro. Como las plantas no se mueven,
+    la tabla solo se recalcula en las celdas afectadas cuando una planta
+    entra o sale del conjunto de candidatas, y cada consulta es O(1).
+
+    Attributes:
+        tamano (Tuple[float, float]): Tamaño del mundo cubierto.
+        tamano_celda (float): Lado de cada celda.
+        columnas (int): Número de celdas a lo ancho.
+        filas (int): Número de celdas a lo alto.
+        candidatas (Set[Planta]): Plantas que participan en la tabla.
+        lock (Lock): Protege la tabla de accesos concurrentes.
+    """
+
+    def __init__(self, tamano: Tuple[float, float], tamano_celda: float = 10):
+        """Inicializa una tabla vacía.
+
+        Args:
+            tamano (Tuple[float, float]): Tamaño del mundo a cubrir.
+            tamano_celda (float, optional): Lado de cada celda. Por defecto 10.
+        """
+        self.tamano = tamano
+        self.tamano_celda = float(tamano_celda)
+        self.columnas = max(1, int(math.ceil(tamano[0] / self.tamano_celda)))
+        self.filas = max(1, int(math.ceil(tamano[1] / self.tamano_celda)))
+        self.candidatas: Set[object] = set()
+        self.lock = threading.Lock()
+
+        self._dueno: List[Optional[object]] = [None] * (self.columnas * self.filas)
+        self._celdas_de: Dict[object, Set[int]] = {}
+
+    def _indice(self, pos: Tuple[float, float]) -> int:
+        """Obtiene el índice de la celda que contiene una posición."""
+        cx = min(self.columnas - 1, max(0, int(pos[0] // self.tamano_celda)))
+        cy = min(self.filas - 1, max(0, int(pos[1] // self.tamano_celda)))
+        return cy * self.columnas + cx
+
+    def _centro(self, indice: int) -> Tuple[float, float]:
+        """Obtiene el centro de una celda."""
+        cy, cx = divmod(indice, self.columnas)
+        return ((cx + 0.5) * self.tamano_celda, (cy + 0.5) * self.tamano_celda)
+
+    def _vecinas(self, indice: int):
+        """Obtiene los índices de las celdas adyacentes (vecindad 8)."""
+        columnas = self.columnas
+        cy, cx = divmod(indice, columnas)
+        if 0 < cx < columnas - 1 and 0 < cy < self.filas - 1:
+            arriba, abajo = indice - columnas, indice + columnas
+            return (arriba - 1, arriba, arriba + 1, indice - 1, indice + 1,
+                    abajo - 1, abajo, abajo + 1)
+        return tuple(vy * columnas + vx
+                     for vy in range(max(0, cy - 1), min(self.filas, cy + 2))
+                     for vx in range(max(0, cx - 1), min(columnas, cx + 2))
+                     if vy != cy or vx != cx)
+
+    @staticmethod
+    def _distancia2(centro: Tuple[float, float], planta) -> float:
+        """Distancia al cuadrado entre un centro de celda y una planta."""
+        dx = centro[0] - planta.ubicacion[0]
+        dy = centro[1] - planta.ubicacion[1]
+        return dx * dx + dy * dy
+
+    def _asignar(self, indice: int, planta):
+        """Cambia el dueño de una celda manteniendo el registro por planta."""
+        anterior = self._dueno[indice]
+        if anterior is not None:
+            self._celdas_de[anterior].discard(indice)
+        self._dueno[indice] = planta
+        if planta is not None:
+            self._celdas_de[planta].add(indice)
+
+    def agregar(self, planta):
+        """Agrega una planta candidata y actualiza solo las celdas que gana.
+
+        Recorre en anchura (vecindad 8) desde la celda de la planta. Una
+        celda se gana si su centro queda más cerca de la planta nueva que
+        de su dueño, pero el recorrido sigue por toda celda que la región
+        de la planta pueda tocar: las que cruzan la mediatriz entre la
+        planta y el dueño. Así no se corta aunque la planta pierda su
+        propia celda o la región sea una franja angosta.
+
+        Args:
+            planta (Planta): Planta que empieza a ser candidata.
+        """
+        with self.lock:
+            if planta in self.candidatas:
+                return
+            self.candidatas.add(planta)
+            self._celdas_de[planta] = set()
+
+            medio_lado = self.tamano_celda / 2
+            px, py = planta.ubicacion
+            inicio = self._indice((px, py))
+            visitadas = {inicio}
+            pendientes = deque([inicio])
+            while pendientes:
+                indice = pendientes.popleft()
+                cx, cy = self._centro(indice)
+                dueno = self._dueno[indice]
+                if dueno is not None:
+                    ox, oy = dueno.ubicacion
+                    vx, vy = px - ox, py - oy
+                    # La celda queda entera del lado del dueño en la mediatriz
+                    if ((cx - (px + ox) / 2) * vx + (cy - (py + oy) / 2) * vy +
+                            medio_lado * (abs(vx) + abs(vy)) < 0):
+                        continue
+                    if (cx - px) ** 2 + (cy - py) ** 2 < (cx - ox) ** 2 + (cy - oy) ** 2:
+                        self._asignar(indice, planta)
+                else:
+                    self._asignar(indice, planta)
+                for vecina in self._vecinas(indice):
+                    if vecina not in visitadas:
+                        visitadas.add(vecina)
+                        pendientes.append(vecina)
+
+    def quitar(self, planta):
+        """Quita una planta candidata y reasigna solo las celdas que tenía.
+
+        Las dueñas de las celdas que rodean la región liberada (vecindad 8)
+        dan una cota de la distancia a la candidata más cercana de cada
+        celda huérfana. Luego cada celda se reparte entre todas las
+        candidatas dentro de esa cota, así una vecina que no llega a tocar
+        la región con ninguna celda también puede ganarla.
+
+        Args:
+            planta (Planta): Planta que deja de ser candidata.
+        """
+        with self.lock:
+            if planta not in self.candidatas:
+                return
+            self.candidatas.discard(planta)
+            region = self._celdas_de.pop(planta)
+            if not region:
+                return
+
+            for indice in region:
+                self._dueno[indice] = None
+
+            vecinas = set()
+            for indice in region:
+                for vecina in self._vecinas(indice):
+                    dueno = self._dueno[vecina]
+                    if dueno is not None:
+                        vecinas.add(dueno)
+
+            centros = [self._centro(indice) for indice in region]
+            if vecinas:
+                cota2 = max(min(self._distancia2(centro, p) for p in vecinas) for centro in centros)
+                x_min = min(centro[0] for centro in centros)
+                y_min = min(centro[1] for centro in centros)
+                x_max = max(centro[0] for centro in centros)
+                y_max = max(centro[1] for centro in centros)
+                cercanas = []
+                for p in self.candidatas:
+                    x, y = p.ubicacion
+                    dx = x_min - x if x < x_min else x - x_max if x > x_max else 0.0
+                    dy = y_min - y if y < y_min else y - y_max if y > y_max else 0.0
+                    if dx * dx + dy * dy <= cota2:
+                        cercanas.append(p)
+            else:
+                cercanas = list(self.candidatas)
+
+            posiciones = [p.ubicacion for p in cercanas]
+            for indice, (cx, cy) in zip(region, centros):
+                mejor, mejor_distancia2 = None, float('inf')
+                for p, (x, y) in zip(cercanas, posiciones):
+                    distancia2 = (cx - x) ** 2 + (cy - y) ** 2
+                    if distancia2 < mejor_distancia2:
+                        mejor, mejor_distancia2 = p, distancia2
+                self._asignar(indice, mejor)
+
+    def planta_cercana(self, pos: Tuple[float, float]) -> Tuple[Optional[object], float]:
+        """Obtiene la planta candidata más cercana a una posición.
+
+        Args:
+            pos (Tuple[float, float]): Posición de consulta.
+
+        Returns:
+            Tuple[Optional[Planta], float]: La planta más cercana y la distancia
+                a ella, o (None, inf) si no hay candidatas.
+        """
+        planta = self._dueno[self._indice(pos)]
+        if planta is None:
+            return None, float('inf')
+        dx = pos[0] - planta.ubicacion[0]
+        dy = pos[1] - planta.ubicacion[1]
+        return planta, (dx * dx + dy * dy) ** 0.5
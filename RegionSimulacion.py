@@ -0,0 +1,174 @@
+import copy
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from ParticionEspacial import ParticionEspacial
+
+
+class RegionSimulacion:
+    """Ecosistema de una región de un mundo particionado y su intercambio
+    con las regiones vecinas.
+
+    Después de cada tick, `mensajes()` arma para cada vecina:
+
+    - efectos: lo que les ocurrió en el tick a los fantasmas que mandó esa
+      vecina (muerte, cambio de energía, reinicio del tiempo de
+      reproducción), para que ella lo aplique a sus originales;
+    - migrantes: copias de las entidades propias que quedaron dentro de la
+      vecina, que aquí mueren;
+    - halo: copias de los animales propios a menos de `particion.halo` de
+      la vecina, que allí serán fantasmas durante el tick siguiente.
+
+    `recibir()` aplica los mensajes de todas las vecinas. Así la caza y la
+    reproducción funcionan a través de los bordes con un tick de atraso en
+    la posición de los fantasmas. Para que una pareja a ambos lados de un
+    borde no se reproduzca dos veces en el mismo tick, los fantasmas solo
+    son pareja en la región de menor número.
+
+    Los efectos identifican al original por su fila, así que el ecosistema
+    no compacta su mundo al purgar: `mensajes()` lo compacta, si conviene,
+    antes de armar el halo, y `recibir()` traduce las filas de los efectos
+    que llegan sobre el halo anterior. Así se liberan las filas y tareas de
+    los muertos y los migrantes.
+
+    Attributes:
+        region (int): Número de la región.
+        particion (ParticionEspacial): División del mundo.
+        ecosistema (Ecosistema): Entidades propias de la región.
+        vecinas (List[int]): Regiones vecinas.
+        estadisticas (dict): Del último intercambio: fantasmas recibidos,
+            migrantes enviados y recibidos, y efectos enviados y aplicados.
+    """
+
+    def __init__(self, region: int, particion: ParticionEspacial, ecosistema):
+        """Prepara la región.
+
+        Args:
+            region (int): Número de la región.
+            particion (ParticionEspacial): División del mundo.
+            ecosistema (Ecosistema): Ecosistema con las entidades de la región.
+        """
+        self.region = region
+        self.particion = particion
+        self.ecosistema = ecosistema
+        self.vecinas = particion.vecinas(region)
+        # Fantasma -> (vecina, fila del original, energía y tiempo de reproducción al llegar)
+        self._origen_fantasmas: Dict[object, Tuple[int, int, float, int]] = {}
+        # Fila nueva de cada fila del halo anterior, si se compactó desde entonces
+        self._remapeo: Optional[np.ndarray] = None
+        ecosistema.compactar_al_purgar = False
+        self.estadisticas = {
+            'fantasmas': 0,
+            'migrantes_enviados': 0,
+            'migrantes_recibidos': 0,
+            'efectos_enviados': 0,
+            'efectos_aplicados': 0,
+        }
+
+    def mensajes(self) -> Dict[int, Tuple[list, list, list]]:
+        """Arma el mensaje para cada vecina al terminar un tick.
+
+        Quita los fantasmas del ecosistema, compacta su mundo si conviene y
+        retira a los migrantes.
+
+        Returns:
+            Dict[int, Tuple[list, list, list]]: Efectos, migrantes y halo por vecina.
+        """
+        ecosistema = self.ecosistema
+        salida = {vecina: ([], [], []) for vecina in self.vecinas}
+
+        efectos = 0
+        for fantasma in ecosistema.quitar_fantasmas():
+            vecina, fila, energia, tiempo = self._origen_fantasmas[fantasma]
+            muerto = not fantasma.estar_vivo
+            delta_energia = fantasma.nivel_energia - energia
+            reinicio = fantasma.tiempo_reproduccion < tiempo
+            if muerto or delta_energia or reinicio:
+                salida[vecina][0].append((fila, muerto, delta_energia, reinicio))
+                efectos += 1
+        self._origen_fantasmas.clear()
+
+        # Compactar antes de armar el halo: los efectos sobre el halo
+        # anterior se traducen al recibirlos
+        self._remapeo = ecosistema.compactar() if ecosistema.conviene_compactar() else None
+
+        migrantes = 0
+        with ecosistema.lock:
+            mundo = ecosistema.mundo
+            n = mundo.n
+            x = mundo.x[:n]
+            y = mundo.y[:n]
+            vivo = mundo.vivo[:n]
+            destino = self.particion.region_de(x, y)
+            for fila in np.flatnonzero(vivo & (destino != self.region)).tolist():
+                vecina = int(destino[fila])
+                if vecina not in salida:
+                    print(f"Error al migrar entidad: la región {vecina} no es vecina de {self.region}")
+                    continue
+                entidad = mundo.entidades[fila]
+                copia = copy.copy(entidad)
+                huida = ecosistema._huidas.pop(entidad, None)
+                if huida is not None:
+                    copia.velocidad = huida[1]  # La huida no sigue en la otra región
+                salida[vecina][1].append((ecosistema._categorias[fila], copia))
+                entidad.estar_vivo = False
+                migrantes += 1
+
+            # `vivo` ya no incluye a los migrantes
+            animales = vivo & mundo.movil[:n]
+            halo = self.particion.halo
+            for vecina in self.vecinas:
+                x_min, y_min, x_max, y_max = self.particion.rectangulo(vecina)
+                cerca = (animales & (x >= x_min - halo) & (x < x_max + halo) &
+                         (y >= y_min - halo) & (y < y_max + halo))
+                salida[vecina][2].extend((fila, copy.copy(mundo.entidades[fila]))
+                                         for fila in np.flatnonzero(cerca).tolist())
+
+        self.estadisticas['migrantes_enviados'] = migrantes
+        self.estadisticas['efectos_enviados'] = efectos
+        return salida
+
+    def recibir(self, mensajes: Dict[int, Tuple[list, list, list]]):
+        """Aplica los mensajes de las vecinas del mismo tick.
+
+        Args:
+            mensajes (Dict[int, Tuple[list, list, list]]): Efectos, migrantes
+                y halo por vecina, como los arma `mensajes()`.
+        """
+        ecosistema = self.ecosistema
+        remapeo = self._remapeo
+        fantasmas = migrantes = efectos = 0
+        with ecosistema.lock:
+            entidades = ecosistema.mundo.entidades
+            for vecina, (efectos_vecina, migrantes_vecina, halo) in mensajes.items():
+                for fila, muerto, delta_energia, reinicio in efectos_vecina:
+                    if remapeo is not None:
+                        fila = int(remapeo[fila])
+                        if fila < 0:
+                            continue  # Murió o migró y su fila se liberó
+                    entidad = entidades[fila]
+                    if not entidad.estar_vivo:
+                        continue  # Murió o migró antes de recibir el efecto
+                    if delta_energia:
+                        entidad.nivel_energia = max(0, entidad.nivel_energia + delta_energia)
+                    if reinicio:
+                        entidad.tiempo_reproduccion = 0
+                    if muerto:
+                        entidad.estar_vivo = False
+                    efectos += 1
+
+                for categoria, entidad in migrantes_vecina:
+                    ecosistema.agregar_entidad(entidad, categoria)
+                migrantes += len(migrantes_vecina)
+
+                for fila, fantasma in halo:
+                    self._origen_fantasmas[fantasma] = (vecina, fila, fantasma.nivel_energia,
+                                                        fantasma.tiempo_reproduccion)
+                ecosistema.agregar_fantasmas([fantasma for _, fantasma in halo],
+                                             parejas=vecina > self.region)
+                fantasmas += len(halo)
+
+        self.estadisticas['fantasmas'] = fantasmas
+        self.estadisticas['migrantes_recibidos'] = migrantes
+        self.estadisticas['efectos_aplicados'] = efectos
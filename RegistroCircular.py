@@ -0,0 +1,71 @@
+import threading
+from collections import deque
+from typing import Any, List, Tuple
+
+
+class RegistroCircular:
+    """Búfer circular de capacidad fija para registros de actividad.
+
+    `agregar()` cuesta O(1) y puede llamarse desde cualquier thread; cuando
+    el búfer está lleno el elemento más antiguo se descarta. Un consumidor
+    lee periódicamente con `leer()` los elementos retenidos y cuántos se
+    agregaron desde su lectura anterior, sin detener a los productores más
+    que lo que dura copiar el búfer.
+
+    Attributes:
+        capacidad (int): Cantidad máxima de elementos retenidos.
+        total (int): Elementos agregados desde la creación o el último `limpiar()`.
+    """
+
+    def __init__(self, capacidad: int):
+        """Inicializa un registro vacío.
+
+        Args:
+            capacidad (int): Cantidad máxima de elementos retenidos.
+
+        Raises:
+            ValueError: Si la capacidad no es positiva.
+        """
+        if capacidad <= 0:
+            raise ValueError(f"Capacidad inválida: {capacidad}")
+        self.capacidad = capacidad
+        self.total = 0
+        self._elementos: deque = deque(maxlen=capacidad)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._elementos)
+
+    def agregar(self, elemento: Any):
+        """Agrega un elemento, descartando el más antiguo si está lleno.
+
+        Args:
+            elemento (Any): Elemento a registrar.
+        """
+        with self._lock:
+            self._elementos.append(elemento)
+            self.total += 1
+
+    def leer(self, desde: int = 0) -> Tuple[int, List[Any]]:
+        """Obtiene los elementos agregados después de una lectura anterior.
+
+        Args:
+            desde (int, optional): `total` devuelto por la lectura anterior.
+
+        Returns:
+            Tuple[int, List[Any]]: Total actual y elementos nuevos aún
+                retenidos, del más antiguo al más reciente.
+        """
+        with self._lock:
+            total = self.total
+            nuevos = min(total - desde, len(self._elementos))
+            if nuevos <= 0:
+                return total, []
+            elementos = list(self._elementos)
+        return total, elementos[-nuevos:]
+
+    def limpiar(self):
+        """Descarta todos los elementos."""
+        with self._lock:
+            self._elementos.clear()
+            self.total = 0
@@ -0,0 +1,120 @@
+import time
+from typing import Callable, Optional
+
+
+class RelojSimulacion:
+    """Reloj de paso fijo que separa el ritmo de la simulación del de dibujo.
+
+    El tiempo real transcurrido entre cuadros, multiplicado por la
+    velocidad, se acumula y se consume en ticks de `paso` segundos de
+    simulación. Así el tiempo simulado no depende de cuánto tarde en
+    dibujarse cada cuadro: si un cuadro se atrasa, el siguiente ejecuta más
+    ticks y se dibuja una sola vez. Lo que queda en el acumulador es la
+    fracción `alfa` del tick siguiente, para interpolar posiciones.
+
+    Los ticks de un cuadro se cortan al agotar `presupuesto` segundos; el
+    tiempo que no alcanzó a simularse se descarta en vez de acumularse,
+    para que una máquina lenta no entre en una espiral de atraso. Con
+    velocidad None (máxima) cada cuadro ejecuta ticks hasta agotar el
+    presupuesto.
+
+    Attributes:
+        paso (float): Segundos de simulación por tick.
+        presupuesto (float): Segundos reales que puede ocupar la simulación
+            en un cuadro.
+        alfa (float): Fracción del tick siguiente ya transcurrida, en [0, 1];
+            1 con velocidad máxima.
+        ticks (int): Ticks ejecutados.
+        ticks_descartados (int): Ticks omitidos por falta de tiempo.
+    """
+
+    PASO = 0.1
+    PRESUPUESTO = 0.05
+
+    def __init__(self, paso: float = PASO, velocidad: Optional[float] = 1.0,
+                 presupuesto: float = PRESUPUESTO, reloj: Callable[[], float] = time.perf_counter):
+        """Inicializa un reloj detenido.
+
+        Args:
+            paso (float, optional): Segundos de simulación por tick.
+            velocidad (Optional[float], optional): Multiplicador del tiempo
+                real, o None para la máxima. Por defecto 1.
+            presupuesto (float, optional): Segundos reales de simulación por cuadro.
+            reloj (Callable[[], float], optional): Fuente de tiempo real.
+
+        Raises:
+            ValueError: Si el paso, el presupuesto o la velocidad no son positivos.
+        """
+        if paso <= 0:
+            raise ValueError(f"Paso inválido: {paso}")
+        if presupuesto <= 0:
+            raise ValueError(f"Presupuesto inválido: {presupuesto}")
+        self.paso = paso
+        self.presupuesto = presupuesto
+        self._reloj = reloj
+        self._velocidad = None
+        self.velocidad = velocidad
+        self.ticks = 0
+        self.ticks_descartados = 0
+        self.reiniciar()
+
+    @property
+    def velocidad(self) -> Optional[float]:
+        """Optional[float]: Multiplicador del tiempo real, o None para la máxima."""
+        return self._velocidad
+
+    @velocidad.setter
+    def velocidad(self, velocidad: Optional[float]):
+        """Cambia la velocidad sin arrastrar el tiempo acumulado con la anterior.
+
+        Raises:
+            ValueError: Si la velocidad no es positiva.
+        """
+        if velocidad is not None and velocidad <= 0:
+            raise ValueError(f"Velocidad inválida: {velocidad}")
+        self._velocidad = velocidad
+        self._acumulado = 0.0
+
+    def reiniciar(self):
+        """Olvida el tiempo transcurrido, por ejemplo al reanudar tras una pausa."""
+        self._anterior = None
+        self._acumulado = 0.0
+        self.alfa = 1.0 if self._velocidad is None else 0.0
+
+    def avanzar(self, ejecutar: Callable[[], None]) -> int:
+        """Ejecuta los ticks que corresponden al tiempo real transcurrido.
+
+        Args:
+            ejecutar (Callable[[], None]): Ejecuta un tick de la simulación.
+
+        Returns:
+            int: Ticks ejecutados en este cuadro.
+        """
+        ahora = self._reloj()
+        transcurrido = 0.0 if self._anterior is None else ahora - self._anterior
+        self._anterior = ahora
+        limite = ahora + self.presupuesto
+
+        ejecutados = 0
+        if self._velocidad is None:
+            while True:
+                ejecutar()
+                ejecutados += 1
+                if self._reloj() >= limite:
+                    break
+            self.alfa = 1.0
+        else:
+            self._acumulado += transcurrido * self._velocidad
+            while self._acumulado >= self.paso:
+                ejecutar()
+                ejecutados += 1
+                self._acumulado -= self.paso
+                if self._acumulado >= self.paso and self._reloj() >= limite:
+                    descartados = int(self._acumulado / self.paso)
+                    self.ticks_descartados += descartados
+                    self._acumulado -= descartados * self.paso
+                    break
+            self.alfa = self._acumulado / self.paso
+
+        self.ticks += ejecutados
+        return ejecutados
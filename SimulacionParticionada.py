@@ -0,0 +1,255 @@
+import multiprocessing
+import queue
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from Animales.Animal import Animal
+from Ecosistema import Ecosistema
+from ParticionEspacial import ParticionEspacial
+from RegionSimulacion import RegionSimulacion
+
+
+class SimulacionParticionada:
+    """Ecosistema repartido en regiones, cada una en su propio proceso.
+
+    El mundo se divide con una ParticionEspacial y cada proceso ejecuta un
+    Ecosistema con las entidades de su región, del tamaño del mundo
+    completo. Los ticks avanzan en paralelo; después de cada uno, cada
+    región intercambia con sus vecinas los fantasmas del halo, los efectos
+    sobre ellos y los migrantes (ver RegionSimulacion), y solo sigue cuando
+    recibió los mensajes de ese tick de todas sus vecinas. Cada región
+    tiene un buzón (Queue) donde escriben sus vecinas, así ningún envío
+    espera al receptor.
+
+    El halo cubre el mayor rango de caza y la distancia de reproducción.
+    Los herbívoros solo comen plantas de su región, y el balance de
+    poblaciones se aplica a cada región por separado.
+
+    Attributes:
+        particion (ParticionEspacial): División del mundo.
+        comportamientos (bool): Si las entidades ejecutan sus comportamientos
+            en tiempo real además de los ticks.
+        tick (int): Ticks ejecutados por todas las regiones.
+        estadisticas (List[dict]): Por región, del último `step()`:
+            entidades vivas, fantasmas, migrantes, efectos y segundos de
+            CPU en ticks e intercambio, y segundos esperando a las vecinas.
+    """
+
+    ESPERA_RESPUESTA = 300.0  # Segundos
+    ESPERA_DETENER = 5.0  # Segundos
+
+    def __init__(self, estado: dict, columnas: int = 2, filas: int = 1,
+                 halo: Optional[float] = None, comportamientos: bool = True):
+        """Prepara la simulación sin iniciar los procesos.
+
+        Args:
+            estado (dict): Estado inicial, de `Ecosistema.exportar_estado()`.
+            columnas (int, optional): Regiones a lo ancho. Por defecto 2.
+            filas (int, optional): Regiones a lo alto. Por defecto 1.
+            halo (Optional[float], optional): Ancho del halo. Por defecto el
+                mayor radio de interacción entre animales.
+            comportamientos (bool, optional): Si las entidades ejecutan sus
+                comportamientos en tiempo real. Por defecto True.
+
+        Raises:
+            ValueError: Si la partición no es válida para el tamaño del mundo.
+        """
+        if hasattr(estado, 'a_estado'):
+            estado = estado.a_estado()
+        if halo is None:
+            halo = max(Ecosistema._calcular_tamano_celda(), Animal.DISTANCIA_REPRODUCCION)
+        self.particion = ParticionEspacial(tuple(estado['tamano']), columnas, filas, halo)
+        self.comportamientos = comportamientos
+        self.tick = estado.get('tick', 0)
+        self.estadisticas: List[dict] = []
+        self._estados = self._repartir(estado)
+        self._comandos = []
+        self._resultados = None
+        self._procesos = []
+
+    def _repartir(self, estado: dict) -> List[dict]:
+        """Divide las entidades de un estado entre las regiones según su ubicación."""
+        estados = [{'tamano': estado['tamano'], 'tick': estado.get('tick', 0),
+                    'recursos': dict(estado.get('recursos', {})), 'entidades': {}}
+                   for _ in range(len(self.particion))]
+        for categoria, especies in estado['entidades'].items():
+            for especie, lista in especies.items():
+                if not lista:
+                    continue
+                ubicaciones = np.array([entidad.ubicacion for entidad in lista], dtype=np.float64)
+                regiones = self.particion.region_de(ubicaciones[:, 0], ubicaciones[:, 1])
+                for entidad, region in zip(lista, regiones.tolist()):
+                    estados[region]['entidades'].setdefault(categoria, {}).setdefault(
+                        especie, []).append(entidad)
+        return estados
+
+    @property
+    def activa(self) -> bool:
+        """bool: Si todos los procesos de las regiones están en ejecución."""
+        return bool(self._procesos) and all(proceso.is_alive() for proceso in self._procesos)
+
+    def iniciar(self):
+        """Lanza un proceso por región y espera el primer intercambio de halos.
+
+        Los procesos se crean con 'spawn', como en ProcesoSimulacion.
+
+        Raises:
+            RuntimeError: Si alguna región no pudo iniciar.
+        """
+        contexto = multiprocessing.get_context('spawn')
+        self._resultados = contexto.Queue()
+        buzones = [contexto.Queue() for _ in range(len(self.particion))]
+        self._comandos = [contexto.Queue() for _ in range(len(self.particion))]
+        for region, estado in enumerate(self._estados):
+            proceso = contexto.Process(
+                target=SimulacionParticionada._ejecutar,
+                args=(estado, region, self.particion, self._comandos[region],
+                      self._resultados, buzones, self.comportamientos),
+                daemon=True)
+            proceso.start()
+            self._procesos.append(proceso)
+        # Los estados ya se copiaron a los procesos
+        self._estados = []
+        self._esperar('listo')
+
+    def _esperar(self, tipo: str) -> List[object]:
+        """Espera la respuesta de todas las regiones a un comando.
+
+        Returns:
+            List[object]: Contenido de cada respuesta, por región.
+
+        Raises:
+            RuntimeError: Si una región informó un error o no respondió.
+        """
+        respuestas: Dict[int, object] = {}
+        while len(respuestas) < len(self._procesos):
+            try:
+                recibido, region, contenido = self._resultados.get(timeout=self.ESPERA_RESPUESTA)
+            except queue.Empty:
+                raise RuntimeError(f"Las regiones no respondieron a '{tipo}'")
+            if recibido == 'error':
+                raise RuntimeError(f"Error en la región {region}: {contenido}")
+            respuestas[region] = contenido
+        return [respuestas[region] for region in range(len(self._procesos))]
+
+    def step(self, n: int = 1):
+        """Avanza todas las regiones n ticks.
+
+        Args:
+            n (int, optional): Cantidad de ticks. Por defecto 1.
+
+        Raises:
+            RuntimeError: Si alguna región falló.
+        """
+        for comandos in self._comandos:
+            comandos.put(('step', n))
+        self.estadisticas = self._esperar('step')
+        self.tick = self.estadisticas[0]['tick']
+
+    def exportar_estado(self) -> dict:
+        """Obtiene el estado del mundo completo, como `Ecosistema.exportar_estado()`.
+
+        Los recursos son los de la primera región.
+
+        Returns:
+            dict: Estado con las entidades de todas las regiones.
+        """
+        for comandos in self._comandos:
+            comandos.put(('estado', None))
+        estados = self._esperar('estado')
+        resultado = {'tamano': estados[0]['tamano'], 'tick': estados[0]['tick'],
+                     'recursos': estados[0]['recursos'], 'entidades': {}}
+        for estado in estados:
+            for categoria, especies in estado['entidades'].items():
+                for especie, lista in especies.items():
+                    resultado['entidades'].setdefault(categoria, {}).setdefault(
+                        especie, []).extend(lista)
+        return resultado
+
+    def detener(self):
+        """Detiene los procesos de todas las regiones."""
+        for comandos in self._comandos:
+            comandos.put(('detener', None))
+        for proceso in self._procesos:
+            proceso.join(self.ESPERA_DETENER)
+            if proceso.is_alive():
+                # Puede estar esperando a una vecina que ya terminó
+                proceso.terminate()
+                proceso.join()
+        self._procesos = []
+        self._comandos = []
+
+    @staticmethod
+    def _ejecutar(estado: dict, region: int, particion: ParticionEspacial, comandos,
+                  resultados, buzones: list, comportamientos: bool):
+        """Bucle del proceso de una región: ejecuta ticks e intercambia halos
+        hasta recibir 'detener'."""
+        ecosistema = None
+        try:
+            ecosistema = Ecosistema.desde_estado(estado)
+            del estado
+            if not comportamientos:
+                ecosistema.pausar_simulacion()
+            trabajo = RegionSimulacion(region, particion, ecosistema)
+            buzon = buzones[region]
+            # Mensajes de vecinas que ya van un tick adelante
+            adelantados: Dict[int, Dict[int, Tuple[list, list, list]]] = {}
+
+            def intercambiar() -> Tuple[float, float]:
+                """Envía y recibe los mensajes del tick actual; devuelve
+                segundos de CPU y segundos esperando a las vecinas."""
+                inicio = time.process_time()
+                tick = ecosistema.tick
+                for vecina, mensaje in trabajo.mensajes().items():
+                    buzones[vecina].put((tick, region, mensaje))
+                cpu = time.process_time() - inicio
+
+                inicio_espera = time.perf_counter()
+                recibidos = adelantados.pop(tick, {})
+                while len(recibidos) < len(trabajo.vecinas):
+                    tick_mensaje, vecina, mensaje = buzon.get()
+                    if tick_mensaje == tick:
+                        recibidos[vecina] = mensaje
+                    else:
+                        adelantados.setdefault(tick_mensaje, {})[vecina] = mensaje
+                espera = time.perf_counter() - inicio_espera
+
+                inicio = time.process_time()
+                trabajo.recibir(recibidos)
+                return cpu + time.process_time() - inicio, espera
+
+            intercambiar()
+            resultados.put(('listo', region, None))
+
+            while True:
+                comando, valor = comandos.get()
+                if comando == 'detener':
+                    return
+                if comando == 'estado':
+                    resultados.put(('estado', region, ecosistema.exportar_estado()))
+                elif comando == 'step':
+                    estadisticas = dict.fromkeys(trabajo.estadisticas, 0)
+                    estadisticas.update(cpu_ticks=0.0, cpu_intercambio=0.0, espera=0.0)
+                    for _ in range(valor):
+                        inicio = time.process_time()
+                        ecosistema.step()
+                        estadisticas['cpu_ticks'] += time.process_time() - inicio
+                        cpu, espera = intercambiar()
+                        estadisticas['cpu_intercambio'] += cpu
+                        estadisticas['espera'] += espera
+                        for clave, cantidad in trabajo.estadisticas.items():
+                            estadisticas[clave] += cantidad
+                        # Nadie dibuja las entidades nuevas de una región
+                        ecosistema.tomar_entidades_nuevas()
+                    mundo = ecosistema.mundo
+                    estadisticas['tick'] = ecosistema.tick
+                    estadisticas['entidades'] = int(np.count_nonzero(mundo.vivo[:mundo.n]))
+                    resultados.put(('step', region, estadisticas))
+        except Exception as e:
+            print(f"Error en la región {region}: {str(e)}")
+            resultados.put(('error', region, str(e)))
+        finally:
+            if ecosistema is not None:
+                ecosistema.detener_simulacion()
@@ -0,0 +1,99 @@
+"""Mide cómo escala SimulacionParticionada con la cantidad de regiones.
+
+Reparte un mundo de `--lado` x `--lado` con animales (10 % leones, 60 %
+conejos y 30 % ciervos) y plantas (mitad manzanos, mitad rosales) entre
+cada partición de `--particiones` y ejecuta `--ticks` ticks con los
+comportamientos pausados, después de dos de calentamiento.
+
+Para cada partición informa los ticks por segundo de pared y el tiempo de
+CPU por tick de todas las regiones y de la más lenta. Con un núcleo por
+región la más lenta es el camino crítico, así que su CPU por tick proyecta
+los ticks por segundo y la aceleración. Si hay menos núcleos que regiones
+los procesos se turnan y el tiempo de pared no escala; la proyección
+tampoco incluye la latencia de las colas entre núcleos reales.
+
+    python benchmarks/escalado_regiones.py --particiones 1x1,2x1,2x2,4x2
+"""
+import argparse
+import contextlib
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Animales.Carnivoros.Leon import Leon
+from Animales.Herbivoros.Ciervo import Ciervo
+from Animales.Herbivoros.Conejo import Conejo
+from Plantas.Florales.Rosal import Rosal
+from Plantas.Frutales.Manzano import Manzano
+from SimulacionParticionada import SimulacionParticionada
+
+TICKS_CALENTAMIENTO = 2
+
+
+def crear_estado(animales: int, plantas: int, lado: float) -> dict:
+    """Crea un estado inicial como el de `Ecosistema.exportar_estado()`."""
+    random.seed(7)
+
+    def posicion():
+        return (random.uniform(0, lado), random.uniform(0, lado))
+
+    entidades = {
+        'carnivoro': {'Leon': [Leon("Leon", 100, 2.0, posicion()) for _ in range(animales // 10)]},
+        'herbivoro': {
+            'Conejo': [Conejo("Conejo", 100, 4.0, posicion()) for _ in range(animales * 6 // 10)],
+            'Ciervo': [Ciervo("Ciervo", 100, 3.0, posicion()) for _ in range(animales * 3 // 10)],
+        },
+        'frutal': {'Manzano': [Manzano(1.0, 0, posicion(), 100, 100) for _ in range(plantas // 2)]},
+        'floral': {'Rosal': [Rosal(0.5, 0, posicion(), 100, 100) for _ in range(plantas // 2)]},
+    }
+    return {'tamano': (lado, lado), 'tick': 0, 'recursos': {}, 'entidades': entidades}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--animales', type=int, default=40000)
+    parser.add_argument('--plantas', type=int, default=20000)
+    parser.add_argument('--lado', type=float, default=10000)
+    parser.add_argument('--ticks', type=int, default=10)
+    parser.add_argument('--particiones', default='1x1,2x1,2x2,4x2',
+                        help="Particiones columnas x filas separadas por comas.")
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} CPU; {args.animales} animales y {args.plantas} plantas "
+          f"en {args.lado:g}x{args.lado:g}, {args.ticks} ticks")
+    referencia = None
+    for particion in args.particiones.split(','):
+        columnas, filas = (int(valor) for valor in particion.split('x'))
+        # Los constructores de algunas especies imprimen mensajes
+        with open(os.devnull, 'w') as nulo, contextlib.redirect_stdout(nulo):
+            estado = crear_estado(args.animales, args.plantas, args.lado)
+        simulacion = SimulacionParticionada(estado, columnas, filas, comportamientos=False)
+        simulacion.iniciar()
+        try:
+            simulacion.step(TICKS_CALENTAMIENTO)
+            inicio = time.perf_counter()
+            simulacion.step(args.ticks)
+            pared = time.perf_counter() - inicio
+            estadisticas = simulacion.estadisticas
+        finally:
+            simulacion.detener()
+
+        cpu = [region['cpu_ticks'] + region['cpu_intercambio'] for region in estadisticas]
+        critico = max(cpu) / args.ticks
+        if referencia is None:
+            referencia = critico
+        intercambio = estadisticas[cpu.index(max(cpu))]['cpu_intercambio'] / args.ticks
+        fantasmas = sum(region['fantasmas'] for region in estadisticas) / args.ticks
+        migrantes = sum(region['migrantes_enviados'] for region in estadisticas) / args.ticks
+        print(f"{columnas}x{filas}: pared {args.ticks / pared:.2f} ticks/s | CPU por tick: "
+              f"total {sum(cpu) / args.ticks * 1000:.0f} ms, región más lenta "
+              f"{critico * 1000:.0f} ms (intercambio {intercambio * 1000:.0f} ms) -> "
+              f"{1 / critico:.1f} ticks/s proyectados, {referencia / critico:.1f}x | "
+              f"fantasmas/tick {fantasmas:.0f}, migrantes/tick {migrantes:.1f}", flush=True)
+
+
+if __name__ == '__main__':
+    main()
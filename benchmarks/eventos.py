@@ -0,0 +1,91 @@
+"""Mide cuántos eventos por segundo procesa el thread procesador del Ecosistema.
+
+Varios threads productores encolan eventos de 10 000 orígenes distintos
+mientras otro thread, como la interfaz, toma el lock la mitad de cada
+milisegundo. La cola se mantiene cerca de MAX_COLA eventos, así el
+procesador nunca espera por trabajo. Los manejadores solo cuentan eventos.
+
+Para comparar antes y después de un cambio, se corre sobre dos árboles:
+
+    git worktree add /tmp/antes <commit>^
+    python benchmarks/eventos.py --raiz /tmp/antes
+    python benchmarks/eventos.py
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+MAX_COLA = 50000
+TIPOS = ('mover', 'buscar_alimento', 'descansar', 'interactuar',
+         'absorber_agua', 'crecer', 'generar_frutos')
+MANEJADORES = ('procesar_movimiento', 'procesar_busqueda_alimento', 'procesar_descanso',
+               'procesar_interaccion', 'procesar_absorcion_agua', 'procesar_crecimiento',
+               'procesar_generacion_frutos')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--raiz', default=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                        help="Árbol del ecosistema a medir. Por defecto este repositorio.")
+    parser.add_argument('--productores', type=int, default=4)
+    parser.add_argument('--origenes', type=int, default=10000)
+    parser.add_argument('--segundos', type=float, default=5.0)
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.raiz)
+    from Ecosistema import Ecosistema, EventoEcosistema
+
+    procesados = [0]
+
+    def contar(self, evento):
+        procesados[0] += 1
+
+    for nombre in MANEJADORES:
+        setattr(Ecosistema, nombre, contar)
+
+    ecosistema = Ecosistema((1000, 1000))
+    origenes = [object() for _ in range(args.origenes)]
+    activo = True
+
+    def producir(inicio: int):
+        i = inicio
+        while activo:
+            if ecosistema.cola_eventos.qsize() > MAX_COLA:
+                time.sleep(0.001)
+                continue
+            for _ in range(100):
+                ecosistema.cola_eventos.put(EventoEcosistema(
+                    TIPOS[i % len(TIPOS)], origenes[i % len(origenes)], None, {}))
+                i += args.productores
+
+    def interfaz():
+        while activo:
+            with ecosistema.lock:
+                time.sleep(0.0005)
+            time.sleep(0.0005)
+
+    threads = [threading.Thread(target=producir, args=(k,), daemon=True)
+               for k in range(args.productores)]
+    threads.append(threading.Thread(target=interfaz, daemon=True))
+    for thread in threads:
+        thread.start()
+
+    # Un segundo para llenar la cola antes de medir
+    time.sleep(1.0)
+    inicial = procesados[0]
+    inicio = time.perf_counter()
+    time.sleep(args.segundos)
+    tasa = (procesados[0] - inicial) / (time.perf_counter() - inicio)
+    activo = False
+
+    print(f"{args.raiz}: {tasa:,.0f} eventos/s procesados, cola {ecosistema.cola_eventos.qsize()}")
+    estadisticas = getattr(ecosistema, 'estadisticas_eventos', None)
+    if estadisticas is not None:
+        print(f"  último lote: {estadisticas['ultimo_lote']} eventos a "
+              f"{estadisticas['eventos_por_segundo']:,.0f} eventos/s dentro del lock")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""Mide con tracemalloc los bytes por entidad de organismos y eventos.
+
+Para cada especie crea `--entidades` organismos y los agrega a un
+AlmacenMundo, como hace el Ecosistema. Informa lo que ocupan los objetos
+con sus valores propios y, aparte, el total por entidad, que suma las
+columnas del almacén y la lista de entidades. También mide un
+EventoEcosistema y, si se indica `--ecosistema`, un Ecosistema completo
+con tareas e índices.
+
+Para comparar antes y después de un cambio, se corre sobre dos árboles:
+
+    git worktree add /tmp/antes <commit>^
+    python benchmarks/memoria_entidades.py --raiz /tmp/antes
+    python benchmarks/memoria_entidades.py
+"""
+import argparse
+import contextlib
+import gc
+import os
+import random
+import sys
+import tracemalloc
+from typing import Tuple
+
+
+def medir(crear, cantidad: int) -> float:
+    """Bytes por objeto que quedan reservados después de crear `cantidad`."""
+    gc.collect()
+    tracemalloc.start()
+    objetos = [crear() for _ in range(cantidad)]
+    ocupado = tracemalloc.get_traced_memory()[0] - sys.getsizeof(objetos)
+    tracemalloc.stop()
+    return ocupado / cantidad
+
+
+def medir_organismos(clase_mundo, nombre: str, crear, posiciones: list) -> Tuple[float, float]:
+    """Bytes por organismo agregado a un AlmacenMundo con capacidad reservada.
+
+    Returns:
+        Tuple[float, float]: Bytes de los objetos y bytes totales, con las
+            columnas del almacén y la lista de entidades.
+    """
+    gc.collect()
+    tracemalloc.start()
+    mundo = clase_mundo(capacidad=len(posiciones))
+    mundo.codigo_especie(nombre)
+    columnas = tracemalloc.get_traced_memory()[0]
+    for posicion in posiciones:
+        mundo.agregar(crear(posicion))
+    total = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    objetos = total - columnas - sys.getsizeof(mundo.entidades)
+    return objetos / len(posiciones), total / len(posiciones)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--raiz', default=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                        help="Árbol del ecosistema a medir. Por defecto este repositorio.")
+    parser.add_argument('--entidades', type=int, default=1000000)
+    parser.add_argument('--ecosistema', type=int, default=0,
+                        help="Entidades del Ecosistema completo a medir; 0 no lo mide.")
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.raiz)
+    from AlmacenMundo import AlmacenMundo
+    from Animales.Carnivoros.Leon import Leon
+    from Animales.Herbivoros.Conejo import Conejo
+    from Ecosistema import Ecosistema, EventoEcosistema
+    from Plantas.Florales.Rosal import Rosal
+    from Plantas.Frutales.Manzano import Manzano
+
+    especies = {
+        'Conejo': (lambda p: Conejo("Conejo", 100, 4.0, p), 'herbivoro'),
+        'Leon': (lambda p: Leon("Leon", 100, 2.0, p), 'carnivoro'),
+        'Manzano': (lambda p: Manzano(1.0, 0, p, 100, 100), 'frutal'),
+        'Rosal': (lambda p: Rosal(0.5, 0, p, 100, 100), 'floral'),
+    }
+    random.seed(0)
+    n = args.entidades
+    posiciones = [(random.uniform(0, 1000), random.uniform(0, 1000)) for _ in range(n)]
+
+    resultados = {}
+    # Los constructores de algunas especies imprimen mensajes
+    with open(os.devnull, 'w') as nulo, contextlib.redirect_stdout(nulo):
+        for nombre, (crear, _) in especies.items():
+            resultados[nombre] = medir_organismos(AlmacenMundo, nombre, crear, posiciones)
+            gc.collect()
+        resultados['EventoEcosistema'] = (medir(
+            lambda: EventoEcosistema('mover', None, None, {}), n),)
+
+        if args.ecosistema:
+            ecosistema = Ecosistema((1000, 1000))
+            ecosistema.pausar_simulacion()
+            gc.collect()
+            tracemalloc.start()
+            for i in range(args.ecosistema):
+                resto = i % 10
+                nombre = 'Leon' if resto == 0 else 'Manzano' if resto < 4 else 'Conejo'
+                crear, categoria = especies[nombre]
+                ecosistema.agregar_entidad(crear(posiciones[i % n]), categoria)
+            ecosistema.tomar_entidades_nuevas()
+            gc.collect()
+            resultados['Ecosistema completo'] = (
+                tracemalloc.get_traced_memory()[0] / args.ecosistema,)
+            tracemalloc.stop()
+            ecosistema.detener_simulacion()
+
+    print(f"{args.raiz}: bytes por entidad con {n} entidades (objetos / total con columnas)")
+    for nombre, medidas in resultados.items():
+        print(f"  {nombre:20} " + " / ".join(f"{bytes_por_entidad:4.0f}" for bytes_por_entidad in medidas))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+"""Mide el tiempo de cuadro de la ventana con miles de sprites en pantalla.
+
+Crea la ventana con la plataforma 'offscreen' de Qt y un ecosistema de
+1000x600 con `--sprites` organismos, todos visibles. Cada cuadro avanza el
+ecosistema un tick, actualiza la escena y la pinta; se informa la mediana
+de cada parte sin contar los primeros cuadros. No se miden `step()`, las
+listas laterales ni el panel de registros.
+
+Para comparar antes y después de un cambio, se corre sobre dos árboles:
+
+    git worktree add /tmp/antes <commit>^
+    python benchmarks/sprites.py --raiz /tmp/antes
+    python benchmarks/sprites.py
+"""
+import argparse
+import contextlib
+import os
+import random
+import statistics
+import sys
+import time
+
+CUADROS_DESCARTADOS = 5
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--raiz', default=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                        help="Árbol del ecosistema a medir. Por defecto este repositorio.")
+    parser.add_argument('--sprites', type=int, default=5000)
+    parser.add_argument('--cuadros', type=int, default=30)
+    args = parser.parse_args()
+
+    os.environ['QT_QPA_PLATFORM'] = 'offscreen'
+    sys.path.insert(0, args.raiz)
+    sys.path.insert(0, os.path.join(args.raiz, 'interfaces'))
+    # La ventana carga las imágenes con rutas relativas a interfaces/
+    os.chdir(os.path.join(args.raiz, 'interfaces'))
+
+    from PyQt6.QtWidgets import QApplication
+    aplicacion = QApplication([])
+    import ventana as modulo_ventana
+    from Animales.Carnivoros.Leon import Leon
+    from Animales.Herbivoros.Conejo import Conejo
+    from Ecosistema import Ecosistema
+    from Plantas.Florales.Rosal import Rosal
+    from Plantas.Frutales.Manzano import Manzano
+
+    random.seed(3)
+    with open(os.devnull, 'w') as nulo, contextlib.redirect_stdout(nulo):
+        ventana = modulo_ventana.EcosistemaGUI()
+        ventana.resize(1200, 800)
+        ventana.show()
+        aplicacion.processEvents()
+
+        ecosistema = Ecosistema((1000, 600))
+        ecosistema.pausar_simulacion()
+        ventana.ecosistema = ecosistema
+        for i in range(args.sprites):
+            posicion = (random.uniform(0, 1000), random.uniform(0, 600))
+            resto = i % 10
+            if resto == 0:
+                ecosistema.agregar_entidad(Leon("Leon", 100, 2.0, posicion), 'carnivoro')
+            elif resto < 4:
+                ecosistema.agregar_entidad(Conejo("Conejo", 100, 4.0, posicion), 'herbivoro')
+            elif resto < 7:
+                ecosistema.agregar_entidad(Manzano(1.0, 0, posicion, 100, 100), 'frutal')
+            else:
+                ecosistema.agregar_entidad(Rosal(0.5, 0, posicion, 100, 100), 'floral')
+
+        # Todo el mundo en pantalla y con sprites, sin pasar a puntos
+        # aunque nazcan organismos
+        if hasattr(ventana, 'MAXIMO_SPRITES'):
+            ventana.MAXIMO_SPRITES = 2 * args.sprites
+        ventana.view.resetTransform()
+        ventana.view.centerOn(500, 300)
+        if hasattr(ventana, '_sincronizar_entidades'):
+            ventana._sincronizar_entidades()
+        ventana.actualizar_lista_animales_y_plantas = lambda: None
+        ventana.mostrar_estadisticas = lambda: None
+        ventana._mostrar_registros = ecosistema.tomar_registros
+
+        paso = ecosistema.step
+        # Los árboles anteriores al dibujo por zoom avanzan el modelo dentro
+        # de actualizar_escena; el tick se ejecuta fuera de la medición
+        ecosistema.step = lambda n=1: None
+
+        def actualizar():
+            if hasattr(ventana, '_actualizar_area_visible'):
+                ecosistema.tomar_entidades_nuevas()
+                ventana._actualizar_area_visible()
+                for item in ventana.animal_items.values():
+                    item.interpolar(1.0)
+            else:
+                ventana.actualizar_escena()
+
+        escena, pintura = [], []
+        for cuadro in range(args.cuadros):
+            paso()
+            inicio = time.perf_counter()
+            actualizar()
+            fin_escena = time.perf_counter()
+            ventana.view.viewport().repaint()
+            fin_pintura = time.perf_counter()
+            if cuadro >= CUADROS_DESCARTADOS:
+                escena.append(fin_escena - inicio)
+                pintura.append(fin_pintura - fin_escena)
+
+        sprites = len(ventana.animal_items) + len(ventana.planta_items)
+        ecosistema.detener_simulacion()
+
+    cuadros = [a + b for a, b in zip(escena, pintura)]
+    print(f"{args.raiz}: {sprites} sprites, mediana de {len(cuadros)} cuadros: "
+          f"escena {statistics.median(escena) * 1000:.1f} ms, "
+          f"pintura {statistics.median(pintura) * 1000:.1f} ms, "
+          f"cuadro {statistics.median(cuadros) * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,17 +1,19 @@
 import math
 
+import numpy as np
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QPushButton, QGraphicsScene, QGraphicsView,
-                             QMessageBox, QLabel, QHBoxLayout, QListWidget, QSplitter, QFrame, QDialog)
-from PyQt6.QtGui import QPixmap, QBrush, QPen, QColor
-from PyQt6.QtCore import Qt, QTimer, QRectF, QTime
+                             QMessageBox, QLabel, QHBoxLayout, QSplitter, QFrame, QDialog,
+                             QTreeView, QListView, QComboBox, QGraphicsItem, QCheckBox)
+from PyQt6.QtGui import QPixmap, QBrush, QPen, QColor, QPolygonF, QImage
+from PyQt6.QtCore import (Qt, QTimer, QRectF, QPointF, QTime, pyqtSignal, QAbstractItemModel,
+                          QAbstractListModel, QModelIndex)
 import sys
 import os
 import random
-from typing import Dict, List
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
 from Animales.Carnivoros.Carnivoro import Carnivoro
-from Animales.Habilidades.Nadador import Nadador
-from Animales.Habilidades.Volador import Volador
 from Animales.Herbivoros.Herbivoro import Herbivoro
 from Ecosistema import Ecosistema
 from Animales.Animal import Animal
@@ -19,7 +21,11 @@ from Animales.Carnivoros.Leon import Leon
 from Animales.Carnivoros.Aguila_real import Aguila_real
 from Animales.Herbivoros.Conejo import Conejo
 from Animales.Herbivoros.Ciervo import Ciervo
+from CuadroSimulacion import CuadroSimulacion
 from GestorEstado import GestorEstado
+from ProcesoSimulacion import ProcesoSimulacion
+from RegistroCircular import RegistroCircular
+from RelojSimulacion import RelojSimulacion
 from Plantas.Florales.Cempasuchil import Cempasuchil
 from Plantas.Florales.Orquidero import Orquidero
 from Plantas.Florales.Rosal import Rosal
@@ -28,8 +34,142 @@ from Plantas.Frutales.Naranjo import Naranjo
 from Plantas.Frutales.Peral import Peral
 
 
-class AnimalGraphicsItem:
+class CacheSprites:
+    """Pixmaps ya escalados, compartidos por todas las representaciones gráficas.
+
+    Cada imagen se lee del disco una sola vez y cada tamaño se escala una
+    sola vez; todos los items de una especie y tamaño reciben el mismo
+    QPixmap, que Qt comparte sin copiar. `precargar()` llena la cache al
+    iniciar, así los nacimientos no leen ni escalan imágenes en el thread
+    de la interfaz.
+    """
+    TAMANO_BASE = 30
+    TAMANO_MAXIMO = 60
+    PASO_TAMANO = 5  # Los tamaños de planta se redondean a múltiplos de este paso
+
+    _originales: Dict[str, QPixmap] = {}
+    _escalados: Dict[tuple, QPixmap] = {}
+
+    @classmethod
+    def tamano_planta(cls, altura: float) -> int:
+        """Obtiene el tamaño del sprite de una planta según su altura"""
+        factor_escala = min(2.0, max(1.0, altura))
+        tamano = int(cls.TAMANO_BASE * factor_escala)
+        return cls.PASO_TAMANO * round(tamano / cls.PASO_TAMANO)
+
+    @classmethod
+    def obtener(cls, imagen_path: str, tamano: int, color_relleno: QColor,
+                color_error: QColor) -> QPixmap:
+        """Obtiene el sprite de una imagen en un tamaño, creándolo si no existe.
+
+        Args:
+            imagen_path (str): Ruta de la imagen.
+            tamano (int): Lado del sprite en píxeles.
+            color_relleno (QColor): Color del sprite si la imagen no existe.
+            color_error (QColor): Color del sprite si la imagen no se pudo leer.
+
+        Returns:
+            QPixmap: Sprite compartido.
+        """
+        clave = (imagen_path, tamano)
+        pixmap = cls._escalados.get(clave)
+        if pixmap is not None:
+            return pixmap
+
+        try:
+            if imagen_path not in cls._originales:
+                cls._originales[imagen_path] = (QPixmap(imagen_path)
+                                                if os.path.exists(imagen_path) else None)
+            original = cls._originales[imagen_path]
+            if original is not None:
+                pixmap = original.scaled(tamano, tamano, Qt.AspectRatioMode.KeepAspectRatio)
+            else:
+                pixmap = QPixmap(cls.TAMANO_BASE, cls.TAMANO_BASE)
+                pixmap.fill(color_relleno)
+        except Exception as e:
+            print(f"Error al cargar imagen {imagen_path}: {str(e)}")
+            pixmap = QPixmap(cls.TAMANO_BASE, cls.TAMANO_BASE)
+            pixmap.fill(color_error)
+
+        cls._escalados[clave] = pixmap
+        return pixmap
+
+    @classmethod
+    def precargar(cls, imagenes_animales: Dict[str, str], imagenes_plantas: Dict[str, str]):
+        """Crea los sprites de todas las especies y tamaños de planta"""
+        for imagen_path in imagenes_animales.values():
+            AnimalGraphicsItem.sprite(imagen_path)
+        for imagen_path in imagenes_plantas.values():
+            for tamano in range(cls.TAMANO_BASE, cls.TAMANO_MAXIMO + 1, cls.PASO_TAMANO):
+                PlantaGraphicsItem.sprite(imagen_path, tamano)
+
+        # Las imágenes originales ya no se necesitan
+        cls._originales.clear()
+
+class ElementoGrafico:
+    """Base de las representaciones gráficas: conserva su item en la escena.
+
+    El item se crea una sola vez al agregarlo a la escena; en cada cuadro
+    solo se mueve, y se quita cuando el organismo muere o sale de la vista.
+    """
+    Z_VALOR = 0
+
+    item_escena = None
+    _posicion = None
+
+    def agregar_a_escena(self, escena: QGraphicsScene):
+        """Crea el item de la escena en la posición actual del organismo"""
+        self._posicion = (self.x, self.y)
+        self.item_escena = escena.addPixmap(self.pixmap)
+        self.item_escena.setZValue(self.Z_VALOR)
+        self.item_escena.setPos(*self._posicion)
+
+    def actualizar_posicion(self):
+        """Mueve el item de la escena a la posición actual del organismo"""
+        self._mover((self.x, self.y))
+
+    def _mover(self, posicion: tuple):
+        """Mueve el item de la escena si la posición cambió"""
+        if posicion != self._posicion:
+            self._posicion = posicion
+            self.item_escena.setPos(*posicion)
+
+    def quitar_de_escena(self):
+        """Quita el item de la escena"""
+        if self.item_escena is not None:
+            escena = self.item_escena.scene()
+            if escena is not None:
+                escena.removeItem(self.item_escena)
+            self.item_escena = None
+
+class AnimalGraphicsItem(ElementoGrafico):
     """Clase para manejar la representación gráfica de cada animal"""
+    # Los animales se dibujan sobre las plantas
+    Z_VALOR = 1
+
+    # Tramo que recorre el sprite hasta el próximo tick
+    _desde = None
+    _hasta = None
+
+    def actualizar_posicion(self):
+        """Fija como destino la posición actual del animal, partiendo de la dibujada.
+
+        El item no se mueve aquí: `interpolar()` lo lleva hacia el destino
+        a medida que avanza el tick.
+        """
+        self._desde = self._posicion
+        self._hasta = (self.x, self.y)
+
+    def interpolar(self, alfa: float):
+        """Dibuja el sprite en la fracción `alfa` del tramo hacia su destino"""
+        if self._hasta is None or self._hasta == self._desde:
+            return
+        if alfa >= 1.0:
+            self._mover(self._hasta)
+            return
+        (x0, y0), (x1, y1) = self._desde, self._hasta
+        self._mover((x0 + (x1 - x0) * alfa, y0 + (y1 - y0) * alfa))
+
     def __init__(self, animal: 'Animal', imagen_path: str):
         self.animal = animal
         self.imagen_path = imagen_path
@@ -59,19 +199,17 @@ class AnimalGraphicsItem:
             return isinstance(presa, Conejo)
         return False
 
+    @staticmethod
+    def sprite(imagen_path: str) -> QPixmap:
+        """Obtiene de la cache el sprite de una especie de animal"""
+        return CacheSprites.obtener(imagen_path, CacheSprites.TAMANO_BASE,
+                                    QColor(random.randint(0, 255),
+                                           random.randint(0, 255),
+                                           random.randint(0, 255)),
+                                    QColor(255, 0, 0))
+
     def cargar_imagen(self):
-        try:
-            if os.path.exists(self.imagen_path):
-                self.pixmap = QPixmap(self.imagen_path).scaled(30, 30, Qt.AspectRatioMode.KeepAspectRatio)
-            else:
-                self.pixmap = QPixmap(30, 30)
-                self.pixmap.fill(QColor(random.randint(0, 255),
-                                        random.randint(0, 255),
-                                        random.randint(0, 255)))
-        except Exception as e:
-            print(f"Error al cargar imagen {self.imagen_path}: {str(e)}")
-            self.pixmap = QPixmap(30, 30)
-            self.pixmap.fill(QColor(255, 0, 0))
+        self.pixmap = self.sprite(self.imagen_path)
 
     # def mover(self, width: int, height: int):
     #     """Mueve al animal en una dirección con posible cambio aleatorio"""
@@ -111,7 +249,7 @@ class AnimalGraphicsItem:
     def y(self):
         return self.animal.ubicacion[1] if self.animal else 0
 
-class PlantaGraphicsItem:
+class PlantaGraphicsItem(ElementoGrafico):
     """Clase para manejar la representación gráfica de cada planta"""
     def __init__(self, planta: 'Planta', imagen_path: str):
         self.planta = planta
@@ -121,25 +259,16 @@ class PlantaGraphicsItem:
         self.tiempo_crecimiento = 0
         self.tiempo_reproduccion = 0
 
+    @staticmethod
+    def sprite(imagen_path: str, tamano: int) -> QPixmap:
+        """Obtiene de la cache el sprite de una especie de planta en un tamaño"""
+        return CacheSprites.obtener(imagen_path, tamano,
+                                    QColor(34, 139, 34),  # Verde forestal por defecto
+                                    QColor(0, 255, 0))
+
     def cargar_imagen(self):
-        try:
-            if os.path.exists(self.imagen_path):
-                # Escalar según la altura de la planta
-                tamano_base = 30
-                factor_escala = min(2.0, max(1.0, self.planta.altura))
-                tamano = int(tamano_base * factor_escala)
-
-                self.pixmap = QPixmap(self.imagen_path).scaled(
-                    tamano, tamano,
-                    Qt.AspectRatioMode.KeepAspectRatio
-                )
-            else:
-                self.pixmap = QPixmap(30, 30)
-                self.pixmap.fill(QColor(34, 139, 34))  # Verde forestal por defecto
-        except Exception as e:
-            print(f"Error al cargar imagen {self.imagen_path}: {str(e)}")
-            self.pixmap = QPixmap(30, 30)
-            self.pixmap.fill(QColor(0, 255, 0))
+        # Escalar según la altura de la planta
+        self.pixmap = self.sprite(self.imagen_path, CacheSprites.tamano_planta(self.planta.altura))
 
     @property
     def x(self):
@@ -149,7 +278,513 @@ class PlantaGraphicsItem:
     def y(self):
         return self.planta.ubicacion[1] if self.planta else 0
 
+class CuadroGraphicsItem(ElementoGrafico):
+    """Representación gráfica de una entidad de un cuadro publicado por otro proceso.
+
+    De la entidad solo se conocen su especie y su posición en el último cuadro.
+    """
+    def __init__(self, pixmap: QPixmap, es_animal: bool):
+        self.pixmap = pixmap
+        self.Z_VALOR = AnimalGraphicsItem.Z_VALOR if es_animal else PlantaGraphicsItem.Z_VALOR
+        self.x = 0.0
+        self.y = 0.0
+
+class VistaEcosistema(QGraphicsView):
+    """Vista del mundo con zoom con la rueda del ratón y desplazamiento arrastrando.
+
+    Emite `area_visible_cambiada` cada vez que cambia la parte del mundo
+    que se ve, para que la ventana dibuje solo lo que está en pantalla.
+    """
+    area_visible_cambiada = pyqtSignal()
+
+    FACTOR_ZOOM = 1.25  # Por cada paso de la rueda
+    ESCALA_MINIMA = 0.02
+    ESCALA_MAXIMA = 4.0
+
+    def __init__(self, escena: QGraphicsScene):
+        super().__init__(escena)
+        self.setDragMode(QGraphicsView.DragMode.ScrollHandDrag)
+        self.setTransformationAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
+
+    @property
+    def escala(self) -> float:
+        """float: Píxeles de pantalla por unidad del mundo"""
+        return self.transform().m11()
+
+    def area_visible(self) -> QRectF:
+        """Obtiene la parte del mundo que se ve en pantalla"""
+        return self.mapToScene(self.viewport().rect()).boundingRect().intersected(self.sceneRect())
+
+    def wheelEvent(self, event):
+        pasos = event.angleDelta().y() / 120
+        if not pasos:
+            return
+        # No alejar más de lo necesario para ver el mundo entero
+        mundo = self.sceneRect()
+        ajuste = min(self.viewport().width() / max(mundo.width(), 1),
+                     self.viewport().height() / max(mundo.height(), 1))
+        minima = max(self.ESCALA_MINIMA, min(ajuste, 1.0))
+        escala = min(self.ESCALA_MAXIMA, max(minima, self.escala * self.FACTOR_ZOOM ** pasos))
+        if escala != self.escala:
+            factor = escala / self.escala
+            self.scale(factor, factor)
+            self.area_visible_cambiada.emit()
+
+    def scrollContentsBy(self, dx, dy):
+        super().scrollContentsBy(dx, dy)
+        self.area_visible_cambiada.emit()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.area_visible_cambiada.emit()
+
+class CapaPuntos(QGraphicsItem):
+    """Nivel de detalle intermedio: un punto de color por organismo visible.
+
+    Un solo item dibuja todos los puntos, con una llamada a drawPoints por
+    color, en lugar de un item por organismo. Los puntos tienen el mismo
+    tamaño en pantalla con cualquier zoom.
+    """
+    TAMANO_PUNTO = 4  # Píxeles
+
+    def __init__(self):
+        super().__init__()
+        self._area = QRectF()
+        self._puntos: List[Tuple[QPen, QPolygonF]] = []
+
+    def establecer_area(self, area: QRectF):
+        """Fija el rectángulo del mundo que puede ocupar la capa"""
+        self.prepareGeometryChange()
+        self._area = QRectF(area)
+
+    def actualizar(self, grupos: List[Tuple[QColor, Iterable[Tuple[float, float]]]]):
+        """Reemplaza los puntos; los grupos se dibujan en orden, el último encima.
+
+        Args:
+            grupos (List[Tuple[QColor, Iterable[Tuple[float, float]]]]): Color
+                y posiciones de cada grupo.
+        """
+        self._puntos = []
+        for color, posiciones in grupos:
+            puntos = QPolygonF([QPointF(x, y) for x, y in posiciones])
+            if puntos.isEmpty():
+                continue
+            pluma = QPen(color, self.TAMANO_PUNTO)
+            pluma.setCosmetic(True)
+            pluma.setCapStyle(Qt.PenCapStyle.RoundCap)
+            self._puntos.append((pluma, puntos))
+        self.update()
+
+    def limpiar(self):
+        """Quita todos los puntos"""
+        if self._puntos:
+            self._puntos = []
+            self.update()
+
+    def boundingRect(self):
+        return self._area
+
+    def paint(self, painter, option, widget=None):
+        for pluma, puntos in self._puntos:
+            painter.setPen(pluma)
+            painter.drawPoints(puntos)
+
+class CapaAgregados(QGraphicsItem):
+    """Nivel de detalle mínimo: celdas sombreadas según cuántos organismos contienen.
+
+    Las celdas tienen TAMANO_CELDA píxeles de pantalla, así su cantidad
+    depende del tamaño de la vista y no del mundo. Se reparten en NIVELES
+    tonos y se dibujan con una llamada a drawRects por tono.
+    """
+    TAMANO_CELDA = 16  # Píxeles
+    COLOR = QColor(0, 70, 0)
+    NIVELES = 8
+
+    def __init__(self):
+        super().__init__()
+        self._area = QRectF()
+        self._celdas: List[Tuple[QBrush, List[QRectF]]] = []
+
+    def establecer_area(self, area: QRectF):
+        """Fija el rectángulo del mundo que puede ocupar la capa"""
+        self.prepareGeometryChange()
+        self._area = QRectF(area)
+
+    def actualizar(self, x_min: float, y_min: float, lado: float, conteos: np.ndarray):
+        """Reemplaza las celdas sombreadas.
+
+        Args:
+            x_min (float): Borde izquierdo de la primera columna.
+            y_min (float): Borde superior de la primera fila.
+            lado (float): Lado de las celdas en unidades del mundo.
+            conteos (np.ndarray): Cantidad de organismos por celda (filas, columnas).
+        """
+        self._celdas = []
+        maximo = int(conteos.max(initial=0))
+        if maximo:
+            filas, columnas = np.nonzero(conteos)
+            niveles = np.ceil(self.NIVELES * conteos[filas, columnas] / maximo).astype(int)
+            for nivel in np.unique(niveles):
+                elegidas = niveles == nivel
+                rectangulos = [QRectF(x_min + columna * lado, y_min + fila * lado, lado, lado)
+                               for fila, columna in zip(filas[elegidas].tolist(),
+                                                        columnas[elegidas].tolist())]
+                color = QColor(self.COLOR)
+                color.setAlpha(40 + 215 * int(nivel) // self.NIVELES)
+                self._celdas.append((QBrush(color), rectangulos))
+        self.update()
+
+    def limpiar(self):
+        """Quita todas las celdas"""
+        if self._celdas:
+            self._celdas = []
+            self.update()
+
+    def boundingRect(self):
+        return self._area
+
+    def paint(self, painter, option, widget=None):
+        painter.setPen(Qt.PenStyle.NoPen)
+        for brocha, rectangulos in self._celdas:
+            painter.setBrush(brocha)
+            painter.drawRects(rectangulos)
+
+class CapaDensidad(QGraphicsItem):
+    """Mapa de calor de la población: una sola imagen con una capa de color
+    por categoría de organismo.
+
+    Los conteos por celda de cada categoría se normalizan con escala
+    logarítmica respecto del máximo de la categoría, así una especie escasa
+    sigue viéndose junto a una abundante. El color de cada celda es la
+    mezcla de los de sus categorías, pesados por intensidad, y su opacidad
+    la mayor intensidad. Todo se calcula con NumPy y se dibuja con un solo
+    drawImage por cuadro, sin importar cuántos organismos haya.
+    """
+    TAMANO_CELDA = 4  # Píxeles
+    # Colores en el orden de Ecosistema.CATEGORIAS
+    COLORES = np.array([
+        (220, 30, 30),   # carnivoro
+        (240, 170, 0),   # herbivoro
+        (0, 140, 0),     # frutal
+        (200, 60, 220),  # floral
+    ], dtype=np.float32)
+
+    def __init__(self):
+        super().__init__()
+        self._area = QRectF()
+        self._destino = QRectF()
+        self._imagen: Optional[QImage] = None
+        self._pixeles: Optional[np.ndarray] = None  # Memoria de la imagen
+
+    def establecer_area(self, area: QRectF):
+        """Fija el rectángulo del mundo que puede ocupar la capa"""
+        self.prepareGeometryChange()
+        self._area = QRectF(area)
+
+    def actualizar(self, x_min: float, y_min: float, lado: float, conteos: np.ndarray):
+        """Reemplaza la imagen.
+
+        Args:
+            x_min (float): Borde izquierdo de la primera columna.
+            y_min (float): Borde superior de la primera fila.
+            lado (float): Lado de las celdas en unidades del mundo.
+            conteos (np.ndarray): Cantidad por categoría y celda (categorías, filas, columnas).
+        """
+        _, filas, columnas = conteos.shape
+        intensidad = np.log1p(conteos, dtype=np.float32)
+        maximos = intensidad.max(axis=(1, 2), keepdims=True)
+        np.divide(intensidad, maximos, out=intensidad, where=maximos > 0)
+
+        peso = intensidad.sum(axis=0)
+        opacidad = intensidad.max(axis=0)
+        # Mezcla de colores pesada por intensidad, premultiplicada por la opacidad
+        color = np.tensordot(intensidad, self.COLORES, axes=(0, 0))
+        color *= (opacidad / np.maximum(peso, 1e-6))[:, :, None]
+
+        pixeles = np.empty((filas, columnas, 4), dtype=np.uint8)
+        pixeles[:, :, :3] = color
+        pixeles[:, :, 3] = opacidad * 255
+
+        self._pixeles = pixeles
+        self._imagen = QImage(pixeles.data, columnas, filas, columnas * 4,
+                              QImage.Format.Format_RGBA8888_Premultiplied)
+        self._destino = QRectF(x_min, y_min, columnas * lado, filas * lado)
+        self.update()
+
+    def limpiar(self):
+        """Quita la imagen"""
+        if self._imagen is not None:
+            self._imagen = None
+            self._pixeles = None
+            self.update()
+
+    def boundingRect(self):
+        return self._area
+
+    def paint(self, painter, option, widget=None):
+        if self._imagen is not None:
+            painter.drawImage(self._destino, self._imagen)
+
+class GrupoEspecie:
+    """Fila de una especie en el modelo de población, con sus organismos"""
+    __slots__ = ('id', 'especie', 'es_animal', 'organismos', 'valores', 'numeros',
+                 'siguiente_numero', 'resumen')
+
+    def __init__(self, id_grupo: int, especie: str, es_animal: bool):
+        self.id = id_grupo
+        self.especie = especie
+        self.es_animal = es_animal
+        self.organismos = []
+        self.valores = []
+        self.numeros = []  # Número fijo de cada organismo dentro de su especie
+        self.siguiente_numero = 1
+        self.resumen = None
+
+class ModeloPoblacion(QAbstractItemModel):
+    """Modelo de dos niveles con la población del ecosistema.
+
+    Las filas de primer nivel son las especies, con la cantidad de
+    organismos y sus promedios; sus hijas son los organismos. En cada
+    `actualizar()` se insertan los nacimientos, se quitan las muertes y
+    solo se emite `dataChanged` para las filas cuyos valores cambiaron.
+    Cada organismo conserva el número que recibió al aparecer, así quitar
+    filas no cambia el texto de las siguientes. El texto se arma en
+    `data()`, así la vista solo formatea las filas que muestra.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._grupos: List[GrupoEspecie] = []
+        self._por_id: Dict[int, GrupoEspecie] = {}
+        self._siguiente_id = 1
+
+    # Estructura
+    def index(self, row, column, parent=QModelIndex()):
+        if column != 0 or row < 0:
+            return QModelIndex()
+        if not parent.isValid():
+            if row < len(self._grupos):
+                return self.createIndex(row, 0, 0)
+            return QModelIndex()
+        grupo = self._grupos[parent.row()]
+        if row < len(grupo.organismos):
+            return self.createIndex(row, 0, grupo.id)
+        return QModelIndex()
+
+    def parent(self, index=QModelIndex()):
+        if not index.isValid() or index.internalId() == 0:
+            return QModelIndex()
+        grupo = self._por_id[index.internalId()]
+        return self.createIndex(self._grupos.index(grupo), 0, 0)
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self._grupos)
+        if parent.internalId() == 0:
+            return len(self._grupos[parent.row()].organismos)
+        return 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if index.internalId() == 0:
+            grupo = self._grupos[index.row()]
+            cantidad, energia, extra = grupo.resumen
+            texto = f"{grupo.especie}s ({cantidad}) - Energía media: {energia:.1f}%"
+            if extra is not None:
+                texto += f" | {extra[0]}: {extra[1]}"
+            return texto
+
+        grupo = self._por_id[index.internalId()]
+        valores = grupo.valores[index.row()]
+        numero = grupo.numeros[index.row()]
+        if grupo.es_animal:
+            return f"{grupo.especie} {numero} - Energía: {valores[0]:.1f}%"
+        altura, extra, agua, energia = valores
+        texto = f"{grupo.especie} {numero} - Altura: {altura:.1f}m"
+        if extra is not None:
+            texto += f" | {extra[0]}: {extra[1]}"
+        return texto + f" | Agua: {agua:.1f}% | Energía: {energia:.1f}%"
+
+    # Actualización
+    @staticmethod
+    def _valores(organismo, es_animal: bool) -> tuple:
+        """Obtiene los valores que se muestran de un organismo"""
+        if es_animal:
+            return (organismo.nivel_energia,)
+        if hasattr(organismo, 'frutos'):
+            extra = ('Frutos', organismo.frutos)
+        elif hasattr(organismo, 'flores'):
+            extra = ('Flores', organismo.flores)
+        else:
+            extra = None
+        return organismo.altura, extra, organismo.nivel_agua, organismo.nivel_energia
+
+    @staticmethod
+    def _resumen(grupo: GrupoEspecie) -> tuple:
+        """Calcula la cantidad, la energía media redondeada y el total de frutos o flores"""
+        cantidad = len(grupo.valores)
+        energia = round(sum(valores[-1] for valores in grupo.valores) / cantidad, 1)
+        extra = None
+        if not grupo.es_animal and grupo.valores[0][1] is not None:
+            extra = (grupo.valores[0][1][0], sum(valores[1][1] for valores in grupo.valores))
+        return cantidad, energia, extra
+
+    @staticmethod
+    def _rangos(filas: List[int]):
+        """Agrupa filas ordenadas en rangos contiguos (primera, última)"""
+        inicio = anterior = filas[0]
+        for fila in filas[1:]:
+            if fila != anterior + 1:
+                yield inicio, anterior
+                inicio = fila
+            anterior = fila
+        yield inicio, anterior
+
+    def actualizar(self, animales: list, plantas: list):
+        """Sincroniza el modelo con los organismos vivos.
+
+        Args:
+            animales (list): Animales vivos, en orden de aparición.
+            plantas (list): Plantas vivas, en orden de aparición.
+        """
+        por_especie: Dict[tuple, list] = {}
+        for es_animal, organismos in ((True, animales), (False, plantas)):
+            for organismo in organismos:
+                por_especie.setdefault((organismo.__class__.__name__, es_animal), []).append(organismo)
+
+        # Especies existentes: muertes, nacimientos y cambios de valores
+        for grupo in list(self._grupos):
+            vivos = por_especie.pop((grupo.especie, grupo.es_animal), [])
+            if not vivos:
+                fila = self._grupos.index(grupo)
+                self.beginRemoveRows(QModelIndex(), fila, fila)
+                self._grupos.pop(fila)
+                del self._por_id[grupo.id]
+                self.endRemoveRows()
+                continue
+            self._actualizar_grupo(grupo, vivos)
+
+        # Especies nuevas: los animales antes que las plantas
+        for (especie, es_animal), vivos in por_especie.items():
+            grupo = GrupoEspecie(self._siguiente_id, especie, es_animal)
+            self._siguiente_id += 1
+            grupo.organismos = vivos
+            grupo.valores = [self._valores(organismo, es_animal) for organismo in vivos]
+            grupo.numeros = list(range(1, len(vivos) + 1))
+            grupo.siguiente_numero = len(vivos) + 1
+            grupo.resumen = self._resumen(grupo)
+            fila = (sum(1 for otro in self._grupos if otro.es_animal)
+                    if es_animal else len(self._grupos))
+            self.beginInsertRows(QModelIndex(), fila, fila)
+            self._grupos.insert(fila, grupo)
+            self._por_id[grupo.id] = grupo
+            self.endInsertRows()
+
+    def _actualizar_grupo(self, grupo: GrupoEspecie, vivos: list):
+        """Aplica los cambios de una especie emitiendo solo las señales necesarias"""
+        padre = self.createIndex(self._grupos.index(grupo), 0, 0)
+
+        # Quitar los muertos, de atrás hacia adelante
+        presentes = set(vivos)
+        muertos = [fila for fila, organismo in enumerate(grupo.organismos)
+                   if organismo not in presentes]
+        if muertos:
+            for primera, ultima in reversed(list(self._rangos(muertos))):
+                self.beginRemoveRows(padre, primera, ultima)
+                del grupo.organismos[primera:ultima + 1]
+                del grupo.valores[primera:ultima + 1]
+                del grupo.numeros[primera:ultima + 1]
+                self.endRemoveRows()
+
+        # Comparar los valores de los que siguen
+        cambiados = []
+        for fila, organismo in enumerate(grupo.organismos):
+            valores = self._valores(organismo, grupo.es_animal)
+            if valores != grupo.valores[fila]:
+                grupo.valores[fila] = valores
+                cambiados.append(fila)
+        if cambiados:
+            for primera, ultima in self._rangos(cambiados):
+                self.dataChanged.emit(self.index(primera, 0, padre), self.index(ultima, 0, padre))
+
+        # Agregar los nacidos al final
+        conocidos = set(grupo.organismos)
+        nuevos = [organismo for organismo in vivos if organismo not in conocidos]
+        if nuevos:
+            inicio = len(grupo.organismos)
+            self.beginInsertRows(padre, inicio, inicio + len(nuevos) - 1)
+            grupo.organismos.extend(nuevos)
+            grupo.valores.extend(self._valores(organismo, grupo.es_animal) for organismo in nuevos)
+            grupo.numeros.extend(range(grupo.siguiente_numero, grupo.siguiente_numero + len(nuevos)))
+            grupo.siguiente_numero += len(nuevos)
+            self.endInsertRows()
+
+        resumen = self._resumen(grupo)
+        if resumen != grupo.resumen:
+            grupo.resumen = resumen
+            self.dataChanged.emit(padre, padre)
+
+    def limpiar(self):
+        """Quita todas las filas"""
+        self.beginResetModel()
+        self._grupos = []
+        self._por_id = {}
+        self.endResetModel()
+
+class ModeloAcciones(QAbstractListModel):
+    """Lista de acciones recientes, de la más nueva a la más antigua.
+
+    Se alimenta por lotes con `publicar()`: cada lote inserta sus acciones
+    al principio con una sola señal y quita con otra las que exceden el
+    máximo. La hora se formatea en `data()`, solo para las filas visibles.
+    """
+
+    def __init__(self, maximo: int, parent=None):
+        super().__init__(parent)
+        self.maximo = maximo
+        self._filas = []  # (hora, mensaje), la más nueva primero
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._filas)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        hora, mensaje = self._filas[index.row()]
+        return f"[{time.strftime('%H:%M:%S', time.localtime(hora))}] {mensaje}"
+
+    def publicar(self, nuevas: list):
+        """Agrega un lote de acciones.
+
+        Args:
+            nuevas (list): Pares (hora, mensaje), de la más antigua a la más nueva.
+        """
+        if not nuevas:
+            return
+        nuevas = nuevas[::-1][:self.maximo]
+        self.beginInsertRows(QModelIndex(), 0, len(nuevas) - 1)
+        self._filas[0:0] = nuevas
+        self.endInsertRows()
+
+        if len(self._filas) > self.maximo:
+            self.beginRemoveRows(QModelIndex(), self.maximo, len(self._filas) - 1)
+            del self._filas[self.maximo:]
+            self.endRemoveRows()
+
+    def limpiar(self):
+        """Quita todas las filas"""
+        self.beginResetModel()
+        self._filas = []
+        self.endResetModel()
+
 class EcosistemaGUI(QMainWindow):
+    # Emitida desde el thread escritor de GestorEstado con (ruta, error)
+    guardado_terminado = pyqtSignal(object, object)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Simulación de Ecosistema")
@@ -158,26 +793,7 @@ class EcosistemaGUI(QMainWindow):
         # Constantes del ecosistema
         self.ANCHO_ECOSISTEMA = 1000
         self.ALTO_ECOSISTEMA = 600
-        self.DISTANCIA_REPRODUCCION = 50
-
-        # Parámetros de reproducción ajustados
-        self.TIEMPO_MINIMO_REPRODUCCION = 1  # Aumentado significativamente
-        self.PROBABILIDAD_REPRODUCCION = 100 # 20% de probabilidad cuando se cumplan las condiciones
-        self.ENERGIA_MINIMA_REPRODUCCION = 20  # Energía mínima necesaria para reproducirse
-        self.COSTO_ENERGIA_REPRODUCCION = 10  # Energía que cuesta reproducirse
-
-        # Contadores de tiempo específicos por especie
-        self.TIEMPOS_REPRODUCCION = {
-            'Leon': 400,         # Más tiempo para carnívoros grandes
-            'Aguila_real': 350,
-            'Conejo': 200,       # Menor tiempo para herbívoros pequeños
-            'Ciervo': 250
-        }
-
-        self.ENERGIA_GANADA_CAZA = {
-            'Conejo': 40,
-            'Ciervo': 60
-        }
+        self.INTERVALO_AUTOGUARDADO = 30000  # ms
 
         # Crear el ecosistema
         self.ecosistema = None
@@ -206,28 +822,73 @@ class EcosistemaGUI(QMainWindow):
 
         }
 
-        # Lista para plantas
-        self.planta_items = []
-
-        # Parámetros para plantas
-        self.TIEMPO_MINIMO_REPRODUCCION_PLANTAS = 10000000
-        self.PROBABILIDAD_REPRODUCCION_PLANTAS = 0.001
-        self.DISTANCIA_REPRODUCCION_PLANTAS = 150
-
-        # Representaciones gráficas de los animales
-        self.animal_items = []
+        # Representaciones gráficas de los organismos que están en pantalla,
+        # por organismo; las de los que salen de la vista se quitan
+        self.planta_items: Dict[object, PlantaGraphicsItem] = {}
+        self.animal_items: Dict[object, AnimalGraphicsItem] = {}
+
+        # Nivel de detalle según el zoom: sprites de cerca, puntos de color
+        # al alejarse y celdas sombreadas por densidad desde más lejos. Con
+        # más de MAXIMO_SPRITES organismos en pantalla se usan puntos
+        self.ESCALA_SPRITES = 0.5
+        self.ESCALA_AGREGADOS = 0.15
+        self.MAXIMO_SPRITES = 2000
+        self.COLORES_PUNTOS = {
+            'planta': QColor(0, 100, 0),
+            'herbivoro': QColor(160, 100, 20),
+            'carnivoro': QColor(200, 0, 0),
+        }
 
-        # Timer para actualizar la visualización
+        # Modos de vista: organismos con el nivel de detalle del zoom, o un
+        # mapa de calor por categoría para poblaciones muy grandes
+        self.MODOS_VISTA = ('Organismos', 'Densidad')
+        self.modo_vista = self.MODOS_VISTA[0]
+
+        # Simulación en otro proceso: solo se dibuja el último cuadro que
+        # publicó, con sprites por fila del mundo del otro proceso y especie
+        # (al compactarse el mundo una fila pasa a otra entidad)
+        self.proceso: Optional[ProcesoSimulacion] = None
+        self.cuadro: Optional[CuadroSimulacion] = None
+        self.cuadro_items: Dict[Tuple[int, int], CuadroGraphicsItem] = {}
+
+        # Timer de cuadros: dibuja a lo sumo FPS_MAXIMO veces por segundo y
+        # en cada cuadro el reloj ejecuta los ticks que correspondan al
+        # tiempo real transcurrido; a 1× son 10 ticks por segundo
+        self.FPS_MAXIMO = 30
+        self.VELOCIDADES = {'1×': 1.0, '10×': 10.0, '100×': 100.0, 'Máx': None}
+        self.reloj = RelojSimulacion()
         self.timer = None
 
-        # Agregar lista de animales
-        self.lista_animales = QListWidget()
-        self.lista_animales.setMaximumWidth(300)  # Ancho máximo del panel lateral
-
-        # Agregar lista para registrar acciones
-        self.lista_acciones = QListWidget()
-        self.lista_acciones.setMaximumHeight(200)  # Limitar altura del registro
+        # Timer para guardar el estado periódicamente
+        self.timer_autoguardado = None
+
+        # Agregar el panel de población: un modelo por especie y una vista
+        # que solo dibuja las filas visibles. Las especies empiezan plegadas;
+        # con miles de organismos desplegados la vista rehace su disposición
+        # en cada nacimiento o muerte
+        self.modelo_poblacion = ModeloPoblacion()
+        self.vista_poblacion = QTreeView()
+        self.vista_poblacion.setModel(self.modelo_poblacion)
+        self.vista_poblacion.setHeaderHidden(True)
+        self.vista_poblacion.setUniformRowHeights(True)
+        self.vista_poblacion.setMaximumWidth(300)  # Ancho máximo del panel lateral
+
+        # Agregar lista para registrar acciones. Registrar una acción solo
+        # la agrega a un búfer circular; un timer publica las nuevas en la
+        # lista en un solo lote, a lo sumo FRECUENCIA_REGISTRO veces por segundo
         self.max_acciones = 100  # Máximo número de acciones a mostrar
+        self.FRECUENCIA_REGISTRO = 4  # Hz
+        self.registro_acciones = RegistroCircular(self.max_acciones)
+        self._leidos_registro = 0
+        self.modelo_acciones = ModeloAcciones(self.max_acciones)
+        self.lista_acciones = QListView()
+        self.lista_acciones.setModel(self.modelo_acciones)
+        self.lista_acciones.setUniformItemSizes(True)
+        self.lista_acciones.setMaximumHeight(200)  # Limitar altura del registro
+        self.timer_registro = QTimer()
+        self.timer_registro.timeout.connect(self.publicar_registro)
+        self.timer_registro.setInterval(1000 // self.FRECUENCIA_REGISTRO)
+        self.timer_registro.start()
 
         # Configurar la interfaz
         self.setup_ui()
@@ -245,40 +906,12 @@ class EcosistemaGUI(QMainWindow):
 
         }
 
-        # Lista para plantas
-        self.planta_items = []
+        # Leer y escalar todas las imágenes una sola vez
+        CacheSprites.precargar(self.imagenes_animales, self.imagenes_plantas)
 
         # Inicializar el gestor de estado
         self.gestor_estado = GestorEstado()
-
-    def verificar_cazas(self):
-        """Verifica y procesa las cazas entre depredadores y presas"""
-        for depredador in self.animal_items:
-            if not depredador.animal.estar_vivo or not isinstance(depredador.animal, Carnivoro):
-                continue
-
-            # Buscar presas cercanas
-            presa_cercana = None
-            menor_distancia = float('inf')
-
-            for presa in self.animal_items:
-                if (not presa.animal.estar_vivo or
-                        presa.animal == depredador.animal or
-                        not isinstance(presa.animal, Herbivoro)):
-                    continue
-
-                # Calcular distancia
-                dx = depredador.x - presa.x
-                dy = depredador.y - presa.y
-                distancia = math.sqrt(dx*dx + dy*dy)
-
-                if distancia < depredador.animal.rango_caza and distancia < menor_distancia:
-                    presa_cercana = presa
-                    menor_distancia = distancia
-
-            # Si encontró una presa, intentar cazar
-            if presa_cercana:
-                self.realizar_caza(depredador.animal, presa_cercana.animal)
+        self.guardado_terminado.connect(self._al_terminar_guardado)
 
     def crear_plantas_iniciales(self):
         """Crea las plantas iniciales en el ecosistema"""
@@ -311,221 +944,22 @@ class EcosistemaGUI(QMainWindow):
             # Agregar cada planta al ecosistema
             for planta, tipo in plantas:
                 self.ecosistema.agregar_entidad(planta, tipo)
-                especie = planta.__class__.__name__
-                if especie in self.imagenes_plantas:
-                    item = PlantaGraphicsItem(planta, self.imagenes_plantas[especie])
-                    self.planta_items.append(item)
 
         except Exception as e:
             raise Exception(f"Error al crear plantas: {str(e)}")
 
-    def realizar_caza(self, depredador: Animal, presa: Animal):
-        """Procesa el intento de caza"""
-        # Intentar cazar
-        if depredador.cazar(presa):
-            # Si la caza fue exitosa, alimentarse
-            if depredador.alimentarse(presa):
-                self.lbl_estado.setText(
-                    f"Estado: {depredador.__class__.__name__} cazó y se alimentó de {presa.__class__.__name__}"
-                )
-                self.registrar_accion(
-                    depredador.__class__.__name__,
-                    "Cazar",
-                    f"Cazó exitosamente a un {presa.__class__.__name__}"
-                )
-        else:
-            # Caza fallida
-            self.lbl_estado.setText(
-                f"Estado: {depredador.__class__.__name__} falló la caza"
-            )
-            self.registrar_accion(
-                depredador.__class__.__name__,
-                "Cazar",
-                "Intento fallido"
-            )
-            # Hacer que la presa huya
-            self.hacer_huir_presa(presa)
-
-    def hacer_huir_presa(self, presa: AnimalGraphicsItem):
-        """Hace que la presa huya cuando la caza falla"""
-        # Implementar el método huir si existe en la clase Herbívoro
-        if isinstance(presa.animal, Herbivoro):
-            presa.animal.huir()
-            self.registrar_accion(
-                presa.__class__.__name__,
-                "Huir",
-                "Escapó de un depredador"
-            )
-
-        # Cambiar dirección y aumentar velocidad temporalmente
-        presa.direccion = random.uniform(0, 2 * math.pi)
-        velocidad_original = presa.velocidad
-        presa.velocidad *= 1.5
-
-        # Gastar energía al huir
-        presa.animal.nivel_energia = max(0, presa.animal.nivel_energia - 5)
-
-        # Restaurar velocidad después de un tiempo
-        def restaurar_velocidad():
-            presa.velocidad = velocidad_original
-
-        QTimer.singleShot(2000, restaurar_velocidad)  # 2 segundos de huida
-
-    def verificar_reproduccion(self):
-        """Verifica si hay animales cercanos que puedan reproducirse"""
-        nuevos_animales = []
-
-        for i, item1 in enumerate(self.animal_items):
-            if not item1.animal.estar_vivo:
-                continue
-
-            # Incrementar el tiempo de reproducción
-            item1.tiempo_reproduccion += 1
-            especie = item1.animal.__class__.__name__
-            tiempo_minimo = self.TIEMPOS_REPRODUCCION.get(especie, self.TIEMPO_MINIMO_REPRODUCCION)
-
-            # Verificar condiciones básicas para reproducción
-            if (item1.tiempo_reproduccion < tiempo_minimo or
-                    item1.animal.nivel_energia < self.ENERGIA_MINIMA_REPRODUCCION):
-                continue
-
-            for item2 in self.animal_items[i+1:]:
-                if not item2.animal.estar_vivo:
-                    continue
-
-                # Verificar si son de la misma especie y tienen suficiente energía
-                if (type(item1.animal) == type(item2.animal) and
-                        item2.tiempo_reproduccion >= tiempo_minimo and
-                        item2.animal.nivel_energia >= self.ENERGIA_MINIMA_REPRODUCCION):
-
-                    # Calcular distancia
-                    dx = item1.x - item2.x
-                    dy = item1.y - item2.y
-                    distancia = math.sqrt(dx*dx + dy*dy)
-
-                    # Verificar distancia y probabilidad
-                    if (distancia <= self.DISTANCIA_REPRODUCCION and
-                            random.random() < self.PROBABILIDAD_REPRODUCCION):
-
-                        # Posición para el nuevo animal (con algo de variación)
-                        pos_x = (item1.x + item2.x) / 2 + random.uniform(-20, 20)
-                        pos_y = (item1.y + item2.y) / 2 + random.uniform(-20, 20)
-
-                        # Mantener dentro de los límites
-                        pos_x = max(0, min(self.ANCHO_ECOSISTEMA, pos_x))
-                        pos_y = max(0, min(self.ALTO_ECOSISTEMA, pos_y))
-
-                        # Crear nuevo animal según la especie
-                        nuevo_animal = None
-                        if isinstance(item1.animal, Leon):
-                            nuevo_animal = Leon(especie, 100, 2.0, (pos_x, pos_y))
-                        elif isinstance(item1.animal, Aguila_real):
-                            nuevo_animal = Aguila_real(especie, 100, 3.0, (pos_x, pos_y))
-                        elif isinstance(item1.animal, Conejo):
-                            nuevo_animal = Conejo(especie, 100, 4.0, (pos_x, pos_y))
-                        elif isinstance(item1.animal, Ciervo):
-                            nuevo_animal = Ciervo(especie, 100, 3.0, (pos_x, pos_y))
-
-                        if nuevo_animal:
-                            # Determinar tipo
-                            tipo = 'carnivoro' if isinstance(nuevo_animal, (Leon, Aguila_real)) else 'herbivoro'
-                            nuevos_animales.append((nuevo_animal, tipo))
-
-                            # Aplicar costo de energía a los padres
-                            item1.animal.nivel_energia -= self.COSTO_ENERGIA_REPRODUCCION
-                            item2.animal.nivel_energia -= self.COSTO_ENERGIA_REPRODUCCION
-
-                            # Reiniciar contadores de reproducción
-                            item1.tiempo_reproduccion = 0
-                            item2.tiempo_reproduccion = 0
-
-                            # Mostrar mensaje de nacimiento
-                            self.lbl_estado.setText(f"Estado: Nuevo {especie} ha nacido!")
-
-        # Agregar nuevos animales al ecosistema
-        for animal, tipo in nuevos_animales:
-            self.ecosistema.agregar_entidad(animal, tipo)
-            if animal.__class__.__name__ in self.imagenes_animales:
-                item = AnimalGraphicsItem(animal, self.imagenes_animales[animal.__class__.__name__])
-                self.animal_items.append(item)
-
-    def verificar_reproduccion_plantas(self):
-        nuevas_plantas = []
-
-        for i, item1 in enumerate(self.planta_items):
-            if not item1.planta.estar_vivo:
-                continue
-
-            # Incrementar el tiempo de reproducción
-            item1.tiempo_reproduccion += 1
-
-            # Verificar si la planta puede reproducirse
-            if random.random() < self.PROBABILIDAD_REPRODUCCION_PLANTAS:
-                # Generar nueva posición cerca de la planta madre
-                radio = self.DISTANCIA_REPRODUCCION_PLANTAS
-                angulo = random.uniform(0, 2 * math.pi)
-
-                pos_x = item1.x + radio * math.cos(angulo)
-                pos_y = item1.y + radio * math.sin(angulo)
-
-                # Mantener dentro de los límites
-                pos_x = max(0, min(self.ANCHO_ECOSISTEMA, pos_x))
-                pos_y = max(0, min(self.ALTO_ECOSISTEMA, pos_y))
-
-                # Crear nueva planta según la especie
-                nueva_planta = None
-                tipo = None
-
-                if isinstance(item1.planta, Manzano):
-                    nueva_planta = Manzano(0.5, 0, (pos_x, pos_y), 100, 100)
-                    tipo = 'frutal'
-                elif isinstance(item1.planta, Naranjo):
-                    nueva_planta = Naranjo(0.5, 0, (pos_x, pos_y), 100, 100)
-                    tipo = 'frutal'
-                elif isinstance(item1.planta, Peral):
-                    nueva_planta = Peral(0.5, 0, (pos_x, pos_y), 100, 100)
-                    tipo = 'frutal'
-                elif isinstance(item1.planta, Rosal):
-                    nueva_planta = Rosal(0.3, 0, (pos_x, pos_y), 100, 100)
-                    tipo = 'floral'
-                elif isinstance(item1.planta, Orquidero):
-                    nueva_planta = Orquidero(0.3, 0, (pos_x, pos_y), 100, 100)
-                    tipo = 'floral'
-                elif isinstance(item1.planta, Cempasuchil):
-                    nueva_planta = Cempasuchil(0.3, 0, (pos_x, pos_y), 100, 100)
-                    tipo = 'floral'
-
-                if nueva_planta and tipo:
-                    nuevas_plantas.append((nueva_planta, tipo))
-                    # Mensaje
-                    self.lbl_estado.setText(f"Estado: Nueva {nueva_planta.__class__.__name__} ha brotado!")
-                    self.registrar_accion(
-                        nueva_planta.__class__.__name__,
-                        "Reproducción",
-                        "Nueva planta ha brotado"
-                    )
-
-        # Agregar nuevas plantas al ecosistema
-        for planta, tipo in nuevas_plantas:
-            self.ecosistema.agregar_entidad(planta, tipo)
-            especie = planta.__class__.__name__
-            if especie in self.imagenes_plantas:
-                item = PlantaGraphicsItem(planta, self.imagenes_plantas[especie])
-                self.planta_items.append(item)
-
     def mostrar_estadisticas(self):
         """Actualiza y muestra las estadísticas del ecosistema"""
         conteo_especies = {}
         energia_promedio = {}
 
-        for item in self.animal_items:
-            if item.animal.estar_vivo:
-                especie = item.animal.__class__.__name__
-                conteo_especies[especie] = conteo_especies.get(especie, 0) + 1
+        for animal in self.ecosistema.animales_vivos():
+            especie = animal.__class__.__name__
+            conteo_especies[especie] = conteo_especies.get(especie, 0) + 1
 
-                if especie not in energia_promedio:
-                    energia_promedio[especie] = []
-                energia_promedio[especie].append(item.animal.nivel_energia)
+            if especie not in energia_promedio:
+                energia_promedio[especie] = []
+            energia_promedio[especie].append(animal.nivel_energia)
 
         # Calcular promedios de energía
         for especie in energia_promedio:
@@ -548,38 +982,33 @@ class EcosistemaGUI(QMainWindow):
                                      f"No se pudo crear el directorio de imágenes: {str(e)}")
 
     def registrar_accion(self, animal_tipo: str, accion: str, detalles: str = ""):
-        """Registra una acción en el panel lateral"""
-        timestamp = QTime.currentTime().toString("HH:mm:ss")
-        accion_texto = f"[{timestamp}] {animal_tipo}: {accion}"
+        """Registra una acción para el panel lateral; puede llamarse desde cualquier thread"""
+        accion_texto = f"{animal_tipo}: {accion}"
         if detalles:
             accion_texto += f" - {detalles}"
 
-        self.lista_acciones.insertItem(0, accion_texto)
-
-        # Mantener un límite de acciones mostradas
-        while self.lista_acciones.count() > self.max_acciones:
-            self.lista_acciones.takeItem(self.lista_acciones.count() - 1)
+        self.registro_acciones.agregar((time.time(), accion_texto))
 
     def registrar_evento_planta(self, planta, accion, detalles=""):
         """Registra eventos específicos de las plantas"""
-        timestamp = QTime.currentTime().toString("HH:mm:ss")
         tipo_planta = planta.__class__.__name__
 
         # Formatear mensaje según el tipo de acción
         if accion == "generar_frutos":
-            mensaje = f"[{timestamp}] 🌳 {tipo_planta}: Generó {detalles} nuevos frutos"
+            mensaje = f"🌳 {tipo_planta}: Generó {detalles} nuevos frutos"
         elif accion == "crecer":
-            mensaje = f"[{timestamp}] 🌱 {tipo_planta}: Creció {detalles}m"
+            mensaje = f"🌱 {tipo_planta}: Creció {detalles}m"
         elif accion == "absorber_agua":
-            mensaje = f"[{timestamp}] 💧 {tipo_planta}: Absorbió {detalles} de agua"
+            mensaje = f"💧 {tipo_planta}: Absorbió {detalles} de agua"
         else:
-            mensaje = f"[{timestamp}] {tipo_planta}: {accion} - {detalles}"
+            mensaje = f"{tipo_planta}: {accion} - {detalles}"
 
-        self.lista_acciones.insertItem(0, mensaje)
+        self.registro_acciones.agregar((time.time(), mensaje))
 
-        # Mantener un límite de acciones mostradas
-        while self.lista_acciones.count() > self.max_acciones:
-            self.lista_acciones.takeItem(self.lista_acciones.count() - 1)
+    def publicar_registro(self):
+        """Pasa a la lista de acciones, en un solo lote, las registradas desde la última vez"""
+        self._leidos_registro, nuevas = self.registro_acciones.leer(self._leidos_registro)
+        self.modelo_acciones.publicar(nuevas)
 
     def setup_ui(self):
         try:
@@ -595,6 +1024,7 @@ class EcosistemaGUI(QMainWindow):
 
             self.btn_guardar = QPushButton("Guardar Estado")
             self.btn_cargar = QPushButton("Cargar Estado")
+            self.btn_guardar.clicked.connect(self.guardar_estado)
 
             # Panel superior con información
             info_panel = QHBoxLayout()
@@ -605,9 +1035,22 @@ class EcosistemaGUI(QMainWindow):
 
             # Escena y vista
             self.scene = QGraphicsScene()
-            self.view = QGraphicsView(self.scene)
+            self.view = VistaEcosistema(self.scene)
+            self.view.area_visible_cambiada.connect(self._al_cambiar_area_visible)
             self.scene.setSceneRect(0, 0, self.ANCHO_ECOSISTEMA, self.ALTO_ECOSISTEMA)
             self.scene.setBackgroundBrush(QBrush(QColor("#90EE90")))
+            # Casi todos los items se mueven en cada cuadro; mantener el
+            # índice BSP cuesta más de lo que ahorra
+            self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+
+            # Capas de los niveles de detalle lejanos, sobre los sprites
+            self.capa_puntos = CapaPuntos()
+            self.capa_agregados = CapaAgregados()
+            self.capa_densidad = CapaDensidad()
+            for capa in (self.capa_puntos, self.capa_agregados, self.capa_densidad):
+                capa.setZValue(2)
+                capa.establecer_area(self.scene.sceneRect())
+                self.scene.addItem(capa)
 
             # Panel de control
             control_panel = QHBoxLayout()
@@ -615,6 +1058,23 @@ class EcosistemaGUI(QMainWindow):
             self.btn_inicio.clicked.connect(self.iniciar_simulacion)
             control_panel.addWidget(self.btn_inicio)
 
+            # Control de velocidad de la simulación
+            control_panel.addWidget(QLabel("Velocidad:"))
+            self.combo_velocidad = QComboBox()
+            self.combo_velocidad.addItems(list(self.VELOCIDADES))
+            self.combo_velocidad.currentTextChanged.connect(self.cambiar_velocidad)
+            control_panel.addWidget(self.combo_velocidad)
+
+            # Modo de vista
+            control_panel.addWidget(QLabel("Vista:"))
+            self.combo_vista = QComboBox()
+            self.combo_vista.addItems(list(self.MODOS_VISTA))
+            self.combo_vista.currentTextChanged.connect(self.cambiar_modo_vista)
+            control_panel.addWidget(self.combo_vista)
+
+            self.chk_proceso = QCheckBox("Simular en otro proceso")
+            control_panel.addWidget(self.chk_proceso)
+
             # Agregar elementos al layout izquierdo
             left_layout.addLayout(info_panel)
             left_layout.addWidget(self.view)
@@ -644,7 +1104,7 @@ class EcosistemaGUI(QMainWindow):
             right_layout.addWidget(lbl_animales)
 
             # Agregar la lista de animales
-            right_layout.addWidget(self.lista_animales)
+            right_layout.addWidget(self.vista_poblacion)
 
             # Separador
             separator = QFrame()
@@ -673,90 +1133,20 @@ class EcosistemaGUI(QMainWindow):
             self.close()
 
     def actualizar_lista_animales_y_plantas(self):
-        """Actualiza la lista de animales vivos en el panel lateral"""
-        self.lista_animales.clear()
-
-        # Diccionario para agrupar animales por especie
-        animales_por_especie = {}
-
-        for item in self.animal_items:
-            if item.animal.estar_vivo:
-                especie = item.animal.__class__.__name__
-                energia = item.animal.nivel_energia
-                if especie not in animales_por_especie:
-                    animales_por_especie[especie] = []
-                animales_por_especie[especie].append(energia)
-
-        # Agregar encabezado de animales
-        self.lista_animales.addItem("====== ANIMALES ======")
-        self.lista_animales.addItem("")
-
-        # Agregar elementos a la lista agrupados por especie
-        for especie, energias in animales_por_especie.items():
-            # Agregar encabezado de especie
-            self.lista_animales.addItem(f"=== {especie}s ({len(energias)}) ===")
-
-            # Agregar cada animal con su energía
-            for i, energia in enumerate(energias, 1):
-                self.lista_animales.addItem(
-                    f"  {especie} {i} - Energía: {energia:.1f}%"
-                )
-
-            # Agregar espacio entre especies
-            self.lista_animales.addItem("")
-
-        # Agregar separador
-        self.lista_animales.addItem("====== PLANTAS ======")
-        self.lista_animales.addItem("")
-
-        # Diccionario para agrupar plantas por especie
-        plantas_por_especie = {}
-        for item in self.planta_items:
-            if item.planta.estar_vivo:
-                especie = item.planta.__class__.__name__
-                if especie not in plantas_por_especie:
-                    plantas_por_especie[especie] = []
-                # Crear un diccionario con la información relevante de la planta
-                info_planta = {
-                    'altura': item.planta.altura,
-                    'energia': item.planta.nivel_energia,
-                    'agua': item.planta.nivel_agua
-                }
-                # Agregar información de frutos si es una planta frutal
-                if hasattr(item.planta, 'frutos'):
-                    info_planta['frutos'] = item.planta.frutos
-                # Agregar información de flores si es una planta floral
-                if hasattr(item.planta, 'flores'):
-                    info_planta['flores'] = item.planta.flores
-
-                plantas_por_especie[especie].append(info_planta)
-
-        # Agregar elementos de plantas a la lista agrupados por especie
-        for especie, plantas in plantas_por_especie.items():
-            self.lista_animales.addItem(f"=== {especie}s ({len(plantas)}) ===")
-            for i, info in enumerate(plantas, 1):
-                self.lista_animales.addItem(
-                    f"  {especie} {i} - Altura: {info['altura']:.1f}m"
-                )
-                # Mostrar frutos si es una planta frutal
-                if 'frutos' in info:
-                    self.lista_animales.addItem(
-                        f"    Frutos: {info['frutos']}"
-                    )
-                # Mostrar flores si es una planta floral
-                if 'flores' in info:
-                    self.lista_animales.addItem(
-                        f"    Flores: {info['flores']}"
-                    )
-                self.lista_animales.addItem(
-                    f"    Agua: {info['agua']:.1f}% | Energía: {info['energia']:.1f}%"
-                )
-            self.lista_animales.addItem("")
-
+        """Actualiza el panel lateral con los animales y plantas vivos"""
+        self.modelo_poblacion.actualizar(self.ecosistema.animales_vivos(),
+                                         self.ecosistema.plantas_vivas())
     def iniciar_simulacion(self):
         try:
             # Crear nuevo ecosistema
-            self.ecosistema = Ecosistema()
+            self.ecosistema = Ecosistema((self.ANCHO_ECOSISTEMA, self.ALTO_ECOSISTEMA))
+
+            # La escena abarca el mundo entero; solo se dibuja la parte visible
+            area = QRectF(0, 0, *self.ecosistema.tamano)
+            self.scene.setSceneRect(area)
+            self.capa_puntos.establecer_area(area)
+            self.capa_agregados.establecer_area(area)
+            self.capa_densidad.establecer_area(area)
 
             # Deshabilitar el botón
             self.btn_inicio.setEnabled(False)
@@ -766,15 +1156,36 @@ class EcosistemaGUI(QMainWindow):
             self.crear_animales_iniciales()
             self.crear_plantas_iniciales()  # Agregar creación de plantas
 
+            if self.chk_proceso.isChecked():
+                # El ecosistema local solo arma la población inicial; la
+                # simulación sigue en otro proceso, que publica sus cuadros
+                estado = self.ecosistema.exportar_estado()
+                self.ecosistema.detener_simulacion()
+                self.ecosistema = None
+                self.proceso = ProcesoSimulacion(
+                    estado, self.VELOCIDADES[self.combo_velocidad.currentText()])
+                self.proceso.iniciar()
+            else:
+                self._actualizar_area_visible()
+            self.chk_proceso.setEnabled(False)
+
             # Crear y configurar el timer
             if self.timer is None:
                 self.timer = QTimer()
+                self.timer.setTimerType(Qt.TimerType.PreciseTimer)
                 self.timer.timeout.connect(self.actualizar_escena)
-                self.timer.setInterval(100)
+                self.timer.setInterval(1000 // self.FPS_MAXIMO)
 
             # Iniciar el timer
+            self.reloj.reiniciar()
             self.timer.start()
 
+            if self.timer_autoguardado is None:
+                self.timer_autoguardado = QTimer()
+                self.timer_autoguardado.timeout.connect(self.guardar_estado)
+                self.timer_autoguardado.setInterval(self.INTERVALO_AUTOGUARDADO)
+            self.timer_autoguardado.start()
+
             # Actualizar estado
             self.lbl_estado.setText("Estado: Simulación en curso")
 
@@ -787,6 +1198,7 @@ class EcosistemaGUI(QMainWindow):
         if self.ecosistema:
             self.ecosistema.reanudar_simulacion()
             if self.timer:
+                self.reloj.reiniciar()
                 self.timer.start()
             self.btn_pausar.setEnabled(True)
             self.btn_reanudar.setEnabled(False)
@@ -817,120 +1229,40 @@ class EcosistemaGUI(QMainWindow):
                 (Ciervo("Ciervo", 100, 3.0, generar_posicion()), 'herbivoro')
             ]
 
-            # Agregar cada animal al ecosistema y crear su representación gráfica
+            # Agregar cada animal al ecosistema
             for animal, tipo in animales:
-                # Agregar al ecosistema
                 self.ecosistema.agregar_entidad(animal, tipo)
 
-                # Crear representación gráfica
-                especie = animal.__class__.__name__
-                if especie in self.imagenes_animales:
-                    item = AnimalGraphicsItem(animal, self.imagenes_animales[especie])
-                    self.animal_items.append(item)
-
         except Exception as e:
             raise Exception(f"Error al crear animales: {str(e)}")
 
     def actualizar_escena(self):
         try:
-            self.scene.clear()
-
-            # Verificar cazas antes del movimiento
-            self.verificar_cazas()
-
-            # Verificar alimentación de plantas antes del movimiento
-            self.verificar_alimentacion_plantas()
-            self.verificar_reproduccion_plantas()  # Añadir esta línea aquí
-
-
-            # Lista para almacenar nuevos animales
-            nuevos_animales = []
-
-            # for item in self.planta_items:
-            #     if item.planta.estar_vivo:
-            #         pixmap_item = self.scene.addPixmap(item.pixmap)
-            #         pixmap_item.setPos(item.x, item.y)
-            #     else:
-            #         self.planta_items.remove(item)
-
-            for item in self.planta_items[:]:
-                if item.planta.estar_vivo:
-                    pixmap_item = self.scene.addPixmap(item.pixmap)
-                    pixmap_item.setPos(item.x, item.y)
-                    # Para registrar crecimiento
-                    if item.planta.crecer():
-                        self.registrar_evento_planta(
-                            item.planta,
-                            "crecer",
-                            f"{item.planta.altura:.2f}"
-                        )
-
-                    # Para registrar generación de frutos (si es planta frutal)
-                    if hasattr(item.planta, 'generar_frutos') and item.planta.generar_frutos():
-                        self.registrar_evento_planta(
-                            item.planta,
-                            "generar_frutos",
-                            str(item.planta.frutos)
-                        )
-
-                    # Para registrar absorción de agua
-                    if item.planta.absorber_agua():
-                        self.registrar_evento_planta(
-                            item.planta,
-                            "absorber_agua",
-                            str(item.planta.nivel_agua)
-                        )
-                else:
-                    self.planta_items.remove(item)
-
-            # Mover animales y verificar reproducción
-            for item in self.animal_items:
-                if item.animal.estar_vivo:
-
-                    # Registrar acciones especiales
-                    if isinstance(item.animal, Volador) and random.random() < 0.1:
-                        item.animal.volar()
-                        self.registrar_accion(
-                            item.animal.__class__.__name__,
-                            "Volar",
-                            "Voló por el ecosistema"
-                        )
-
-                    if isinstance(item.animal, Nadador) and random.random() < 0.1:
-                        item.animal.nadar()
-                        self.registrar_accion(
-                            item.animal.__class__.__name__,
-                            "Nadar",
-                            "Nadó en el ecosistema"
-                        )
-                    # Mover animal
-                    item.mover(self.ANCHO_ECOSISTEMA, self.ALTO_ECOSISTEMA)
-
-                    # Intentar reproducción
-                    otros_animales = [otro.animal for otro in self.animal_items
-                                      if otro != item and otro.animal.estar_vivo]
-                    nueva_cria = item.animal.reproducirse(otros_animales)
-
-                    if nueva_cria:
-                        # Determinar tipo
-                        tipo = 'carnivoro' if isinstance(nueva_cria, (Leon, Aguila_real)) else 'herbivoro'
-                        nuevos_animales.append((nueva_cria, tipo))
-                        self.lbl_estado.setText(f"Estado: Nuevo {nueva_cria.__class__.__name__} ha nacido!")
-                        self.registrar_accion(
-                            item.animal.__class__.__name__,
-                            "Reproducirse",
-                            f"Dio nacimiento a un nuevo {nueva_cria.__class__.__name__}"
-                        )
-
-            # Agregar nuevos animales al ecosistema
-            for animal, tipo in nuevos_animales:
-                self.ecosistema.agregar_entidad(animal, tipo)
-                if animal.__class__.__name__ in self.imagenes_animales:
-                    item = AnimalGraphicsItem(animal, self.imagenes_animales[animal.__class__.__name__])
-                    self.animal_items.append(item)
-
-            # Dibujar animales y actualizar estadísticas
-            self._actualizar_visualizacion()
+            if self.proceso is not None:
+                # Dibujar el último cuadro completo del otro proceso, si hay uno nuevo
+                cuadro = self.proceso.leer_cuadro()
+                if cuadro is not None:
+                    self.cuadro = cuadro
+                    self._actualizar_area_visible()
+                    self._mostrar_cuadro()
+                elif not self.proceso.activo:
+                    raise RuntimeError("El proceso de simulación terminó")
+                return
+
+            # Avanzar el modelo los ticks que correspondan y reflejar sus
+            # cambios una sola vez; si no hubo ticks solo se interpola
+            if self.reloj.avanzar(self.ecosistema.step):
+                # Los sprites salen de la grilla espacial; la lista de
+                # entidades nuevas solo se descarta
+                self.ecosistema.tomar_entidades_nuevas()
+                self._mostrar_registros()
+
+                # Dibujar lo que está en pantalla y actualizar estadísticas
+                self._actualizar_visualizacion()
+
+            alfa = self.reloj.alfa
+            for item in self.animal_items.values():
+                item.interpolar(alfa)
 
         except Exception as e:
             print(f"Error al actualizar escena: {str(e)}")
@@ -939,22 +1271,226 @@ class EcosistemaGUI(QMainWindow):
                                  "Error al actualizar la simulación. La simulación se ha detenido.")
             self.reiniciar_simulacion()
 
-    def _actualizar_visualizacion(self):
-        """Actualiza la visualización de los animales y las estadísticas"""
-        animales_vivos = {
-            'carnivoros': 0,
-            'herbivoros': 0
-        }
-
-        for item in self.animal_items[:]:
-            if item.animal.estar_vivo:
-                pixmap_item = self.scene.addPixmap(item.pixmap)
-                pixmap_item.setPos(item.x, item.y)
+    def _al_cambiar_area_visible(self):
+        """Redibuja lo que está en pantalla tras un zoom o un desplazamiento"""
+        if self.ecosistema is not None or self.cuadro is not None:
+            self._actualizar_area_visible(mover=False)
+
+    def _actualizar_area_visible(self, mover: bool = True):
+        """Dibuja los organismos que están en pantalla con el nivel de detalle del
+        zoom, o su mapa de densidad en el modo 'Densidad'.
+
+        Los sprites y los puntos salen de una consulta a la grilla espacial
+        del ecosistema y las celdas lejanas de un conteo vectorizado, así lo
+        que se dibuja depende de lo que se ve y no de la población total. Con
+        la simulación en otro proceso todo sale del último cuadro.
+
+        Args:
+            mover (bool, optional): Si también se mueven los sprites que ya
+                estaban en pantalla; False cuando solo cambió la vista.
+        """
+        fuente = self.cuadro if self.proceso is not None else self.ecosistema
+        if fuente is None:
+            return
+        area = self.view.area_visible()
+        escala = self.view.escala
+        visibles = []
+        indices = np.empty(0, dtype=np.intp)
+
+        if self.modo_vista == 'Densidad':
+            self.capa_puntos.limpiar()
+            self.capa_agregados.limpiar()
+            self.capa_densidad.actualizar(*self._densidad_visible(
+                fuente, area, CapaDensidad.TAMANO_CELDA / escala, por_categoria=True))
+        elif escala < self.ESCALA_AGREGADOS:
+            self.capa_puntos.limpiar()
+            self.capa_densidad.limpiar()
+            self.capa_agregados.actualizar(*self._densidad_visible(
+                fuente, area, CapaAgregados.TAMANO_CELDA / escala))
+        else:
+            self.capa_agregados.limpiar()
+            self.capa_densidad.limpiar()
+            # Incluir los sprites que asoman desde arriba o la izquierda
+            margen = CacheSprites.TAMANO_MAXIMO
+            rectangulo = (area.left() - margen, area.top() - margen, area.right(), area.bottom())
+            if self.proceso is not None:
+                indices = self.cuadro.en_rectangulo(*rectangulo)
+                cantidad = len(indices)
+            else:
+                visibles = self.ecosistema.entidades_en_rectangulo(*rectangulo)
+                cantidad = len(visibles)
 
-                if isinstance(item.animal, (Leon, Aguila_real)):
-                    animales_vivos['carnivoros'] += 1
+            if escala < self.ESCALA_SPRITES or cantidad > self.MAXIMO_SPRITES:
+                if self.proceso is not None:
+                    self.capa_puntos.actualizar(self._puntos_cuadro(indices))
+                    indices = indices[:0]
                 else:
-                    animales_vivos['herbivoros'] += 1
+                    # Cada entidad va con la categoría con la que se agregó al
+                    # ecosistema, igual que en los cuadros y la densidad
+                    grupos = {categoria: [] for categoria in self.COLORES_PUNTOS}
+                    por_categoria = dict(grupos, frutal=grupos['planta'], floral=grupos['planta'])
+                    categorias = self.ecosistema._categorias
+                    for organismo in visibles:
+                        por_categoria[categorias[organismo._indice]].append(organismo.ubicacion)
+                    self.capa_puntos.actualizar([(self.COLORES_PUNTOS[categoria], posiciones)
+                                                 for categoria, posiciones in grupos.items()])
+                    visibles = []
+            else:
+                self.capa_puntos.limpiar()
+
+        self._actualizar_items(self.animal_items,
+                               [organismo for organismo in visibles if isinstance(organismo, Animal)],
+                               mover)
+        self._actualizar_items(self.planta_items,
+                               [organismo for organismo in visibles if not isinstance(organismo, Animal)],
+                               mover)
+        self._actualizar_items_cuadro(indices, mover)
+
+    def _densidad_visible(self, fuente, area: QRectF, lado: float, por_categoria: bool = False) -> tuple:
+        """Cuenta los organismos en celdas de un lado dado que cubren un área.
+
+        Las celdas se alinean a múltiplos de su lado, para que no cambien al
+        desplazar la vista.
+
+        Args:
+            fuente (Ecosistema | CuadroSimulacion): Origen de los conteos.
+            area (QRectF): Área a cubrir.
+            lado (float): Lado de las celdas en unidades del mundo.
+            por_categoria (bool, optional): Si se cuenta cada categoría por separado.
+
+        Returns:
+            tuple: Bordes izquierdo y superior de la grilla, lado de las
+                celdas y conteos de `densidad()`.
+        """
+        x_min = math.floor(area.left() / lado) * lado
+        y_min = math.floor(area.top() / lado) * lado
+        columnas = max(1, math.ceil((area.right() - x_min) / lado))
+        filas = max(1, math.ceil((area.bottom() - y_min) / lado))
+        conteos = fuente.densidad(x_min, y_min, x_min + columnas * lado,
+                                  y_min + filas * lado, columnas, filas, por_categoria)
+        return x_min, y_min, lado, conteos
+
+    def _puntos_cuadro(self, indices: np.ndarray) -> list:
+        """Agrupa por color de punto las posiciones de entidades del cuadro actual"""
+        cuadro = self.cuadro
+        codigos = {nombre: codigo for codigo, nombre in enumerate(cuadro.categorias)}
+        categoria = cuadro.categoria[indices]
+        grupos = []
+        for clave, color in self.COLORES_PUNTOS.items():
+            nombres = ('frutal', 'floral') if clave == 'planta' else (clave,)
+            elegidos = indices[np.isin(categoria, [codigos[nombre] for nombre in nombres])]
+            grupos.append((color, zip(cuadro.x[elegidos].tolist(), cuadro.y[elegidos].tolist())))
+        return grupos
+
+    def _crear_item(self, organismo) -> Optional[ElementoGrafico]:
+        """Crea la representación gráfica de un organismo, o None si su especie no tiene imagen"""
+        especie = organismo.__class__.__name__
+        if isinstance(organismo, Animal):
+            if especie in self.imagenes_animales:
+                return AnimalGraphicsItem(organismo, self.imagenes_animales[especie])
+        elif especie in self.imagenes_plantas:
+            return PlantaGraphicsItem(organismo, self.imagenes_plantas[especie])
+        return None
+
+    def _actualizar_items(self, items: Dict[object, ElementoGrafico], visibles: list, mover: bool):
+        """Sincroniza los sprites de un tipo de organismo con los que están en pantalla.
+
+        Crea los de los organismos que entraron a la vista o nacieron, quita
+        los de los que salieron o murieron y mueve los demás.
+
+        Args:
+            items (Dict[object, ElementoGrafico]): Sprites en la escena, por organismo.
+            visibles (list): Organismos vivos en pantalla.
+            mover (bool): Si se mueven los sprites que ya estaban en la escena.
+        """
+        en_pantalla = set(visibles)
+        for organismo in [organismo for organismo in items if organismo not in en_pantalla]:
+            items.pop(organismo).quitar_de_escena()
+
+        for organismo in visibles:
+            item = items.get(organismo)
+            if item is None:
+                item = self._crear_item(organismo)
+                if item is not None:
+                    item.agregar_a_escena(self.scene)
+                    items[organismo] = item
+            elif mover:
+                item.actualizar_posicion()
+
+    def _crear_item_cuadro(self, especie: str, categoria: str) -> Optional[CuadroGraphicsItem]:
+        """Crea el sprite de una entidad de un cuadro, o None si su especie no tiene imagen"""
+        if categoria in ('carnivoro', 'herbivoro'):
+            if especie in self.imagenes_animales:
+                return CuadroGraphicsItem(AnimalGraphicsItem.sprite(self.imagenes_animales[especie]), True)
+        elif especie in self.imagenes_plantas:
+            return CuadroGraphicsItem(PlantaGraphicsItem.sprite(self.imagenes_plantas[especie],
+                                                                CacheSprites.TAMANO_BASE), False)
+        return None
+
+    def _actualizar_items_cuadro(self, indices: np.ndarray, mover: bool):
+        """Sincroniza los sprites del cuadro actual con las entidades en pantalla.
+
+        Args:
+            indices (np.ndarray): Posiciones en el cuadro de las entidades en pantalla.
+            mover (bool): Si se mueven los sprites que ya estaban en la escena.
+        """
+        cuadro = self.cuadro
+        if cuadro is not None:
+            claves = list(zip(cuadro.ids[indices].tolist(), cuadro.especie[indices].tolist()))
+        else:
+            claves = []
+        en_pantalla = set(claves)
+        for clave in [clave for clave in self.cuadro_items if clave not in en_pantalla]:
+            self.cuadro_items.pop(clave).quitar_de_escena()
+        if not claves:
+            return
+
+        for clave, x, y, categoria in zip(claves, cuadro.x[indices].tolist(),
+                                          cuadro.y[indices].tolist(),
+                                          cuadro.categoria[indices].tolist()):
+            item = self.cuadro_items.get(clave)
+            if item is None:
+                item = self._crear_item_cuadro(cuadro.especies[clave[1]], cuadro.categorias[categoria])
+                if item is None:
+                    continue
+                item.x, item.y = x, y
+                item.agregar_a_escena(self.scene)
+                self.cuadro_items[clave] = item
+            elif mover:
+                item.x, item.y = x, y
+                item.actualizar_posicion()
+
+    def _mostrar_cuadro(self):
+        """Muestra la población de animales y el tick del último cuadro del otro proceso"""
+        cuadro = self.cuadro
+        animales = np.isin(cuadro.categoria, [cuadro.categorias.index('carnivoro'),
+                                              cuadro.categorias.index('herbivoro')])
+        conteo = np.bincount(cuadro.especie[animales], minlength=len(cuadro.especies))
+        stats_text = "Población: "
+        for especie, cantidad in zip(cuadro.especies, conteo.tolist()):
+            if cantidad:
+                stats_text += f"{especie}: {cantidad} "
+        self.lbl_poblacion.setText(stats_text)
+        self.lbl_estado.setText(f"Estado: Simulación en otro proceso, tick {cuadro.tick}")
+
+    def _mostrar_registros(self):
+        """Muestra las acciones que el ecosistema registró en el último paso"""
+        for registro in self.ecosistema.tomar_registros():
+            if registro.tipo in ('crecer', 'generar_frutos', 'absorber_agua'):
+                self.registrar_evento_planta(registro.origen, registro.tipo, registro.datos['detalles'])
+            elif registro.tipo == 'alimentarse_planta':
+                self.registrar_alimentacion_herbivoro(registro.origen, registro.destino,
+                                                      registro.datos['frutos'])
+            else:
+                self.registrar_accion(registro.origen.__class__.__name__, registro.tipo,
+                                      registro.datos.get('detalles', ''))
+
+        if self.ecosistema.mensaje_estado:
+            self.lbl_estado.setText(f"Estado: {self.ecosistema.mensaje_estado}")
+
+    def _actualizar_visualizacion(self):
+        """Actualiza los organismos en pantalla y las estadísticas"""
+        self._actualizar_area_visible()
 
         # Actualizar estadísticas
         self.mostrar_estadisticas()
@@ -962,58 +1498,57 @@ class EcosistemaGUI(QMainWindow):
         # Actualizar lista de animales y plantas
         self.actualizar_lista_animales_y_plantas()
 
-        # Verificar balance del ecosistema
-        self.verificar_balance_ecosistema(animales_vivos)
-
-        self.view.viewport().update()
+    def cambiar_velocidad(self, texto: str):
+        """Cambia la velocidad de la simulación (1×, 10×, 100× o máxima)"""
+        self.reloj.velocidad = self.VELOCIDADES[texto]
+        if self.proceso is not None:
+            self.proceso.cambiar_velocidad(self.VELOCIDADES[texto])
 
-    def agregar_herbivoros_adicionales(self, cantidad: int):
-        """Agrega nuevos herbívoros para mantener el equilibrio"""
-        for _ in range(cantidad):
-            pos_x = random.uniform(50, self.ANCHO_ECOSISTEMA - 50)
-            pos_y = random.uniform(50, self.ALTO_ECOSISTEMA - 50)
-
-            # Alternar entre conejos y ciervos
-            if random.random() < 0.5:
-                animal = Conejo("Conejo", 100, 4.0, (pos_x, pos_y))
-            else:
-                animal = Ciervo("Ciervo", 100, 3.0, (pos_x, pos_y))
-
-            self.ecosistema.agregar_entidad(animal, 'herbivoro')
-            item = AnimalGraphicsItem(animal, self.imagenes_animales[animal.__class__.__name__])
-            self.animal_items.append(item)
+    def cambiar_modo_vista(self, texto: str):
+        """Alterna entre ver los organismos y el mapa de densidad"""
+        self.modo_vista = texto
+        if self.ecosistema is not None:
+            self._actualizar_area_visible(mover=False)
 
     def registrar_alimentacion_herbivoro(self, herbivoro, planta, frutos_consumidos):
         """Registra cuando un herbívoro se alimenta de una planta"""
-        timestamp = QTime.currentTime().toString("HH:mm:ss")
-        mensaje = (f"[{timestamp}] 🍎 {herbivoro.__class__.__name__}: "
+        mensaje = (f"🍎 {herbivoro.__class__.__name__}: "
                    f"Consumió {frutos_consumidos} frutos de {planta.__class__.__name__}")
 
-        self.lista_acciones.insertItem(0, mensaje)
-
-        # Mantener un límite de acciones mostradas
-        while self.lista_acciones.count() > self.max_acciones:
-            self.lista_acciones.takeItem(self.lista_acciones.count() - 1)
-
-    def verificar_balance_ecosistema(self, conteo: dict):
-        """Verifica y mantiene el balance del ecosistema"""
-        # Si hay muy pocos herbívoros comparado con carnívoros
-        if (conteo['herbivoros'] < conteo['carnivoros'] * 2 and
-                conteo['herbivoros'] < 5):
-            # Agregar algunos herbívoros nuevos
-            self.agregar_herbivoros_adicionales(3)
-
-        # Si no quedan herbívoros, los carnívoros empiezan a perder energía más rápido
-        if conteo['herbivoros'] == 0:
-            for item in self.animal_items:
-                if isinstance(item.animal, (Leon, Aguila_real)):
-                    item.animal.nivel_energia = max(0, item.animal.nivel_energia - 1)
+        self.registro_acciones.agregar((time.time(), mensaje))
+
+    def guardar_estado(self):
+        """Guarda el estado del ecosistema sin bloquear la interfaz.
+
+        Solo la instantánea se toma en este thread; la escritura ocurre en
+        el thread escritor del gestor y su resultado llega por la señal
+        `guardado_terminado`.
+        """
+        if self.ecosistema is None:
+            return
+        if not self.gestor_estado.guardar_en_segundo_plano(self.ecosistema,
+                                                           self.guardado_terminado.emit):
+            self.lbl_estado.setText("Estado: Guardado omitido, hay otro en curso")
+
+    def _al_terminar_guardado(self, ruta, error):
+        """Muestra el resultado de un guardado en segundo plano"""
+        if error is not None:
+            self.lbl_estado.setText(f"Estado: Error al guardar: {str(error)}")
+        else:
+            self.lbl_estado.setText(f"Estado: Guardado en {os.path.basename(ruta)}")
 
     def reiniciar_simulacion(self):
         if self.timer:
             self.timer.stop()
+        if self.timer_autoguardado:
+            self.timer_autoguardado.stop()
         if self.ecosistema:
             self.ecosistema.detener_simulacion()
+            self.ecosistema = None
+        if self.proceso:
+            self.proceso.detener()
+            self.proceso = None
+            self.cuadro = None
 
         # Restablecer botones
         self.btn_inicio.setEnabled(True)
@@ -1024,46 +1559,30 @@ class EcosistemaGUI(QMainWindow):
 
         # Limpiar elementos
         self.lbl_estado.setText("Estado: Esperando inicio")
-        self.animal_items.clear()
-        self.planta_items.clear()
-        self.scene.clear()
-        self.lista_animales.clear()
-        self.lista_acciones.clear()
-
-    def verificar_alimentacion_plantas(self):
-        """Verifica si hay herbívoros que puedan alimentarse de plantas"""
-        for animal_item in self.animal_items:
-            if not animal_item.animal.estar_vivo or not isinstance(animal_item.animal, Herbivoro):
-                continue
-
-            # Si el animal tiene poca energía, buscar plantas
-            if animal_item.animal.nivel_energia < 30:
-                planta_cercana, distancia = animal_item.animal.buscar_planta_cercana(
-                    [p.planta for p in self.planta_items],
-                    animal_item.animal.ubicacion
-                )
-
-                if planta_cercana and distancia <= Herbivoro.DISTANCIA_ALIMENTACION:
-                    frutos_antes = getattr(planta_cercana, 'frutos', 0)
-                if animal_item.animal.alimentarse_de_planta(planta_cercana):
-                    frutos_consumidos = frutos_antes - getattr(planta_cercana, 'frutos', 0)
-                    self.registrar_alimentacion_herbivoro(
-                        animal_item.animal,
-                        planta_cercana,
-                        frutos_consumidos
-                    )
-
-                    # Actualizar estado
-                    self.lbl_estado.setText(
-                        f"Estado: {animal_item.animal.__class__.__name__} "
-                        f"consumió {frutos_consumidos} frutos de {planta_cercana.__class__.__name__}"
-                    )
+        for items in (self.animal_items, self.planta_items, self.cuadro_items):
+            for item in items.values():
+                item.quitar_de_escena()
+            items.clear()
+        self.capa_puntos.limpiar()
+        self.capa_agregados.limpiar()
+        self.capa_densidad.limpiar()
+        self.chk_proceso.setEnabled(True)
+        self.modelo_poblacion.limpiar()
+        self.registro_acciones.limpiar()
+        self._leidos_registro = 0
+        self.modelo_acciones.limpiar()
 
     def closeEvent(self, event):
         if self.ecosistema:
             self.ecosistema.detener_simulacion()
+        if self.proceso:
+            self.proceso.detener()
         if self.timer:
             self.timer.stop()
+        if self.timer_autoguardado:
+            self.timer_autoguardado.stop()
+        self.timer_registro.stop()
+        self.gestor_estado.esperar_guardados()
         event.accept()
 
 if __name__ == '__main__':
@@ -0,0 +1,100 @@
+import pytest
+
+from AlmacenMundo import AlmacenMundo
+from Animales.Herbivoros.Conejo import Conejo
+from Ecosistema import Ecosistema
+
+
+@pytest.fixture
+def ecosistema():
+    ecosistema = Ecosistema((1000, 1000))
+    ecosistema.pausar_simulacion()
+    yield ecosistema
+    ecosistema.detener_simulacion()
+
+
+def agregar_conejos(ecosistema, cantidad):
+    conejos = [Conejo("Conejo", 50 + i % 50, 4.0, (10.0 * i % 1000, 7.0 * i % 1000))
+               for i in range(cantidad)]
+    for conejo in conejos:
+        ecosistema.agregar_entidad(conejo, 'herbivoro')
+    return conejos
+
+
+def test_almacen_compactar_corre_filas_vivas_y_desvincula_muertas():
+    mundo = AlmacenMundo(capacidad=4)
+    conejos = [Conejo("Conejo", 50 + i, 4.0, (10.0 * i, 7.0 * i)) for i in range(10)]
+    for conejo in conejos:
+        mundo.agregar(conejo)
+    muertos = conejos[1::3]
+    for conejo in muertos:
+        conejo.estar_vivo = False
+    valores = [(c.ubicacion, c.nivel_energia, c.velocidad, c.direccion) for c in conejos]
+
+    remapeo = mundo.compactar()
+
+    vivos = [c for c in conejos if c not in muertos]
+    assert mundo.n == len(vivos)
+    assert mundo.entidades == vivos
+    assert remapeo.tolist() == [-1 if c in muertos else vivos.index(c) for c in conejos]
+    for conejo, (ubicacion, energia, velocidad, direccion) in zip(conejos, valores):
+        # Vivos y muertos conservan sus valores
+        assert conejo.ubicacion == ubicacion
+        assert conejo.nivel_energia == energia
+        assert conejo.velocidad == velocidad
+        assert conejo.direccion == direccion
+    for conejo in vivos:
+        assert mundo.entidades[conejo._indice] is conejo
+    for conejo in muertos:
+        assert conejo._mundo is None and not conejo.estar_vivo
+
+    # Una fila liberada puede ocuparla otro organismo
+    nuevo = Conejo("Conejo", 99, 4.0, (1.0, 2.0))
+    assert mundo.agregar(nuevo) == len(vivos)
+    assert muertos[0].ubicacion == valores[1][0]
+
+
+def test_compactar_libera_filas_y_tareas_de_muertos(ecosistema):
+    conejos = agregar_conejos(ecosistema, 10)
+    muertos = conejos[1::3]
+    valores = [(c.ubicacion, c.nivel_energia, c.velocidad) for c in conejos]
+    for conejo in muertos:
+        conejo.estar_vivo = False
+
+    remapeo = ecosistema.compactar()
+
+    vivos = [c for c in conejos if c not in muertos]
+    assert ecosistema.mundo.n == len(vivos)
+    assert ecosistema.mundo.entidades == vivos
+    assert len(ecosistema._categorias) == len(vivos)
+    assert [thread.animal for thread in ecosistema.threads] == vivos
+    assert ecosistema.planificador.pendientes() == len(vivos)
+    assert remapeo.tolist() == [-1 if c in muertos else vivos.index(c) for c in conejos]
+    for conejo, (ubicacion, energia, velocidad) in zip(conejos, valores):
+        # Vivos y muertos conservan sus valores
+        assert conejo.ubicacion == ubicacion
+        assert conejo.nivel_energia == energia
+        assert conejo.velocidad == velocidad
+    for conejo in vivos:
+        assert ecosistema.mundo.entidades[conejo._indice] is conejo
+    for conejo in muertos:
+        assert conejo._mundo is None and not conejo.estar_vivo
+
+
+def test_step_compacta_cuando_muere_la_mitad(ecosistema):
+    conejos = agregar_conejos(ecosistema, 4 * Ecosistema.MIN_FILAS_COMPACTACION)
+    for conejo in conejos[::2]:
+        conejo.estar_vivo = False
+    ecosistema.step()
+    assert ecosistema.mundo.n == len(ecosistema.animales_vivos())
+    assert len(ecosistema.threads) == ecosistema.mundo.n
+
+
+def test_no_compacta_con_diario_abierto(ecosistema, tmp_path):
+    conejos = agregar_conejos(ecosistema, 4 * Ecosistema.MIN_FILAS_COMPACTACION)
+    ecosistema.iniciar_diario(str(tmp_path / 'diario.bin'))
+    for conejo in conejos[::2]:
+        conejo.estar_vivo = False
+    ecosistema.step()
+    assert ecosistema.mundo.n >= len(conejos)
+    ecosistema.detener_diario()
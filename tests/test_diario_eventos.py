@@ -0,0 +1,102 @@
+import random
+
+import pytest
+
+from Animales.Carnivoros.Leon import Leon
+from Animales.Herbivoros.Conejo import Conejo
+from DiarioEventos import DiarioEventos, LectorDiario
+from Ecosistema import Ecosistema
+from Plantas.Florales.Rosal import Rosal
+from Plantas.Frutales.Manzano import Manzano
+
+TICKS = 59
+INTERVALO = 10
+
+
+def describir(estado):
+    """Atributos de cada organismo de un estado, por categoría y especie."""
+    return {categoria: {especie: [organismo.__getstate__() for organismo in organismos]
+                        for especie, organismos in especies.items()}
+            for categoria, especies in estado['entidades'].items()}
+
+
+@pytest.fixture
+def simulacion(tmp_path):
+    """Simula TICKS ticks con un diario abierto.
+
+    Returns:
+        tuple: Ruta del diario y, por tick, el estado capturado del ecosistema.
+    """
+    random.seed(11)
+    ecosistema = Ecosistema((120, 120))
+    ecosistema.pausar_simulacion()
+    for i in range(60):
+        posicion = (random.uniform(0, 120), random.uniform(0, 120))
+        resto = i % 6
+        if resto == 0:
+            ecosistema.agregar_entidad(Leon("Leon", 60, 2.0, posicion), 'carnivoro')
+        elif resto < 3:
+            ecosistema.agregar_entidad(Conejo("Conejo", 60, 4.0, posicion), 'herbivoro')
+        elif resto < 5:
+            ecosistema.agregar_entidad(Manzano(1.0, 0, posicion, 100, 100), 'frutal')
+        else:
+            ecosistema.agregar_entidad(Rosal(0.5, 0, posicion, 100, 100), 'floral')
+
+    ruta = str(tmp_path / 'diario.eco')
+    ecosistema.iniciar_diario(ruta, intervalo_fotogramas=INTERVALO)
+    estados = {0: ecosistema.exportar_estado()}
+    for _ in range(TICKS):
+        # Muertes y nacimientos entre fotogramas, registrados en el tick siguiente
+        if ecosistema.tick % 7 == 3:
+            conejo = next(c for c in ecosistema.herbivoros['Conejo'] if c.estar_vivo)
+            conejo.estar_vivo = False
+            ecosistema.agregar_entidad(Conejo("Conejo", 60, 4.0, (60.0, 60.0)), 'herbivoro')
+        ecosistema.step()
+        estados[ecosistema.tick] = ecosistema.exportar_estado()
+    ecosistema.detener_diario()
+    ecosistema.detener_simulacion()
+    return ruta, estados
+
+
+def test_reconstruir_coincide_con_el_estado_en_cada_tick(simulacion):
+    ruta, estados = simulacion
+    lector = LectorDiario(ruta)
+    assert lector.ultimo_tick == TICKS
+    assert [tick for tick, _ in lector.fotogramas] == list(range(0, TICKS + 1, INTERVALO))
+
+    for tick in range(1, TICKS + 1):
+        reconstruido = lector.reconstruir(tick).a_estado()
+        assert reconstruido['tick'] == tick
+        assert reconstruido['recursos'] == estados[tick]['recursos']
+        assert describir(reconstruido) == describir(estados[tick]), f"tick {tick}"
+
+    # Los conejos muertos dejan de estar y los nuevos aparecen
+    assert len(estados[TICKS]['entidades']['herbivoro']['Conejo']) == 20
+    assert {evento['tipo'] for evento in lector.eventos(0, 10)} >= {'crecer', 'absorber_agua'}
+
+
+def test_descarta_el_registro_final_cortado(simulacion):
+    ruta, estados = simulacion
+    with open(ruta, 'rb') as archivo:
+        datos = archivo.read()
+    posiciones = [posicion for posicion, _, _ in LectorDiario(ruta)._registros()]
+    # Cortar el último registro por la mitad, como una caída durante la escritura
+    with open(ruta, 'wb') as archivo:
+        archivo.write(datos[:(posiciones[-1] + len(datos)) // 2])
+
+    lector = LectorDiario(ruta)
+    assert lector.ultimo_tick in (TICKS - 1, TICKS)
+    ultimo = lector.reconstruir().a_estado()
+    assert describir(ultimo) == describir(estados[lector.ultimo_tick])
+    with pytest.raises(ValueError):
+        lector.reconstruir(lector.ultimo_tick + 1)
+
+
+def test_rechaza_archivos_que_no_son_diarios(tmp_path):
+    ruta = str(tmp_path / 'otro.eco')
+    with open(ruta, 'wb') as archivo:
+        archivo.write(b'NOESECO!' + bytes(16))
+    with pytest.raises(ValueError):
+        LectorDiario(ruta)
+    with pytest.raises(ValueError):
+        DiarioEventos(ruta, intervalo_fotogramas=0)
@@ -0,0 +1,117 @@
+import numpy as np
+import pytest
+
+from Animales.Carnivoros.Leon import Leon
+from Animales.Herbivoros.Conejo import Conejo
+from Ecosistema import Ecosistema
+from EstadoColumnar import EstadoColumnar
+from Plantas.Florales.Rosal import Rosal
+from Plantas.Frutales.Manzano import Manzano
+
+
+def describir(estado):
+    """Atributos de cada organismo de un estado, por categoría y especie."""
+    return {categoria: {especie: [organismo.__getstate__() for organismo in organismos]
+                        for especie, organismos in especies.items()}
+            for categoria, especies in estado['entidades'].items()}
+
+
+@pytest.fixture
+def estado():
+    ecosistema = Ecosistema((1000, 600))
+    ecosistema.pausar_simulacion()
+    for i in range(40):
+        posicion = (25.0 * i % 1000, 17.0 * i % 600)
+        resto = i % 4
+        if resto == 0:
+            ecosistema.agregar_entidad(Leon("Leon", 50 + i, 2.0, posicion), 'carnivoro')
+        elif resto == 1:
+            ecosistema.agregar_entidad(Conejo("Conejo", 50 + i, 4.0, posicion), 'herbivoro')
+        elif resto == 2:
+            ecosistema.agregar_entidad(Manzano(1.0, i, posicion, 100, 100), 'frutal')
+        else:
+            ecosistema.agregar_entidad(Rosal(0.5, i, posicion, 100, 100), 'floral')
+    ecosistema.step(3)
+    estado = ecosistema.exportar_estado()
+    ecosistema.detener_simulacion()
+    return estado
+
+
+@pytest.fixture
+def columnar(estado, tmp_path):
+    ruta = str(tmp_path / 'estado.eco')
+    assert EstadoColumnar.escribir(ruta, estado) > 0
+    columnar = EstadoColumnar(ruta)
+    yield columnar
+    columnar.cerrar()
+
+
+def test_cabecera_y_columnas(estado, columnar):
+    total = sum(len(organismos) for especies in estado['entidades'].values()
+                for organismos in especies.values())
+    assert len(columnar) == columnar.filas == total
+    assert columnar.tamano == tuple(estado['tamano'])
+    assert columnar.tick == estado['tick']
+    assert set(columnar.columnas) == set(EstadoColumnar.COLUMNAS)
+    for nombre, tipo in EstadoColumnar.COLUMNAS.items():
+        assert columnar[nombre].dtype == np.dtype(tipo)
+        assert len(columnar[nombre]) == total
+
+    cabecera = EstadoColumnar.leer_cabecera(columnar.ruta)
+    assert cabecera['filas'] == total
+    assert cabecera['especies'] == columnar.especies
+
+
+def test_filas_de_especie_son_contiguas(estado, columnar):
+    siguiente = 0
+    for codigo, especie in enumerate(columnar.especies):
+        filas = columnar.filas_de_especie(codigo)
+        assert filas.start == siguiente
+        assert np.all(columnar['especie'][filas] == codigo)
+        assert especie['cantidad'] == len(estado['entidades'][especie['categoria']][especie['clase']])
+        siguiente = filas.stop
+    assert siguiente == columnar.filas
+
+
+def test_bloques_cubren_todas_las_filas(columnar):
+    tamano_region = 250
+    bloques = columnar.bloques(tamano_region)
+    filas = np.concatenate([bloque['filas'] for bloque in bloques])
+    assert sorted(filas.tolist()) == list(range(columnar.filas))
+    for bloque in bloques:
+        assert bloque['cantidad'] == len(bloque['filas'])
+        rx, ry = bloque['region']
+        assert np.all(columnar['x'][bloque['filas']] // tamano_region == rx)
+        assert np.all(columnar['y'][bloque['filas']] // tamano_region == ry)
+
+
+def test_a_estado_reconstruye_los_organismos(estado, columnar):
+    cargado = columnar.a_estado()
+    assert cargado['tamano'] == tuple(estado['tamano'])
+    assert cargado['tick'] == estado['tick']
+    assert describir(cargado) == describir(estado)
+
+    filas = columnar.filas_de_especie(0)
+    parcial = columnar.a_estado(np.arange(filas.start, filas.stop))
+    especie = columnar.especies[0]
+    assert describir(parcial) == {especie['categoria']: {
+        especie['clase']: describir(estado)[especie['categoria']][especie['clase']]}}
+
+
+def test_rechaza_archivos_que_no_son_columnares(tmp_path):
+    ruta = str(tmp_path / 'otro.eco')
+    with open(ruta, 'wb') as archivo:
+        archivo.write(b'NOESECO!' + bytes(64))
+    with pytest.raises(ValueError):
+        EstadoColumnar(ruta)
+    with pytest.raises(ValueError):
+        EstadoColumnar.leer_cabecera(ruta)
+
+
+def test_cerrar_libera_las_columnas(estado, tmp_path):
+    ruta = str(tmp_path / 'estado.eco')
+    EstadoColumnar.escribir(ruta, estado)
+    columnar = EstadoColumnar(ruta)
+    columnar.cerrar()
+    assert columnar.columnas == {}
+    assert columnar._mapa.closed
@@ -0,0 +1,104 @@
+import random
+
+import pytest
+
+from Animales.Carnivoros.Leon import Leon
+from Animales.Herbivoros.Conejo import Conejo
+from Ecosistema import Ecosistema
+from EstadoParcial import EstadoParcial
+from GestorEstado import GestorEstado
+from Plantas.Florales.Rosal import Rosal
+from Plantas.Frutales.Manzano import Manzano
+
+TAMANO_REGION = 100
+
+
+def describir(entidades, region=None, especies=None):
+    """Atributos de los organismos por categoría y especie, ordenados por
+    ubicación, filtrados como `EstadoParcial.cargar()`."""
+    resultado = {}
+    for categoria, por_especie in entidades.items():
+        for especie, organismos in por_especie.items():
+            if especies is not None and especie not in especies and categoria not in especies:
+                continue
+            if region is not None:
+                x_min, y_min, x_max, y_max = region
+                organismos = [organismo for organismo in organismos
+                              if x_min <= organismo.ubicacion[0] < x_max
+                              and y_min <= organismo.ubicacion[1] < y_max]
+            if organismos:
+                resultado.setdefault(categoria, {})[especie] = sorted(
+                    (organismo.__getstate__() for organismo in organismos),
+                    key=lambda atributos: atributos['_ubicacion'])
+    return resultado
+
+
+@pytest.fixture
+def estado():
+    random.seed(5)
+    ecosistema = Ecosistema((500, 300))
+    ecosistema.pausar_simulacion()
+    for i in range(200):
+        posicion = (random.uniform(0, 500), random.uniform(0, 300))
+        resto = i % 4
+        if resto == 0:
+            ecosistema.agregar_entidad(Leon("Leon", 50 + i % 50, 2.0, posicion), 'carnivoro')
+        elif resto == 1:
+            ecosistema.agregar_entidad(Conejo("Conejo", 50 + i % 50, 4.0, posicion), 'herbivoro')
+        elif resto == 2:
+            ecosistema.agregar_entidad(Manzano(1.0, i, posicion, 100, 100), 'frutal')
+        else:
+            ecosistema.agregar_entidad(Rosal(0.5, i, posicion, 100, 100), 'floral')
+    estado = ecosistema.exportar_estado()
+    ecosistema.detener_simulacion()
+    return estado
+
+
+@pytest.fixture(params=GestorEstado.FORMATOS)
+def guardado(request, estado, tmp_path):
+    gestor = GestorEstado(str(tmp_path), formato=request.param, tamano_region=TAMANO_REGION)
+    return gestor, gestor.guardar_estado(estado)
+
+
+@pytest.mark.parametrize('region, especies', [
+    ((120, 50, 330, 260), None),
+    (None, ['Leon', 'floral']),
+    ((0, 0, 250, 150), ['Conejo']),
+    ((500, 300, 600, 400), None),
+])
+def test_cargar_construye_solo_lo_pedido(estado, guardado, region, especies):
+    gestor, ruta = guardado
+    parcial = gestor.cargar_estado(ruta, region=region, especies=especies)
+    assert isinstance(parcial, EstadoParcial)
+    assert len(parcial) == 200
+    assert describir(parcial.entidades) == describir(estado['entidades'], region, especies)
+
+    # Solo se leyeron los bloques de las especies pedidas que cruzan la región
+    for i in parcial._leidos:
+        bloque = parcial._bloques[i]
+        assert parcial._cruce(bloque, region) > 0
+        assert especies is None or bloque['especie'] in especies or bloque['categoria'] in especies
+
+
+def test_cargar_lee_cada_bloque_una_sola_vez(estado, guardado):
+    gestor, ruta = guardado
+    parcial = gestor.cargar_estado(ruta, region=(0, 0, 200, 200))
+    iniciales = {id(parcial._bloques[i]) for i in parcial._leidos}
+    assert iniciales
+    leidos = []
+    leer = parcial._leer
+    parcial._leer = lambda bloque: leidos.append(bloque) or leer(bloque)
+
+    region = (150, 100, 400, 300)
+    assert describir(parcial.cargar(region)) == describir(estado['entidades'], region)
+    assert describir(parcial.cargar(region)) == describir(estado['entidades'], region)
+    completo = parcial.a_estado()
+    assert describir(completo['entidades']) == describir(estado['entidades'])
+    assert completo['tamano'] == tuple(estado['tamano'])
+    assert completo['tick'] == estado['tick']
+
+    # Ningún bloque se lee dos veces ni se vuelven a leer los del primer rectángulo
+    identificadores = [id(bloque) for bloque in leidos]
+    assert len(identificadores) == len(set(identificadores))
+    assert iniciales.isdisjoint(identificadores)
+    assert len(parcial._leidos) == len(parcial._bloques)
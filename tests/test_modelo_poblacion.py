@@ -0,0 +1,58 @@
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'interfaces'))
+
+from PyQt6.QtTest import QAbstractItemModelTester
+from PyQt6.QtWidgets import QApplication
+
+from Animales.Carnivoros.Leon import Leon
+from Animales.Herbivoros.Conejo import Conejo
+from Plantas.Frutales.Manzano import Manzano
+from ventana import ModeloPoblacion
+
+
+@pytest.fixture(scope='module')
+def aplicacion():
+    return QApplication.instance() or QApplication([])
+
+
+def filas_de_conejos(modelo):
+    """Texto de las filas hijas de la especie Conejo."""
+    for fila in range(modelo.rowCount()):
+        padre = modelo.index(fila, 0)
+        if modelo.data(padre).startswith('Conejos'):
+            return [modelo.data(modelo.index(hija, 0, padre)) for hija in range(modelo.rowCount(padre))]
+    return []
+
+
+def test_quitar_muertos_no_cambia_el_texto_de_las_filas_siguientes(aplicacion):
+    modelo = ModeloPoblacion()
+    tester = QAbstractItemModelTester(modelo, QAbstractItemModelTester.FailureReportingMode.Fatal)
+    leones = [Leon("Leon", 80, 2.0, (10.0 * i, 5.0)) for i in range(5)]
+    conejos = [Conejo("Conejo", 60, 4.0, (10.0 * i, 20.0)) for i in range(30)]
+    manzanos = [Manzano(1.0, 0, (10.0 * i, 40.0), 100, 100) for i in range(4)]
+    modelo.actualizar(leones + conejos, manzanos)
+
+    avisadas = []
+    modelo.dataChanged.connect(lambda primera, ultima, roles: avisadas.append(
+        (modelo.parent(primera).isValid(), primera.row(), ultima.row())))
+
+    # Muere uno de cada tres conejos a partir del medio de la lista
+    vivos = [conejo for i, conejo in enumerate(conejos) if i < 15 or i % 3 != 0]
+    modelo.actualizar(leones + vivos, manzanos)
+
+    assert filas_de_conejos(modelo) == [
+        f"Conejo {i + 1} - Energía: 60.0%" for i in range(30) if i < 15 or i % 3 != 0]
+    # Solo cambió el resumen de la especie, ninguna fila de organismo
+    assert avisadas == [(False, 1, 1)]
+
+    # Los nacidos reciben números nuevos, sin repetir los de los muertos
+    crias = [Conejo("Conejo", 60, 4.0, (5.0, 5.0)) for _ in range(2)]
+    modelo.actualizar(leones + vivos + crias, manzanos)
+    assert filas_de_conejos(modelo)[-2:] == ["Conejo 31 - Energía: 60.0%",
+                                             "Conejo 32 - Energía: 60.0%"]
+    del tester
@@ -0,0 +1,55 @@
+import random
+
+import numpy as np
+import pytest
+
+from RasterPlantas import RasterPlantas
+
+
+class PlantaFija:
+    """Planta mínima para la tabla: solo tiene ubicación."""
+
+    def __init__(self, ubicacion):
+        self.ubicacion = ubicacion
+
+
+def verificar_contra_fuerza_bruta(raster):
+    """Cada celda debe tener como dueña una candidata a distancia mínima de su centro."""
+    if not raster.candidatas:
+        assert all(dueno is None for dueno in raster._dueno)
+        return
+    celdas = np.arange(raster.columnas * raster.filas)
+    centros = np.column_stack(((celdas % raster.columnas + 0.5) * raster.tamano_celda,
+                               (celdas // raster.columnas + 0.5) * raster.tamano_celda))
+    candidatas = list(raster.candidatas)
+    posiciones = np.array([planta.ubicacion for planta in candidatas])
+    distancias = np.sqrt(((centros[:, None, :] - posiciones[None, :, :]) ** 2).sum(axis=2))
+    numero = {planta: k for k, planta in enumerate(candidatas)}
+    duenos = np.array([numero[dueno] for dueno in raster._dueno])
+    np.testing.assert_allclose(distancias[celdas, duenos], distancias.min(axis=1), rtol=0, atol=1e-9)
+    for planta, celdas_planta in raster._celdas_de.items():
+        assert np.all(duenos[list(celdas_planta)] == numero[planta])
+
+
+@pytest.mark.parametrize('semilla', range(20))
+def test_agregar_y_quitar_coinciden_con_la_mas_cercana(semilla):
+    rng = random.Random(semilla)
+    raster = RasterPlantas((300, 300))
+    plantas = [PlantaFija((rng.uniform(0, 300), rng.uniform(0, 300))) for _ in range(60)]
+
+    for planta in plantas:
+        raster.agregar(planta)
+        verificar_contra_fuerza_bruta(raster)
+
+    for _ in range(60):
+        planta = rng.choice(plantas)
+        if planta in raster.candidatas:
+            raster.quitar(planta)
+        else:
+            raster.agregar(planta)
+        verificar_contra_fuerza_bruta(raster)
+
+    for planta in plantas:
+        raster.quitar(planta)
+    verificar_contra_fuerza_bruta(raster)
+    assert raster.planta_cercana((150, 150)) == (None, float('inf'))
@@ -0,0 +1,112 @@
+import random
+
+import numpy as np
+import pytest
+
+from Animales.Animal import Animal
+from Animales.Carnivoros.Leon import Leon
+from Animales.Herbivoros.Conejo import Conejo
+from Animales.Herbivoros.Herbivoro import Herbivoro
+from Ecosistema import Ecosistema
+from ParticionEspacial import ParticionEspacial
+from RegionSimulacion import RegionSimulacion
+
+
+@pytest.fixture
+def regiones():
+    particion = ParticionEspacial((400, 400), 2, 1, 100)
+    ecosistemas = [Ecosistema((400, 400)) for _ in range(len(particion))]
+    for ecosistema in ecosistemas:
+        ecosistema.pausar_simulacion()
+    yield [RegionSimulacion(region, particion, ecosistema)
+           for region, ecosistema in enumerate(ecosistemas)]
+    for ecosistema in ecosistemas:
+        ecosistema.detener_simulacion()
+
+
+def intercambiar(regiones):
+    mensajes = [region.mensajes() for region in regiones]
+    for region in regiones:
+        region.recibir({vecina: mensajes[vecina][region.region] for vecina in region.vecinas})
+
+
+def test_migracion_constante_no_acumula_filas(regiones):
+    random.seed(0)
+    particion = regiones[0].particion
+    for i in range(120):
+        ubicacion = (random.uniform(0, 400), random.uniform(0, 400))
+        region = int(particion.region_de(*ubicacion))
+        regiones[region].ecosistema.agregar_entidad(Conejo("Conejo", 100, 4.0, ubicacion), 'herbivoro')
+    intercambiar(regiones)
+
+    migrantes = 0
+    for _ in range(1000):
+        for region in regiones:
+            region.ecosistema.step()
+        intercambiar(regiones)
+        migrantes += sum(region.estadisticas['migrantes_enviados'] for region in regiones)
+
+        for region in regiones:
+            ecosistema = region.ecosistema
+            mundo = ecosistema.mundo
+            vivos = int(np.count_nonzero(mundo.vivo[:mundo.n]))
+            assert mundo.n <= 2 * vivos + 2 * Ecosistema.MIN_FILAS_COMPACTACION
+            assert len(mundo.entidades) == mundo.n
+            assert len(ecosistema.threads) <= mundo.n
+    # Sin liberar filas, el mundo crecería una por migrante
+    assert migrantes > 4 * Ecosistema.MIN_FILAS_COMPACTACION
+
+
+@pytest.mark.parametrize('muertos_antes', [0, 2 * Ecosistema.MIN_FILAS_COMPACTACION])
+def test_efectos_sobre_fantasma_se_aplican_al_original(regiones, muertos_antes):
+    dueno = regiones[1].ecosistema
+    # Filas anteriores al original que se liberan entre el halo y los efectos
+    muertos = [Conejo("Conejo", 100, 0.0, (350.0, 10.0 + i)) for i in range(muertos_antes)]
+    for conejo in muertos:
+        dueno.agregar_entidad(conejo, 'herbivoro')
+    original = Conejo("Conejo", 100, 0.0, (220.0, 200.0))
+    dueno.agregar_entidad(original, 'herbivoro')
+    original.nivel_energia = 80
+    original.tiempo_reproduccion = 40
+    intercambiar(regiones)
+
+    fantasma, = regiones[0].ecosistema._fantasmas
+    for conejo in muertos:
+        conejo.estar_vivo = False
+    fantasma.nivel_energia -= 25
+    fantasma.tiempo_reproduccion = 0
+    fantasma.estar_vivo = False
+    intercambiar(regiones)
+
+    assert dueno.mundo.n == 1
+    assert original.nivel_energia == 55
+    assert original.tiempo_reproduccion == 0
+    assert not original.estar_vivo
+    assert regiones[1].estadisticas['efectos_aplicados'] == 1
+
+
+class Liebre(Animal, Herbivoro):
+    """Presa de prueba: las especies del repositorio no derivan de Herbivoro."""
+
+    __slots__ = ()
+
+    def huir(self):
+        pass
+
+
+def test_caza_a_traves_del_borde_mata_al_original(regiones):
+    random.seed(2)
+    leon = Leon("Leon", 100, 0.0, (190.0, 200.0))
+    liebre = Liebre("Liebre", 100, 0.0, (215.0, 200.0))
+    regiones[0].ecosistema.agregar_entidad(leon, 'carnivoro')
+    regiones[1].ecosistema.agregar_entidad(liebre, 'herbivoro')
+    intercambiar(regiones)
+
+    for _ in range(10):
+        for region in regiones:
+            region.ecosistema.step()
+        intercambiar(regiones)
+        if not liebre.estar_vivo:
+            break
+    assert not liebre.estar_vivo
+    assert liebre not in regiones[1].ecosistema.animales_vivos()